@@ -352,7 +352,7 @@ def status(ctx: click.Context) -> None:
 
     try:
         auth_manager = AuthManager()
-        oauth_storage = OAuthStorage()
+        oauth_storage = OAuthStorage(auth_manager)
 
         # Check both Basic Auth and OAuth
         has_basic_auth = auth_manager.has_credentials()
@@ -5,12 +5,18 @@ This module provides commands for creating and managing Bitbucket repositories,
 including user management and listing repositories.
 """
 
+import builtins
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlparse
 
 import click
-from rich.table import Table
+import requests
 
-from bbcli.core.api_client import get_api_client
+from bbcli.core.api_client import BitbucketAPIClient, get_api_client
 from bbcli.core.exceptions import BBCLIError
 from bbcli.utils.output import OutputFormatter
 from bbcli.utils.validation import (
@@ -22,6 +28,103 @@ from bbcli.utils.validation import (
     validate_workspace_slug,
 )
 
+# Repository listing order: most recently updated first
+_REPO_LIST_SORT = "-updated_on"
+
+# Upper bound on listing pages requested at the same time
+_MAX_PAGE_WORKERS = 8
+
+# Text table cells, in column order, picked from each formatted repository
+_TABLE_ROW = itemgetter("name", "project_key", "description", "updated_on", "is_private")
+
+
+def _build_list_params(project: str | None, query: str | None) -> dict[str, Any]:
+    """
+    Build the query parameters for listing repositories.
+
+    Args:
+        project: Validated project key to filter by, if any
+        query: Validated name search text, if any
+
+    Returns:
+        Parameters with the combined ``q`` filter (when any) and the sort order
+    """
+    if project and query:
+        return {"q": f'project.key="{project}" AND name~"{query}"', "sort": _REPO_LIST_SORT}
+    if project:
+        return {"q": f'project.key="{project}"', "sort": _REPO_LIST_SORT}
+    if query:
+        return {"q": f'name~"{query}"', "sort": _REPO_LIST_SORT}
+    return {"sort": _REPO_LIST_SORT}
+
+
+def _next_page_path(next_page_url: str) -> str:
+    """
+    Convert a pagination ``next`` link into a path relative to the API base URL.
+
+    Args:
+        next_page_url: Absolute URL of the next page
+
+    Returns:
+        Path and query string of the next page
+    """
+    parsed_url = urlparse(next_page_url)
+    return parsed_url.path + ("?" + parsed_url.query if parsed_url.query else "")
+
+
+def _fetch_repositories(api_client: BitbucketAPIClient, url: str, params: dict[str, Any]) -> builtins.list[dict[str, Any]]:
+    """
+    Fetch every page of a repository listing.
+
+    Credentials are resolved once, up front, and sent with every page, so the master
+    password is asked for at most once. When the first page's ``size`` and ``pagelen``
+    report more than one page, the remaining pages are requested concurrently by page
+    number, each worker on its own session; otherwise the ``next`` links are followed in order.
+
+    Args:
+        api_client: Client used for the requests
+        url: Listing endpoint
+        params: Query parameters for the listing
+
+    Returns:
+        Repositories from all pages, in page order
+    """
+    auth_header = api_client.get_auth_header()
+    headers = {"Authorization": auth_header} if auth_header else None
+
+    response = api_client.get(url, params=params, headers=headers)
+    repositories = [*response.get("values", [])]
+
+    size = response.get("size")
+    pagelen = response.get("pagelen")
+    # Bitbucket's size is approximate, so a next link can follow a page that claims to hold everything
+    page_count = -(-size // pagelen) if size and pagelen else 0
+    if headers and response.get("next") and response.get("page") == 1 and page_count > 1:
+        worker_state = threading.local()
+        sessions: builtins.list[requests.Session] = []
+
+        def fetch_page(page: int) -> dict[str, Any]:
+            session = getattr(worker_state, "session", None)
+            if session is None:
+                session = worker_state.session = api_client.create_session()
+                sessions.append(session)
+            return api_client.get(url, params={**params, "page": page}, headers=headers, session=session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, page_count - 1)) as executor:
+                for page in executor.map(fetch_page, range(2, page_count + 1)):
+                    repositories.extend(page.get("values", []))
+        finally:
+            for session in sessions:
+                session.close()
+        return repositories
+
+    # Follow the cursor; subsequent pages carry their params in the URL
+    while next_page_url := response.get("next"):
+        response = api_client.get(_next_page_path(next_page_url), params=None, headers=headers)
+        repositories.extend(response.get("values", []))
+    return repositories
+
 
 @click.group()
 def repo() -> None:
@@ -189,45 +292,10 @@ def list(
         formatter.info(f"Fetching repositories from workspace '{workspace}'...")
 
         # Build query parameters
-        initial_params: dict[str, Any] = {}
-
-        # Add project filter if specified
-        if project:
-            initial_params["q"] = f'project.key="{project}"'
-
-        # Add name query filter if specified
-        if query:
-            name_filter = f'name~"{query}"'
-            if "q" in initial_params:
-                initial_params["q"] += f" AND {name_filter}"
-            else:
-                initial_params["q"] = name_filter
-
-        # Sort by updated date (most recent first)
-        initial_params["sort"] = "-updated_on"
+        initial_params = _build_list_params(project, query)
 
         # Fetch repositories with pagination
-        repositories = []
-        page_url: str | None = f"/repositories/{workspace}"
-        current_params: dict[str, Any] | None = initial_params
-
-        while page_url:
-            response = api_client.get(page_url, params=current_params)
-
-            # Add repositories from this page
-            repositories.extend(response.get("values", []))
-
-            # Get next page URL
-            next_page_url = response.get("next")
-            if next_page_url:
-                # Extract relative path from full URL
-                from urllib.parse import urlparse
-
-                parsed_url = urlparse(next_page_url)
-                page_url = parsed_url.path + ("?" + parsed_url.query if parsed_url.query else "")
-                current_params = None  # Don't pass params for subsequent pages as they're in the URL
-            else:
-                page_url = None
+        repositories = _fetch_repositories(api_client, f"/repositories/{workspace}", initial_params)
 
         if not repositories:
             if project and query:
@@ -248,8 +316,6 @@ def list(
             if updated_on:
                 try:
                     # Parse ISO format date and format it nicely
-                    from datetime import datetime
-
                     dt = datetime.fromisoformat(updated_on.replace("Z", "+00:00"))
                     updated_on = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
                 except (ValueError, AttributeError):
@@ -276,6 +342,8 @@ def list(
         # Display results
         if formatter.format_type == "text":
             # Create rich table for text output
+            from rich.table import Table
+
             table = Table(title=f"Repositories in {workspace}")
             table.add_column("Name", style="cyan", no_wrap=True)
             table.add_column("Project", style="green")
@@ -284,13 +352,7 @@ def list(
             table.add_column("Visibility", style="magenta")
 
             for repo in repo_data:
-                table.add_row(
-                    repo["name"],
-                    repo["project_key"],
-                    repo["description"],
-                    repo["updated_on"],
-                    repo["is_private"],
-                )
+                table.add_row(*_TABLE_ROW(repo))
 
             formatter.console.print(table)
             formatter.console.print(f"\n[green]Found {len(repositories)} repositories[/green]")
@@ -44,7 +44,7 @@ class BitbucketAPIClient:
         """
         self.config = get_config()
         self.auth_manager = AuthManager()
-        self.oauth_storage = OAuthStorage()
+        self.oauth_storage = OAuthStorage(self.auth_manager)
         self.base_url = base_url or self.config.get("api.base_url", "https://api.bitbucket.org/2.0")
         self.timeout = self.config.get("api.timeout", 30)
         self.max_retries = self.config.get("api.max_retries", 3)
@@ -56,7 +56,22 @@ class BitbucketAPIClient:
         self._prefer_oauth = prefer_oauth
 
         # Set up session with retry strategy
-        self.session = requests.Session()
+        self.session = self.create_session()
+
+        # Set up authentication
+        self._setup_auth()
+
+    def create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with this client's retry strategy.
+
+        requests.Session is not safe to share between threads, so callers that
+        issue requests concurrently create one session per worker with this.
+
+        Returns:
+            A new session with retrying adapters mounted
+        """
+        session = requests.Session()
         retry_strategy = Retry(
             total=self.max_retries,
             status_forcelist=[429, 500, 502, 503, 504],
@@ -64,11 +79,9 @@ class BitbucketAPIClient:
             backoff_factor=1,
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Set up authentication
-        self._setup_auth()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _get_credentials(self) -> tuple[str, str] | None:
         """
@@ -218,6 +231,7 @@ class BitbucketAPIClient:
         data: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        session: requests.Session | None = None,
     ) -> requests.Response:
         """
         Make an HTTP request to the Bitbucket API.
@@ -228,7 +242,9 @@ class BitbucketAPIClient:
             params: Query parameters
             data: Form data
             json_data: JSON data
-            headers: Additional headers
+            headers: Additional headers. An ``Authorization`` header here is used as
+                     is, without looking up credentials (which may prompt).
+            session: Session to send the request on. Defaults to the client's session.
 
         Returns:
             Response object
@@ -246,8 +262,11 @@ class BitbucketAPIClient:
         }
 
         # Add authentication header (OAuth Bearer token preferred over Basic Auth)
-        oauth_token = self._get_oauth_token()
-        if oauth_token and self._prefer_oauth:
+        explicit_auth = headers is not None and "Authorization" in headers
+        if explicit_auth:
+            # The caller resolved the credentials already
+            pass
+        elif (oauth_token := self._get_oauth_token()) and self._prefer_oauth:
             # Use OAuth 2.0 Bearer token
             request_headers["Authorization"] = f"Bearer {oauth_token}"
         else:
@@ -261,7 +280,7 @@ class BitbucketAPIClient:
         if headers:
             request_headers.update(headers)
         try:
-            response = self.session.request(
+            response = (session or self.session).request(
                 method=method,
                 url=url,
                 params=params,
@@ -273,9 +292,11 @@ class BitbucketAPIClient:
 
             # Handle authentication errors
             if response.status_code == 401:
-                # Provide more specific error messages based on credential source
-                credentials = self._get_credentials()
-                if not credentials:
+                # Provide more specific error messages based on credential source; a caller-supplied
+                # header means credentials were found, and looking them up again could prompt for
+                # the master password
+                has_credentials = explicit_auth or self._get_credentials() is not None
+                if not has_credentials:
                     error_msg = "No authentication credentials found."
                     suggestion = "Run 'bbcli auth login' to set up authentication"
                 elif self._provided_username or self._provided_password:
@@ -329,9 +350,15 @@ class BitbucketAPIClient:
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e}") from e
 
-    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        session: requests.Session | None = None,
+    ) -> dict[str, Any]:
         """Make a GET request."""
-        response = self._make_request("GET", endpoint, params=params)
+        response = self._make_request("GET", endpoint, params=params, headers=headers, session=session)
         return response.json()
 
     def post(
@@ -7,14 +7,18 @@ using the system keyring or encrypted local storage as fallback.
 
 import base64
 import getpass
+import hashlib
 import json
 import os
+import secrets
+import weakref
+from collections.abc import Callable
 from pathlib import Path
 
 import keyring
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from rich.console import Console
 
 from bbcli.core.config import get_config
@@ -29,15 +33,66 @@ class AuthManager:
     USERNAME_KEY = "bitbucket_username"
     APP_SECRET_KEY = "bitbucket_app_secret"  # noqa: S105
 
-    def __init__(self) -> None:
-        """Initialize the authentication manager."""
+    _KDF_SALT = b"bbcli_salt_v1"
+    _KDF_ITERATIONS = 100000
+
+    # Blobs written by _encrypt_data are laid out as magic | salt | nonce |
+    # AES-GCM ciphertext; legacy blobs are Fernet tokens keyed with PBKDF2
+    _DATA_MAGIC = b"BBC1"
+    _DATA_SALT_SIZE = 16
+    _DATA_NONCE_SIZE = 12
+    _DATA_TAG_SIZE = 16
+    _FERNET_TOKEN_PREFIX = b"gAAAA"
+    _SCRYPT_N = 2**15
+    _SCRYPT_R = 8
+    _SCRYPT_P = 1
+    _SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+    # New blobs are salted with one per-install salt so every blob written or
+    # read in a command shares a single scrypt run
+    _DATA_SALT_FILE = "data.salt"
+
+    # Derived keys kept per command: the scrypt key for the install salt and the
+    # PBKDF2 key for the fixed salt. Anything else (another password, a blob salted
+    # before the salt file was recreated) clears the cache rather than growing it
+    _KEY_CACHE_SIZE = 2
+
+    def __init__(self, password_provider: Callable[[str], str] | None = None) -> None:
+        """
+        Initialize the authentication manager.
+
+        Args:
+            password_provider: Callable that receives a prompt and returns the
+                               master password. Defaults to getpass.getpass.
+        """
+        self._password_provider = password_provider
         self.config = get_config()
         self.config_dir = Path(self.config.config_dir)
         self.credentials_file = self.config_dir / "credentials.enc"
 
+        # Derived keys keyed by (salt, SHA-256 of the password) so each master
+        # password only pays the PBKDF2 cost once per command
+        self._key_cache: dict[tuple[bytes, bytes], bytes] = {}
+        # Fernet instances keyed by their raw key, built once per key
+        self._fernet_cache: dict[bytes, Fernet] = {}
+
+        # Master password entered for _encrypt_data, reused for later writes in the same command
+        self._session_password: str | None = None
+
+        # Per-install scrypt salt, loaded or created on first encryption
+        self._data_salt: bytes | None = None
+
         # Check if system keyring is available
         self._keyring_available = self._check_keyring_availability()
 
+        _live_managers.add(self)
+
+    def _prompt_password(self, prompt: str) -> str:
+        """Ask for the master password through the configured provider."""
+        if self._password_provider is not None:
+            return self._password_provider(prompt)
+        return getpass.getpass(prompt)
+
     def _check_keyring_availability(self) -> bool:
         """Check if system keyring is available and functional."""
         try:
@@ -50,50 +105,154 @@ class AuthManager:
         except Exception:
             return False
 
-    def _get_encryption_key(self, password: str) -> bytes:
-        """Derive encryption key from password."""
+    def _derive_key(self, password: str, salt: bytes | None = None) -> bytes:
+        """
+        Derive a raw 32-byte key from password, reusing previously derived keys.
+
+        Args:
+            password: Master password
+            salt: Per-blob salt for scrypt-derived keys. When omitted, the legacy
+                  fixed-salt PBKDF2 key used by the credentials file is returned.
+
+        Returns:
+            Raw key bytes
+        """
         password_bytes = password.encode()
-        salt = b"bbcli_salt_v1"
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
+        cache_key = (self._KDF_SALT if salt is None else salt, hashlib.sha256(password_bytes).digest())
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            if salt is None:
+                # hashlib calls straight into OpenSSL's PBKDF2, producing the same
+                # bytes as cryptography's PBKDF2HMAC without the per-call objects
+                key = hashlib.pbkdf2_hmac("sha256", password_bytes, self._KDF_SALT, self._KDF_ITERATIONS, dklen=32)
+            else:
+                key = hashlib.scrypt(
+                    password_bytes,
+                    salt=salt,
+                    n=self._SCRYPT_N,
+                    r=self._SCRYPT_R,
+                    p=self._SCRYPT_P,
+                    maxmem=self._SCRYPT_MAXMEM,
+                    dklen=32,
+                )
+            if len(self._key_cache) >= self._KEY_CACHE_SIZE:
+                self._key_cache.clear()
+            self._key_cache[cache_key] = key
         return key
 
+    def _get_data_salt(self) -> bytes:
+        """
+        Return the per-install salt for new data blobs, creating it on first use.
+
+        Returns:
+            Salt bytes shared by every blob written by this installation
+        """
+        if self._data_salt is None:
+            salt_file = self.config_dir / self._DATA_SALT_FILE
+            try:
+                salt = salt_file.read_bytes()
+            except FileNotFoundError:
+                salt = b""
+
+            if len(salt) != self._DATA_SALT_SIZE:
+                # Replacing a missing or damaged salt is safe: existing blobs carry their own
+                salt = secrets.token_bytes(self._DATA_SALT_SIZE)
+                fd = os.open(salt_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with open(fd, "wb") as f:
+                    f.write(salt)
+
+            self._data_salt = salt
+        return self._data_salt
+
+    def _get_encryption_key(self, password: str) -> bytes:
+        """Derive the Fernet key used for the credentials file and legacy data blobs."""
+        return base64.urlsafe_b64encode(self._derive_key(password))
+
+    def _get_fernet(self, password: str) -> Fernet:
+        """Return the Fernet instance for the credentials file and legacy data blobs."""
+        key = self._derive_key(password)
+        fernet = self._fernet_cache.get(key)
+        if fernet is None:
+            fernet = self._fernet_cache[key] = Fernet(base64.urlsafe_b64encode(key))
+        return fernet
+
+    def clear_session(self) -> None:
+        """Forget the session master password and all keys derived from it."""
+        self._session_password = None
+        self._key_cache.clear()
+        self._fernet_cache.clear()
+
     def _encrypt_credentials(self, username: str, app_password: str) -> bytes:
         """Encrypt credentials for local storage."""
         # Use a simple password for encryption (in production, consider better key derivation)
-        master_password = getpass.getpass("Enter a master password to encrypt your credentials: ")
-        key = self._get_encryption_key(master_password)
-
-        fernet = Fernet(key)
+        master_password = self._prompt_password("Enter a master password to encrypt your credentials: ")
+        fernet = self._get_fernet(master_password)
         credentials = {"username": username, "app_password": app_password}
 
         encrypted_data: bytes = fernet.encrypt(json.dumps(credentials).encode())
         return encrypted_data
 
+    def _get_session_password(self) -> str:
+        """Return the session master password, prompting for it on first use."""
+        if self._session_password is None:
+            self._session_password = self._prompt_password("Enter a master password to encrypt your data: ")
+        return self._session_password
+
     def _encrypt_data(self, data: str) -> bytes:
         """Encrypt arbitrary data for local storage."""
-        # Use a simple password for encryption (in production, consider better key derivation)
-        master_password = getpass.getpass("Enter a master password to encrypt your data: ")
-        key = self._get_encryption_key(master_password)
+        return self._encrypt_many([data])[0]
 
-        fernet = Fernet(key)
-        encrypted_data: bytes = fernet.encrypt(data.encode())
-        return encrypted_data
+    def _encrypt_many(self, items: list[str]) -> list[bytes]:
+        """
+        Encrypt several payloads under a single key derivation.
+
+        The payloads share the per-install salt, and so one scrypt run, but each
+        gets its own nonce; every result decrypts independently with _decrypt_data.
+
+        Args:
+            items: Plaintext payloads to encrypt
+
+        Returns:
+            Encrypted blobs in the same order as ``items``
+        """
+        master_password = self._get_session_password()
+        salt = self._get_data_salt()
+        aesgcm = AESGCM(self._derive_key(master_password, salt))
+
+        encrypted_items = []
+        for item in items:
+            nonce = secrets.token_bytes(self._DATA_NONCE_SIZE)
+            encrypted_items.append(self._DATA_MAGIC + salt + nonce + aesgcm.encrypt(nonce, item.encode(), None))
+        return encrypted_items
 
     def _decrypt_data(self, encrypted_data: bytes) -> str:
         """Decrypt arbitrary data from local storage."""
-        try:
-            master_password = getpass.getpass("Enter your master password: ")
-            key = self._get_encryption_key(master_password)
+        # Reject blobs in neither format before prompting or running the KDF
+        is_current = encrypted_data.startswith(self._DATA_MAGIC)
+        salt_end = len(self._DATA_MAGIC) + self._DATA_SALT_SIZE
+        nonce_end = salt_end + self._DATA_NONCE_SIZE
+        if (is_current and len(encrypted_data) < nonce_end + self._DATA_TAG_SIZE) or (
+            not is_current and not encrypted_data.startswith(self._FERNET_TOKEN_PREFIX)
+        ):
+            raise AuthenticationError(
+                "Failed to decrypt stored data: unrecognized data format",
+                suggestion="Check your master password or re-authenticate",
+            )
 
-            fernet = Fernet(key)
-            decrypted_data: bytes = fernet.decrypt(encrypted_data)
+        try:
+            master_password = self._prompt_password("Enter your master password: ")
+            if is_current:
+                key = self._derive_key(master_password, encrypted_data[len(self._DATA_MAGIC) : salt_end])
+                decrypted_data = AESGCM(key).decrypt(encrypted_data[salt_end:nonce_end], encrypted_data[nonce_end:], None)
+            else:
+                fernet = self._get_fernet(master_password)
+                decrypted_data = fernet.decrypt(encrypted_data)
             return decrypted_data.decode()
+        except InvalidTag as e:
+            raise AuthenticationError(
+                "Failed to decrypt stored data",
+                suggestion="Check your master password or re-authenticate",
+            ) from e
         except Exception as e:
             raise AuthenticationError(
                 f"Failed to decrypt stored data: {e}",
@@ -106,10 +265,8 @@ class AuthManager:
             return None
 
         try:
-            master_password = getpass.getpass("Enter your master password: ")
-            key = self._get_encryption_key(master_password)
-
-            fernet = Fernet(key)
+            master_password = self._prompt_password("Enter your master password: ")
+            fernet = self._get_fernet(master_password)
 
             with open(self.credentials_file, "rb") as f:
                 encrypted_data = f.read()
@@ -214,8 +371,20 @@ class AuthManager:
             self.credentials_file.unlink()
             deleted = True
 
+        self.clear_session()
+
         return deleted
 
     def has_credentials(self) -> bool:
         """Check if credentials are stored."""
         return self.get_credentials() is not None
+
+
+# Managers alive in this process, so their sessions can be cleared when a command ends
+_live_managers: "weakref.WeakSet[AuthManager]" = weakref.WeakSet()
+
+
+def clear_sessions() -> None:
+    """Forget the session master password and derived keys of every live AuthManager."""
+    for manager in [*_live_managers]:
+        manager.clear_session()
@@ -7,6 +7,8 @@ including user preferences and default values.
 
 import os
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +16,10 @@ import yaml
 
 from bbcli.core.exceptions import ConfigurationError
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class SingletonMeta(type):
     """
@@ -28,16 +34,77 @@ class SingletonMeta(type):
 
     def __call__(cls, *args, **kwargs) -> Any:
         """Create or return the singleton instance."""
+        # Double-checked locking: only the first construction takes the lock
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls not in cls._instances:
-                instance = super().__call__(*args, **kwargs)
-                cls._instances[cls] = instance
-        return cls._instances[cls]
+                cls._instances[cls] = super().__call__(*args, **kwargs)
+            return cls._instances[cls]
+
+
+# Template for fresh configurations; never handed out without _copy_tree()
+_DEFAULT_CONFIG: dict[str, Any] = {
+    "default_workspace": None,
+    "default_output_format": "text",
+    "api": {
+        "base_url": "https://api.bitbucket.org/2.0",
+        "timeout": 30,
+        "max_retries": 3,
+    },
+    "ui": {
+        "show_progress": True,
+        "confirm_destructive": True,
+        "color": True,
+    },
+}
+
+
+def _flatten(data: dict[str, Any], prefix: str, out: dict[str, Any]) -> dict[str, Any]:
+    """
+    Index every value of a nested mapping by its dotted path.
+
+    Args:
+        data: Nested configuration mapping
+        prefix: Dotted path of ``data`` itself, empty for the root
+        out: Index to populate
+
+    Returns:
+        The populated index
+    """
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+    return out
+
+
+def _copy_tree(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy the nested dicts and lists of a configuration tree.
+
+    Configuration values are plain YAML data, so this avoids the memo and
+    dispatch overhead of copy.deepcopy.
+
+    Args:
+        data: Nested configuration mapping
+
+    Returns:
+        A copy sharing only immutable leaves with ``data``
+    """
+    return {
+        key: _copy_tree(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+        for key, value in data.items()
+    }
 
 
 class Config(metaclass=SingletonMeta):
     """Configuration manager for bbcli."""
 
+    __slots__ = ("config_dir", "config_file", "_config", "_flat", "_write_lock", "_dirty", "_batch_depth", "_initialized")
+
     def __init__(self, config_dir: Path | None = None) -> None:
         """
         Initialize the configuration manager.
@@ -59,12 +126,22 @@ class Config(metaclass=SingletonMeta):
         self.config_dir = config_dir
         self.config_file = config_dir / "config.yaml"
         self._config: dict[str, Any] = {}
+        # Dotted-path index over _config; rebuilt under _write_lock on every
+        # change and swapped in whole so get() can read it without locking
+        self._flat: dict[str, Any] = {}
+        self._write_lock = threading.RLock()
+        # Changes are written as they are made, except inside batch(), which
+        # writes them once when the outermost batch ends
+        self._dirty = False
+        self._batch_depth = 0
 
         # Ensure config directory exists
         self.config_dir.mkdir(mode=0o700, exist_ok=True)
 
         # Load existing configuration
-        self._load_config()
+        with self._write_lock:
+            self._load_config()
+            self._reindex()
 
         # Mark as initialized
         self._initialized = True
@@ -74,7 +151,7 @@ class Config(metaclass=SingletonMeta):
         if self.config_file.exists():
             try:
                 with open(self.config_file, encoding="utf-8") as f:
-                    self._config = yaml.safe_load(f) or {}
+                    self._config = yaml.load(f, Loader=_YAML_LOADER) or {}  # noqa: S506 - safe loader
             except (yaml.YAMLError, OSError) as e:
                 raise ConfigurationError(
                     f"Failed to load configuration file: {e}",
@@ -87,34 +164,78 @@ class Config(metaclass=SingletonMeta):
 
     def _save_config(self) -> None:
         """Save configuration to file."""
+        tmp_file = self.config_file.with_name(f"{self.config_file.name}.tmp")
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                yaml.safe_dump(self._config, f, default_flow_style=False)
+            # Write a sibling file with secure permissions and swap it in so a
+            # crash mid-write never leaves a truncated config behind
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                with open(fd, "w", encoding="utf-8") as f:
+                    yaml.dump(self._config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+                os.replace(tmp_file, self.config_file)
+            except BaseException:
+                # Never leave a half-written sibling behind when the write or swap fails
+                tmp_file.unlink(missing_ok=True)
+                raise
 
             # Ensure config file has secure permissions
             os.chmod(self.config_file, 0o600)
+            self._dirty = False
         except OSError as e:
             raise ConfigurationError(
                 f"Failed to save configuration file: {e}",
                 suggestion=f"Check that {self.config_dir} is writable",
             ) from e
 
+    def save(self) -> None:
+        """
+        Write pending configuration changes to disk.
+
+        Raises:
+            ConfigurationError: If the configuration file cannot be written
+        """
+        with self._write_lock:
+            if self._dirty:
+                self._save_config()
+
+    def _changed(self) -> None:
+        """Record a change and write it unless a batch is open; called under _write_lock."""
+        self._reindex()
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_config()
+
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """
+        Write the changes made inside the block once, when it ends.
+
+        set(), delete() and reset() normally write the file on every call. Batches
+        nest; the outermost one writes all changes made by any thread meanwhile.
+
+        Yields:
+            This configuration
+
+        Raises:
+            ConfigurationError: If the configuration file cannot be written
+        """
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.save()
+
+    def _reindex(self) -> None:
+        """Rebuild the dotted-path index from the nested configuration."""
+        self._flat = _flatten(self._config, "", {})
+
     def _get_default_config(self) -> dict[str, Any]:
         """Get default configuration values."""
-        return {
-            "default_workspace": None,
-            "default_output_format": "text",
-            "api": {
-                "base_url": "https://api.bitbucket.org/2.0",
-                "timeout": 30,
-                "max_retries": 3,
-            },
-            "ui": {
-                "show_progress": True,
-                "confirm_destructive": True,
-                "color": True,
-            },
-        }
+        return _copy_tree(_DEFAULT_CONFIG)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -127,84 +248,95 @@ class Config(metaclass=SingletonMeta):
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
-
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value.
 
+        The change is written to disk at once, or when the enclosing batch() ends.
+
         Args:
             key: Configuration key (supports dot notation)
             value: Value to set
+
+        Raises:
+            ConfigurationError: If the configuration file cannot be written
         """
         keys = key.split(".")
-        config = self._config
 
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        with self._write_lock:
+            config = self._config
 
-        # Set the value
-        config[keys[-1]] = value
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
 
-        # Save to file
-        self._save_config()
+            # Set the value
+            config[keys[-1]] = value
+            self._changed()
 
     def delete(self, key: str) -> bool:
         """
         Delete a configuration value.
 
+        The change is written to disk at once, or when the enclosing batch() ends.
+
         Args:
             key: Configuration key to delete
 
         Returns:
             True if key was deleted, False if it didn't exist
+
+        Raises:
+            ConfigurationError: If the configuration file cannot be written
         """
         keys = key.split(".")
-        config = self._config
 
-        try:
-            # Navigate to the parent of the target key
-            for k in keys[:-1]:
-                config = config[k]
+        with self._write_lock:
+            config = self._config
 
-            # Delete the key
-            if keys[-1] in config:
-                del config[keys[-1]]
-                self._save_config()
-                return True
-            return False
-        except (KeyError, TypeError):
-            return False
+            try:
+                # Navigate to the parent of the target key
+                for k in keys[:-1]:
+                    config = config[k]
+
+                # Delete the key
+                if keys[-1] in config:
+                    del config[keys[-1]]
+                    self._changed()
+                    return True
+                return False
+            except (KeyError, TypeError):
+                return False
 
     def get_all(self) -> dict[str, Any]:
-        """Get all configuration values."""
-        return self._config.copy()
+        """Get a copy of all configuration values, including nested sections."""
+        return _copy_tree(self._config)
 
     def reset(self) -> None:
-        """Reset configuration to defaults."""
-        self._config = self._get_default_config()
-        self._save_config()
+        """Reset configuration to defaults; written at once, or when the enclosing batch() ends."""
+        with self._write_lock:
+            self._config = self._get_default_config()
+            self._changed()
 
     @classmethod
     def reset_singleton(cls) -> None:
         """
-        Reset the singleton instance.
+        Reset the singleton instance, saving any pending changes first.
 
         This is primarily useful for testing purposes.
+
+        Raises:
+            ConfigurationError: If pending changes cannot be written; the
+                                instance is kept so they are not lost
         """
         with SingletonMeta._lock:
-            if cls in SingletonMeta._instances:
+            instance = SingletonMeta._instances.get(cls)
+            if instance is not None:
+                instance.save()
                 del SingletonMeta._instances[cls]
 
     @classmethod
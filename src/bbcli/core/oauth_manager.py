@@ -9,7 +9,7 @@ import hashlib
 import secrets
 import time
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
@@ -17,8 +17,11 @@ import requests
 from bbcli.core.config import get_config
 from bbcli.core.exceptions import AuthenticationError
 
+# Seconds before the real expiry at which a token is already treated as expired
+TOKEN_EXPIRY_BUFFER = 60
 
-@dataclass
+
+@dataclass(slots=True)
 class OAuthToken:
     """OAuth 2.0 token information."""
 
@@ -28,11 +31,14 @@ class OAuthToken:
     refresh_token: str | None = None
     scope: str | None = None
     created_at: float | None = None
+    # Monotonic clock reading for tokens issued in this process; a stored token's is meaningless
+    _created_monotonic_ns: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Set creation time if not provided."""
         if self.created_at is None:
             self.created_at = time.time()
+            self._created_monotonic_ns = time.monotonic_ns()
 
     @property
     def is_expired(self) -> bool:
@@ -40,7 +46,12 @@ class OAuthToken:
         if self.expires_in is None or self.created_at is None:
             return False
 
-        return time.time() > (self.created_at + self.expires_in - 60)  # 60s buffer
+        if self._created_monotonic_ns is not None:
+            # Issued in this process: integer comparison that wall-clock adjustments cannot skew
+            lifetime_ns = (self.expires_in - TOKEN_EXPIRY_BUFFER) * 1_000_000_000
+            return time.monotonic_ns() - self._created_monotonic_ns > lifetime_ns
+
+        return time.time() > (self.created_at + self.expires_in - TOKEN_EXPIRY_BUFFER)
 
     @property
     def expires_at(self) -> float | None:
@@ -66,7 +77,7 @@ class OAuthToken:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class OAuthApp:
     """OAuth 2.0 application credentials."""
 
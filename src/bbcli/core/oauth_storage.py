@@ -6,6 +6,8 @@ using the same encryption and keyring mechanisms as the existing auth manager.
 """
 
 import json
+import os
+from pathlib import Path
 
 from bbcli.core.auth_manager import AuthManager
 from bbcli.core.oauth_manager import OAuthApp, OAuthToken
@@ -13,19 +15,81 @@ from bbcli.core.oauth_manager import OAuthApp, OAuthToken
 BBCLI_OAUTH_APP = "bbcli_oauth_app"
 BBCLI_OAUTH_CREDENTIALS = "bbcli_oauth_credentials"
 
+# Shared codec for OAuth payloads; compact separators keep the encrypted blobs and keyring entries small
+_encode_payload = json.JSONEncoder(separators=(",", ":")).encode
+_decode_payload = json.JSONDecoder().decode
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write data to a file atomically with owner-only permissions.
+
+    The data is written to a sibling temporary file and flushed to disk before it
+    replaces the target, so neither readers nor a crash can leave a partially
+    written file behind. The temporary file is removed if the write or rename fails.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        try:
+            # Hand the kernel everything left in one call; it only loops on a short write
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _file_cache_key(fd: int) -> tuple[int, int, int]:
+    """
+    Identify the current contents of an open file for cache validation.
+
+    The inode number tells an atomically replaced file apart from the one it
+    replaced even when size and modification time match within timer granularity.
+
+    Args:
+        fd: Descriptor of the open file to identify
+
+    Returns:
+        Tuple of (inode number, modification time in nanoseconds, size in bytes)
+    """
+    stat = os.fstat(fd)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
 
 class OAuthStorage:
     """Manages secure storage of OAuth 2.0 tokens and app credentials."""
 
-    def __init__(self):
-        """Initialize OAuth storage using existing auth manager infrastructure."""
-        self.auth_manager = AuthManager()
+    def __init__(self, auth_manager: AuthManager | None = None) -> None:
+        """
+        Initialize OAuth storage using existing auth manager infrastructure.
+
+        Args:
+            auth_manager: Auth manager to encrypt with and detect the keyring through.
+                          Callers that already hold one should pass it to skip a second keyring probe.
+        """
+        self.auth_manager = auth_manager if auth_manager is not None else AuthManager()
         self.config_dir = self.auth_manager.config_dir
 
         # OAuth-specific storage files
         self.oauth_app_file = self.config_dir / "oauth_app.enc"
         self.oauth_token_file = self.config_dir / "oauth_token.enc"
 
+        # Parsed app and token, keyed by _file_cache_key, so repeated lookups of an unchanged file skip
+        # decryption. Keyring values are never cached: another bbcli process may rewrite them (e.g. on a
+        # token refresh) and the keyring offers no cheap way to tell
+        self._app_cache: tuple[tuple[int, int, int], OAuthApp] | None = None
+        self._token_cache: tuple[tuple[int, int, int], OAuthToken] | None = None
+
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
@@ -39,9 +103,10 @@ class OAuthStorage:
         Returns:
             True if stored successfully, False otherwise
         """
+        self._app_cache = None
         try:
             app_data = oauth_app.to_dict()
-            app_json = json.dumps(app_data)
+            app_json = _encode_payload(app_data)
 
             if self.auth_manager._keyring_available:
                 # Store in system keyring
@@ -51,7 +116,7 @@ class OAuthStorage:
             else:
                 # Store in encrypted file
                 encrypted_data = self.auth_manager._encrypt_data(app_json)
-                self.oauth_app_file.write_bytes(encrypted_data)
+                _atomic_write_bytes(self.oauth_app_file, encrypted_data)
 
             return True
 
@@ -67,6 +132,7 @@ class OAuthStorage:
         """
         try:
             app_json = None
+            cache_key = None
 
             if self.auth_manager._keyring_available:
                 # Retrieve from system keyring
@@ -74,14 +140,23 @@ class OAuthStorage:
 
                 app_json = keyring.get_password(BBCLI_OAUTH_APP, "default")
             else:
-                # Retrieve from encrypted file
-                if self.oauth_app_file.exists():
-                    encrypted_data = self.oauth_app_file.read_bytes()
-                    app_json = self.auth_manager._decrypt_data(encrypted_data)
+                # Retrieve from encrypted file; opening it is the existence check
+                try:
+                    with open(self.oauth_app_file, "rb") as app_file:
+                        cache_key = _file_cache_key(app_file.fileno())
+                        if self._app_cache is not None and self._app_cache[0] == cache_key:
+                            return self._app_cache[1]
+                        encrypted_data = app_file.read()
+                except FileNotFoundError:
+                    return None
+                app_json = self.auth_manager._decrypt_data(encrypted_data)
 
             if app_json:
-                app_data = json.loads(app_json)
-                return OAuthApp.from_dict(app_data)
+                app_data = _decode_payload(app_json)
+                oauth_app = OAuthApp.from_dict(app_data)
+                if cache_key is not None:
+                    self._app_cache = (cache_key, oauth_app)
+                return oauth_app
 
             return None
 
@@ -95,6 +170,7 @@ class OAuthStorage:
         Returns:
             True if deleted successfully, False otherwise
         """
+        self._app_cache = None
         try:
             if self.auth_manager._keyring_available:
                 # Delete from system keyring
@@ -103,8 +179,7 @@ class OAuthStorage:
                 keyring.delete_password(BBCLI_OAUTH_APP, "default")
             else:
                 # Delete encrypted file
-                if self.oauth_app_file.exists():
-                    self.oauth_app_file.unlink()
+                self.oauth_app_file.unlink(missing_ok=True)
 
             return True
 
@@ -130,9 +205,10 @@ class OAuthStorage:
         Returns:
             True if stored successfully, False otherwise
         """
+        self._token_cache = None
         try:
             token_data = oauth_token.to_dict()
-            token_json = json.dumps(token_data)
+            token_json = _encode_payload(token_data)
 
             if self.auth_manager._keyring_available:
                 # Store in system keyring
@@ -142,7 +218,7 @@ class OAuthStorage:
             else:
                 # Store in encrypted file
                 encrypted_data = self.auth_manager._encrypt_data(token_json)
-                self.oauth_token_file.write_bytes(encrypted_data)
+                _atomic_write_bytes(self.oauth_token_file, encrypted_data)
 
             return True
 
@@ -158,6 +234,7 @@ class OAuthStorage:
         """
         try:
             token_json = None
+            cache_key = None
 
             if self.auth_manager._keyring_available:
                 # Retrieve from system keyring
@@ -165,14 +242,23 @@ class OAuthStorage:
 
                 token_json = keyring.get_password(BBCLI_OAUTH_CREDENTIALS, "default")
             else:
-                # Retrieve from encrypted file
-                if self.oauth_token_file.exists():
-                    encrypted_data = self.oauth_token_file.read_bytes()
-                    token_json = self.auth_manager._decrypt_data(encrypted_data)
+                # Retrieve from encrypted file; opening it is the existence check
+                try:
+                    with open(self.oauth_token_file, "rb") as token_file:
+                        cache_key = _file_cache_key(token_file.fileno())
+                        if self._token_cache is not None and self._token_cache[0] == cache_key:
+                            return self._token_cache[1]
+                        encrypted_data = token_file.read()
+                except FileNotFoundError:
+                    return None
+                token_json = self.auth_manager._decrypt_data(encrypted_data)
 
             if token_json:
-                token_data = json.loads(token_json)
-                return OAuthToken.from_dict(token_data)
+                token_data = _decode_payload(token_json)
+                oauth_token = OAuthToken.from_dict(token_data)
+                if cache_key is not None:
+                    self._token_cache = (cache_key, oauth_token)
+                return oauth_token
 
             return None
 
@@ -186,6 +272,7 @@ class OAuthStorage:
         Returns:
             True if deleted successfully, False otherwise
         """
+        self._token_cache = None
         try:
             if self.auth_manager._keyring_available:
                 # Delete from system keyring
@@ -194,8 +281,7 @@ class OAuthStorage:
                 keyring.delete_password(BBCLI_OAUTH_CREDENTIALS, "default")
             else:
                 # Delete encrypted file
-                if self.oauth_token_file.exists():
-                    self.oauth_token_file.unlink()
+                self.oauth_token_file.unlink(missing_ok=True)
 
             return True
 
@@ -250,11 +336,15 @@ class OAuthStorage:
         Returns:
             Dictionary with storage information
         """
+        # Fetch each item once; has_oauth_app()/has_oauth_token() would repeat the lookups
+        oauth_app = self.get_oauth_app()
+        oauth_token = self.get_oauth_token()
+
         return {
             "storage_type": ("System keyring" if self.auth_manager._keyring_available else "Encrypted local file"),
             "config_dir": str(self.config_dir),
-            "has_oauth_app": self.has_oauth_app(),
-            "has_oauth_token": self.has_oauth_token(),
+            "has_oauth_app": oauth_app is not None,
+            "has_oauth_token": oauth_token is not None,
             "oauth_app_file": (str(self.oauth_app_file) if not self.auth_manager._keyring_available else None),
             "oauth_token_file": (str(self.oauth_token_file) if not self.auth_manager._keyring_available else None),
         }
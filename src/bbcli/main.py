@@ -9,15 +9,17 @@ import sys
 
 import click
 from rich.console import Console
-from rich.traceback import install
 
 from bbcli import __version__
 from bbcli.cli import auth, branch, oauth_auth, project, repo
+from bbcli.core.auth_manager import clear_sessions
 from bbcli.core.exceptions import BBCLIError
 from bbcli.utils.output import OutputFormatter
 
 # Install rich traceback handler only in development mode
 if os.getenv("BBCLI_DEBUG") or os.getenv("DEBUG"):
+    from rich.traceback import install
+
     install(show_locals=True)
 
 # Global console instance
@@ -65,6 +67,9 @@ def cli(ctx: click.Context, verbose: bool, output: str) -> None:
     ctx.obj["console"] = console
     ctx.obj["formatter"] = OutputFormatter(output.lower(), console)
 
+    # Keep the master password and derived keys for the whole command, then forget them
+    ctx.call_on_close(clear_sessions)
+
 
 # Register command groups
 cli.add_command(auth.auth)
@@ -89,7 +94,7 @@ def handle_exception(exc: Exception) -> None:
         # Unexpected error
         console.print(f"[red]Unexpected error:[/red] {exc}")
         console.print(
-            "[yellow]This is likely a bug. Please report it at:[/yellow] " "https://github.com/yourusername/bbcli/issues",
+            "[yellow]This is likely a bug. Please report it at:[/yellow] https://github.com/yourusername/bbcli/issues",
         )
         sys.exit(1)
 
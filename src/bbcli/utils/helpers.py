@@ -13,6 +13,9 @@ from urllib.parse import urlparse
 
 import click
 
+# Sentinel for dict.get() misses, distinct from any stored value including None
+_MISSING = object()
+
 
 def confirm_action(message: str, default: bool = False) -> bool:
     """
@@ -110,13 +113,19 @@ def safe_get_nested(data: dict[str, Any], keys: list[str], default: Any = None)
     Returns:
         The value at the key path or default
     """
-    current = data
-    try:
-        for key in keys:
+    current: Any = data
+    for key in keys:
+        if isinstance(current, dict):
+            # Misses are common in sparse API responses; avoid raising KeyError for them
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return default
+            continue
+        try:
             current = current[key]
-        return current
-    except (KeyError, TypeError, IndexError):
-        return default
+        except (KeyError, TypeError, IndexError):
+            return default
+    return current
 
 
 def extract_repo_info_from_url(url: str) -> dict[str, str] | None:
@@ -220,14 +229,7 @@ def create_table_data(items: list[dict[str, Any]], columns: list[str]) -> list[l
     Returns:
         List of rows, where each row is a list of string values
     """
-    rows = []
-    for item in items:
-        row = []
-        for column in columns:
-            value = safe_get_nested(item, column.split("."), "")
-            if isinstance(value, (dict, list)):
-                value = str(value)
-            row.append(str(value))
-        rows.append(row)
-
-    return rows
+    # Split dotted column paths once rather than once per cell
+    column_keys = [column.split(".") for column in columns]
+
+    return [[str(safe_get_nested(item, keys, "")) for keys in column_keys] for item in items]
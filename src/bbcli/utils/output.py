@@ -10,7 +10,12 @@ from typing import Any
 
 import yaml
 from rich.console import Console
-from rich.table import Table
+
+# Shared encoder for indented JSON; json.dumps() builds a new JSONEncoder on every call
+_pretty_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+_pretty_encode = _pretty_encoder.encode
+# Single-line variant for plain (non-terminal) text output
+_compact_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
 
 
 class OutputFormatter:
@@ -26,6 +31,8 @@ class OutputFormatter:
         """
         self.format_type = format_type.lower()
         self.console = console or Console()
+        # Resolve the formatter once instead of comparing format_type on every call
+        self._emit = {"json": self._format_json, "yaml": self._format_yaml}.get(self.format_type, self._format_text)
 
     def format_output(self, data: Any, title: str | None = None) -> None:
         """
@@ -35,19 +42,22 @@ class OutputFormatter:
             data: Data to format and display
             title: Optional title for the output
         """
-        if self.format_type == "json":
-            self._format_json(data)
-        elif self.format_type == "yaml":
-            self._format_yaml(data)
-        else:
-            self._format_text(data, title)
+        self._emit(data, title)
 
-    def _format_json(self, data: Any) -> None:
+    def _format_json(self, data: Any, _title: str | None = None) -> None:
         """Format output as JSON."""
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
-        self.console.print(json_str)
+        if not self.console.is_terminal:
+            # Piped or redirected output: stream the encoder's chunks instead of building
+            # the whole document, and keep Rich from wrapping or parsing markup in it
+            write = self.console.file.write
+            for chunk in _pretty_encoder.iterencode(data):
+                write(chunk)
+            write("\n")
+            return
 
-    def _format_yaml(self, data: Any) -> None:
+        self.console.print(_pretty_encode(data))
+
+    def _format_yaml(self, data: Any, _title: str | None = None) -> None:
         """Format output as YAML."""
         yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True)
         self.console.print(yaml_str.rstrip())
@@ -66,16 +76,29 @@ class OutputFormatter:
 
     def _format_dict_as_text(self, data: dict[str, Any], title: str | None = None) -> None:
         """Format a dictionary as readable text."""
+        if not self.console.is_terminal:
+            # Piped or redirected output: plain lines are easier to script against
+            # and skip building a styled table nobody will see
+            write = self.console.file.write
+            if title:
+                write(f"{title}\n")
+            for key, value in data.items():
+                value_str = _compact_encode(value) if isinstance(value, (dict, list)) else str(value)
+                write(f"{key.replace('_', ' ').title()}: {value_str}\n")
+            return
+
         if title:
             self.console.print(f"\n[bold green]{title}[/bold green]")
 
         # Create a table for key-value pairs
+        from rich.table import Table
+
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Key", style="cyan", no_wrap=True)
         table.add_column("Value", style="white")
 
         for key, value in data.items():
-            value_str = json.dumps(value, indent=2) if isinstance(value, (dict, list)) else str(value)
+            value_str = _pretty_encode(value) if isinstance(value, (dict, list)) else str(value)
 
             table.add_row(key.replace("_", " ").title(), value_str)
 
@@ -110,6 +133,8 @@ class OutputFormatter:
                 all_keys.update(item.keys())
 
         # Create table with headers
+        from rich.table import Table
+
         table = Table()
         for key in sorted(all_keys):
             table.add_column(key.replace("_", " ").title(), style="cyan")
@@ -121,7 +146,7 @@ class OutputFormatter:
                 for key in sorted(all_keys):
                     value = item.get(key, "")
                     if isinstance(value, (dict, list)):
-                        value = json.dumps(value, indent=2)
+                        value = _pretty_encode(value)
                     row.append(str(value))
                 table.add_row(*row)
 
@@ -6,10 +6,76 @@ Bitbucket API requirements and best practices.
 """
 
 import re
+import string
+from collections.abc import Iterable
+from functools import lru_cache
 
 from bbcli.core.exceptions import ValidationError
 
+# Validators are pure functions of their input, so successful results are memoized;
+# failures raise and are never cached
+_VALIDATOR_CACHE_SIZE = 512
 
+# Lowercase UUID, either bare or wrapped in braces (both or neither). Compiled once at import
+# time and used with fullmatch(), so it carries no ^/$ anchors
+_UUID_RE = re.compile(
+    r"\{[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\}"
+    r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+# Characters allowed in repository and workspace slugs (after lowercasing)
+_SLUG_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789._-")
+
+# Characters allowed in the local part and domain of an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+# Repository permission levels accepted by the Bitbucket API
+_VALID_PERMISSIONS = frozenset(("read", "write", "admin"))
+_VALID_PERMISSIONS_DISPLAY = "read, write, admin"
+
+# Suggestions attached to ValidationError, shared by the validators below
+_PROJECT_KEY_LENGTH_SUGGESTION = "Use a shorter, descriptive key like 'PROJ' or 'MYAPP'"
+_PROJECT_KEY_CHARS_SUGGESTION = "Use only A-Z and 0-9 characters, e.g., 'PROJ1' or 'MYAPP'"
+_REPO_SLUG_LENGTH_SUGGESTION = "Use a shorter, descriptive name"
+_REPO_SLUG_EDGE_SUGGESTION = "Start and end with alphanumeric characters"
+_SLUG_CHARS_SUGGESTION = "Use only lowercase letters, numbers, hyphens, underscores, and dots"
+_EMAIL_SUGGESTION = "Use a valid email format like 'user@example.com'"
+_PERMISSION_SUGGESTION = f"Use one of: {_VALID_PERMISSIONS_DISPLAY}"
+_BRANCH_NAME_SUGGESTION = "Use alphanumeric characters, hyphens, and forward slashes"
+
+# Git branch name restrictions, fused into one alternation so a name is scanned once
+_BRANCH_INVALID_RE = re.compile(r"\.\.|@\{|\\|\s|[~^:?*\[]|\.lock$|^\.|/$|/\.")
+
+
+def _is_uuid(value: str) -> bool:
+    """
+    Check whether a lowercase string is a UUID, optionally wrapped in braces.
+
+    Length and hyphen positions are checked first so that ordinary slugs and
+    emails are rejected without running the regex.
+
+    Args:
+        value: The lowercase string to check
+
+    Returns:
+        True if the value is a UUID, False otherwise
+    """
+    length = len(value)
+    if length == 36:
+        offset = 0
+    elif length == 38:
+        offset = 1
+    else:
+        return False
+
+    if not (value[offset + 8] == value[offset + 13] == value[offset + 18] == value[offset + 23] == "-"):
+        return False
+
+    return _UUID_RE.fullmatch(value) is not None
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_project_key(project_key: str) -> str:
     """
     Validate a Bitbucket project key.
@@ -26,26 +92,29 @@ def validate_project_key(project_key: str) -> str:
     if not project_key:
         raise ValidationError("Project key cannot be empty")
 
-    # Convert to uppercase as per Bitbucket convention
-    project_key = project_key.upper()
+    # Convert to uppercase as per Bitbucket convention (skipping the copy if already uppercase)
+    if not project_key.isupper():
+        project_key = project_key.upper()
 
     # Check length (Bitbucket typically allows 2-10 characters)
     if len(project_key) < 2 or len(project_key) > 10:
         raise ValidationError(
             f"Project key '{project_key}' must be between 2 and 10 characters",
-            suggestion="Use a shorter, descriptive key like 'PROJ' or 'MYAPP'",
+            suggestion=_PROJECT_KEY_LENGTH_SUGGESTION,
         )
 
-    # Check format (alphanumeric, typically uppercase)
-    if not re.match(r"^[A-Z0-9]+$", project_key):
+    # Check format (alphanumeric, typically uppercase); after upper() an ASCII
+    # alphanumeric string can only contain A-Z and 0-9
+    if not (project_key.isascii() and project_key.isalnum()):
         raise ValidationError(
             f"Project key '{project_key}' must contain only uppercase letters and numbers",
-            suggestion="Use only A-Z and 0-9 characters, e.g., 'PROJ1' or 'MYAPP'",
+            suggestion=_PROJECT_KEY_CHARS_SUGGESTION,
         )
 
     return project_key
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_repository_slug(repo_slug: str) -> str:
     """
     Validate a Bitbucket repository slug.
@@ -62,33 +131,52 @@ def validate_repository_slug(repo_slug: str) -> str:
     if not repo_slug:
         raise ValidationError("Repository slug cannot be empty")
 
-    # Convert to lowercase as per Bitbucket convention
-    repo_slug = repo_slug.lower()
+    # Convert to lowercase as per Bitbucket convention (skipping the copy if already lowercase)
+    if not repo_slug.islower():
+        repo_slug = repo_slug.lower()
 
     # Check length (Bitbucket allows up to 62 characters)
     if len(repo_slug) > 62:
         raise ValidationError(
             f"Repository slug '{repo_slug}' is too long (max 62 characters)",
-            suggestion="Use a shorter, descriptive name",
+            suggestion=_REPO_SLUG_LENGTH_SUGGESTION,
         )
 
-    # Check format (alphanumeric, hyphens, underscores)
-    if not re.match(r"^[a-z0-9._-]+$", repo_slug):
+    # Cannot start or end with special characters (cheap, so checked before the full scan)
+    if repo_slug.startswith((".", "-", "_")) or repo_slug.endswith((".", "-", "_")):
         raise ValidationError(
-            f"Repository slug '{repo_slug}' contains invalid characters",
-            suggestion="Use only lowercase letters, numbers, hyphens, underscores, and dots",
+            f"Repository slug '{repo_slug}' cannot start or end with '.', '-', or '_'",
+            suggestion=_REPO_SLUG_EDGE_SUGGESTION,
         )
 
-    # Cannot start or end with special characters
-    if repo_slug.startswith((".", "-", "_")) or repo_slug.endswith((".", "-", "_")):
+    # Check format (alphanumeric, hyphens, underscores)
+    if not _SLUG_CHARS.issuperset(repo_slug):
         raise ValidationError(
-            f"Repository slug '{repo_slug}' cannot start or end with '.', '-', or '_'",
-            suggestion="Start and end with alphanumeric characters",
+            f"Repository slug '{repo_slug}' contains invalid characters",
+            suggestion=_SLUG_CHARS_SUGGESTION,
         )
 
     return repo_slug
 
 
+def validate_repository_slugs(repo_slugs: Iterable[str]) -> list[str]:
+    """
+    Validate many Bitbucket repository slugs in one call.
+
+    Args:
+        repo_slugs: The repository slugs to validate
+
+    Returns:
+        The validated repository slugs (lowercase), in input order
+
+    Raises:
+        ValidationError: On the first invalid repository slug
+    """
+    validate = validate_repository_slug
+    return [validate(repo_slug) for repo_slug in repo_slugs]
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_workspace_slug(workspace: str) -> str:
     """
     Validate a Bitbucket workspace slug or UUID.
@@ -105,29 +193,47 @@ def validate_workspace_slug(workspace: str) -> str:
     if not workspace:
         raise ValidationError("Workspace cannot be empty")
 
-    # Check if it's a UUID format
-    uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    if re.match(uuid_pattern, workspace.lower()):
-        return workspace.lower()
+    if not workspace.islower():
+        workspace = workspace.lower()
 
-    # Check if it's a UUID with braces
-    uuid_braces_pattern = r"^\{[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\}$"
-    if re.match(uuid_braces_pattern, workspace.lower()):
-        return workspace.lower()
+    # Check if it's a UUID, with or without braces
+    if _is_uuid(workspace):
+        return workspace
 
     # Otherwise, treat as workspace slug
-    workspace = workspace.lower()
 
     # Check format for workspace slug
-    if not re.match(r"^[a-z0-9._-]+$", workspace):
+    if not _SLUG_CHARS.issuperset(workspace):
         raise ValidationError(
             f"Workspace slug '{workspace}' contains invalid characters",
-            suggestion="Use only lowercase letters, numbers, hyphens, underscores, and dots",
+            suggestion=_SLUG_CHARS_SUGGESTION,
         )
 
     return workspace
 
 
+def _is_valid_email(email: str) -> bool:
+    """
+    Check an email address against the basic 'local@domain.tld' shape.
+
+    Args:
+        email: The email address to check
+
+    Returns:
+        True if the email address is well formed, False otherwise
+    """
+    local, at, domain = email.partition("@")
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+
+    host, dot, tld = domain.rpartition(".")
+    if not dot or not host or not _EMAIL_DOMAIN_CHARS.issuperset(host):
+        return False
+
+    return len(tld) >= 2 and tld.isascii() and tld.isalpha()
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_email(email: str) -> str:
     """
     Validate an email address.
@@ -145,16 +251,16 @@ def validate_email(email: str) -> str:
         raise ValidationError("Email address cannot be empty")
 
     # Basic email validation
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_pattern, email):
+    if not _is_valid_email(email):
         raise ValidationError(
             f"'{email}' is not a valid email address",
-            suggestion="Use a valid email format like 'user@example.com'",
+            suggestion=_EMAIL_SUGGESTION,
         )
 
-    return email.lower()
+    return email if email.islower() else email.lower()
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_user_identifier(user_id: str) -> str:
     """
     Validate a user identifier (email or account ID).
@@ -172,16 +278,32 @@ def validate_user_identifier(user_id: str) -> str:
         raise ValidationError("User identifier cannot be empty")
 
     # Check if it's a UUID (account ID)
-    uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    uuid_braces_pattern = r"^\{[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\}$"
-
-    if re.match(uuid_pattern, user_id.lower()) or re.match(uuid_braces_pattern, user_id.lower()):
-        return user_id.lower()
+    lowered = user_id if user_id.islower() else user_id.lower()
+    if _is_uuid(lowered):
+        return lowered
 
     # Otherwise, validate as email
     return validate_email(user_id)
 
 
+def validate_user_identifiers(user_ids: Iterable[str]) -> list[str]:
+    """
+    Validate many user identifiers (emails or account IDs) in one call.
+
+    Args:
+        user_ids: The user identifiers to validate
+
+    Returns:
+        The validated user identifiers, in input order
+
+    Raises:
+        ValidationError: On the first invalid user identifier
+    """
+    validate = validate_user_identifier
+    return [validate(user_id) for user_id in user_ids]
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_permission_level(permission: str) -> str:
     """
     Validate a repository permission level.
@@ -198,18 +320,19 @@ def validate_permission_level(permission: str) -> str:
     if not permission:
         raise ValidationError("Permission level cannot be empty")
 
-    permission = permission.lower()
-    valid_permissions = ["read", "write", "admin"]
+    if not permission.islower():
+        permission = permission.lower()
 
-    if permission not in valid_permissions:
+    if permission not in _VALID_PERMISSIONS:
         raise ValidationError(
             f"Invalid permission level '{permission}'",
-            suggestion=f"Use one of: {', '.join(valid_permissions)}",
+            suggestion=_PERMISSION_SUGGESTION,
         )
 
     return permission
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_branch_name(branch_name: str) -> str:
     """
     Validate a Git branch name.
@@ -226,34 +349,16 @@ def validate_branch_name(branch_name: str) -> str:
     if not branch_name:
         raise ValidationError("Branch name cannot be empty")
 
-    # Git branch name restrictions
-    invalid_patterns = [
-        r"\.\.",
-        r"@\{",
-        r"\\",
-        r"\s",
-        r"~",
-        r"\^",
-        r":",
-        r"\?",
-        r"\*",
-        r"\[",
-        r"\.lock$",
-        r"^\.",
-        r"/$",
-        r"/\.",
-    ]
-
-    for pattern in invalid_patterns:
-        if re.search(pattern, branch_name):
-            raise ValidationError(
-                f"Branch name '{branch_name}' contains invalid characters or patterns",
-                suggestion="Use alphanumeric characters, hyphens, and forward slashes",
-            )
+    if _BRANCH_INVALID_RE.search(branch_name):
+        raise ValidationError(
+            f"Branch name '{branch_name}' contains invalid characters or patterns",
+            suggestion=_BRANCH_NAME_SUGGESTION,
+        )
 
     return branch_name
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_non_empty_string(value: str, field_name: str) -> str:
     """
     Validate that a string is not empty.
@@ -268,7 +373,8 @@ def validate_non_empty_string(value: str, field_name: str) -> str:
     Raises:
         ValidationError: If the string is empty
     """
-    if not value or not value.strip():
+    stripped = value.strip() if value else ""
+    if not stripped:
         raise ValidationError(f"{field_name} cannot be empty")
 
-    return value.strip()
+    return stripped
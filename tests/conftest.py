@@ -0,0 +1,111 @@
+"""
+Shared pytest fixtures for bbcli tests.
+"""
+
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from bbcli.core import api_client as api_client_module
+from bbcli.core.oauth_manager import OAuthApp
+from bbcli.utils.output import OutputFormatter
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create CLI runner; it keeps no state between invocations.
+
+    The environment marks the terminal as dumb and colorless so consoles created inside commands skip detection.
+    """
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+
+
+@pytest.fixture(scope="session")
+def cli_context_template():
+    """Create the console and formatter shared by every CLI test.
+
+    Terminal and color detection are pinned off since CliRunner captures the output anyway. The console
+    keeps its default file so it writes to whatever ``sys.stdout`` the runner has swapped in.
+    """
+    console = Console(force_terminal=False, color_system=None, width=80, legacy_windows=False)
+    formatter = OutputFormatter("text", console)
+    return {
+        "console": console,
+        "formatter": formatter,
+        "verbose": False,
+        "output_format": "text",
+    }
+
+
+@pytest.fixture
+def mock_context(cli_context_template):
+    """Create mock CLI context, copied so commands cannot leak keys into other tests."""
+    return dict(cli_context_template)
+
+
+@pytest.fixture
+def mock_auth_manager():
+    """Mock the API client auth manager with stored test credentials."""
+    auth_manager = Mock()
+    auth_manager.get_credentials.return_value = ("testuser", "testpass")
+    with patch.object(api_client_module, "AuthManager", return_value=auth_manager):
+        yield auth_manager
+
+
+@pytest.fixture
+def make_response():
+    """Factory for mocked requests.Response objects."""
+
+    def _make_response(
+        ok=True,
+        status_code=200,
+        json_data=None,
+        json_side_effect=None,
+        headers=None,
+        content=b"",
+        reason="",
+    ):
+        response = Mock()
+        response.ok = ok
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = content
+        response.reason = reason
+        response.json.return_value = {} if json_data is None else json_data
+        response.json.side_effect = json_side_effect
+        return response
+
+    return _make_response
+
+
+@pytest.fixture(scope="session")
+def oauth_app():
+    """Create the OAuth app shared read-only by the OAuth manager and auth CLI tests."""
+    return OAuthApp(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        redirect_uri="http://localhost:8080/callback",
+        scopes="repository account",
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_temp_root():
+    """Create one temporary directory for the whole session, removed in a single pass at the end."""
+    root = Path(tempfile.mkdtemp(prefix="bbcli_tests_"))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def temp_dir(shared_temp_root):
+    """Create a fresh per-test directory under the shared temporary root."""
+    path = shared_temp_root / uuid.uuid4().hex
+    path.mkdir()
+    return path
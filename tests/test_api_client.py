@@ -2,206 +2,209 @@
 Tests for API client functionality.
 """
 
-import base64
-import os
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
+from bbcli.core import api_client as api_client_module
 from bbcli.core.api_client import BitbucketAPIClient
 from bbcli.core.exceptions import APIError, AuthenticationError
 
+# Environment variables the client reads credentials from
+_CREDENTIAL_ENV_VARS = ("BBCLI_USERNAME", "BBCLI_PASSWORD", "BBCLI_OAUTH_TOKEN")
 
-class TestBitbucketAPIClient:
-    """Test cases for BitbucketAPIClient class."""
+# Authorization headers expected on the wire: Basic Auth for "testuser:testpass" and
+# "user:pass" (base64-encoded), and the OAuth test token
+_BASIC_TESTUSER_HEADER = "Basic dGVzdHVzZXI6dGVzdHBhc3M="
+_BASIC_HEADER = "Basic dXNlcjpwYXNz"
+_BEARER_HEADER = "Bearer test_oauth_token"
 
-    @pytest.fixture
-    def mock_auth_manager(self):
-        """Mock auth manager."""
-        with patch("bbcli.core.api_client.AuthManager") as mock:
-            mock_instance = mock.return_value
-            mock_instance.get_credentials.return_value = ("testuser", "testpass")
-            yield mock_instance
-
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration."""
-        with patch("bbcli.core.api_client.get_config") as mock:
-            config = mock.return_value
-            config.get.side_effect = lambda key, default=None: {
-                "api.base_url": "https://api.bitbucket.org/2.0",
-                "api.timeout": 30,
-                "api.max_retries": 3,
-            }.get(key, default)
-            yield config
-
-    @pytest.fixture
-    def api_client(self, mock_auth_manager):
-        """Create API client instance."""
-        return BitbucketAPIClient()
+# API client configuration values served by the config stub
+_CONFIG_MAP = {
+    "api.base_url": "https://api.bitbucket.org/2.0",
+    "api.timeout": 30,
+    "api.max_retries": 3,
+}
 
-    def test_initialization(self, api_client):
-        """Test API client initialization."""
-        assert api_client.base_url == "https://api.bitbucket.org/2.0"
-        assert api_client.timeout == 30
-        assert api_client.max_retries == 3
-        # Verify credentials are available through the new method
-        assert api_client.has_credentials() is True
-        credentials = api_client._get_credentials()
-        assert credentials == ("testuser", "testpass")
 
-    @patch("requests.Session.request")
-    def test_successful_get_request(self, mock_request, api_client):
-        """Test successful GET request."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "value"}
-        mock_request.return_value = mock_response
+def _patch_client_environment():
+    """Stub the client's config and OAuth storage so no test reads the real config directory or keyring."""
+    return patch.multiple(
+        api_client_module,
+        get_config=Mock(return_value=SimpleNamespace(get=_CONFIG_MAP.get)),
+        OAuthStorage=Mock(return_value=SimpleNamespace(get_valid_token=lambda: None)),
+    )
 
-        result = api_client.get("/test")
 
-        assert result == {"key": "value"}
-        mock_request.assert_called_once()
+def _stub_response(json_data=None):
+    """A successful response stub for tests that never inspect calls made on the response."""
+    body = {} if json_data is None else json_data
+    return SimpleNamespace(ok=True, status_code=200, headers={}, content=b"", reason="OK", json=lambda: body)
 
-    @patch("requests.Session.request")
-    def test_authentication_error(self, mock_request, api_client):
-        """Test handling of authentication errors."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
 
-        with pytest.raises(AuthenticationError):
-            api_client.get("/test")
+@pytest.fixture(autouse=True)
+def mock_session_request(monkeypatch):
+    """Replace requests.Session.request with a mock for every test in this module."""
+    mock = Mock()
+    monkeypatch.setattr("requests.sessions.Session.request", mock)
+    return mock
 
-    @patch("requests.Session.request")
-    def test_rate_limit_error(self, mock_request, api_client):
-        """Test handling of rate limit errors."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "60"}
-        mock_request.return_value = mock_response
 
-        with pytest.raises(APIError) as exc_info:
-            api_client.get("/test")
+@pytest.fixture(autouse=True)
+def client_environment():
+    """Stub config and OAuth storage for clients built inside each test."""
+    with _patch_client_environment():
+        yield
 
-        assert "Rate limit exceeded" in str(exc_info.value)
-        assert exc_info.value.status_code == 429
 
-    @patch("requests.Session.request")
-    def test_api_error_with_json_response(self, mock_request, api_client):
-        """Test handling of API errors with JSON error response."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"error": {"message": "Invalid request"}}
-        mock_request.return_value = mock_response
+@pytest.fixture(scope="module")
+def shared_client():
+    """Build one API client per module so its requests.Session and adapters are reused."""
+    with _patch_client_environment(), patch.object(api_client_module, "AuthManager"):
+        return BitbucketAPIClient()
 
-        with pytest.raises(APIError) as exc_info:
-            api_client.get("/test")
 
-        assert "Invalid request" in str(exc_info.value)
-        assert exc_info.value.status_code == 400
+@pytest.fixture
+def api_client(shared_client, mock_auth_manager, monkeypatch):
+    """Return the shared API client, reset to stored test credentials for this test."""
+    monkeypatch.setattr(shared_client, "auth_manager", mock_auth_manager)
+    monkeypatch.setattr(shared_client, "_provided_username", None)
+    monkeypatch.setattr(shared_client, "_provided_password", None)
+    monkeypatch.setattr(shared_client, "_provided_oauth_token", None)
+    monkeypatch.setattr(shared_client, "_prefer_oauth", True)
+    return shared_client
 
-    @patch("requests.Session.request")
-    def test_api_error_without_json_response(self, mock_request, api_client):
-        """Test handling of API errors without JSON error response."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 500
-        mock_response.reason = "Internal Server Error"
-        mock_response.json.side_effect = ValueError("No JSON")
-        mock_request.return_value = mock_response
 
-        with pytest.raises(APIError) as exc_info:
-            api_client.get("/test")
+@pytest.fixture(scope="module")
+def mock_401():
+    """A 401 Unauthorized response shared by the authentication error tests."""
+    response = Mock()
+    response.ok = False
+    response.status_code = 401
+    response.json.side_effect = ValueError("No JSON")
+    return response
 
-        assert "HTTP 500: Internal Server Error" in str(exc_info.value)
 
-    @patch("requests.Session.request")
-    def test_timeout_error(self, mock_request, api_client):
-        """Test handling of timeout errors."""
-        mock_request.side_effect = requests.exceptions.Timeout()
+class TestBitbucketAPIClient:
+    """Test cases for BitbucketAPIClient class."""
 
-        with pytest.raises(APIError) as exc_info:
-            api_client.get("/test")
+    def test_initialization(self, api_client):
+        """Test API client initialization."""
+        assert api_client.base_url == "https://api.bitbucket.org/2.0"
+        assert api_client.timeout == 30
+        assert api_client.max_retries == 3
+        # Verify credentials are available through the new method
+        assert api_client.has_credentials() is True
+        credentials = api_client._get_credentials()
+        assert credentials == ("testuser", "testpass")
 
-        assert "timed out" in str(exc_info.value)
+    def test_successful_get_request(self, mock_session_request, api_client):
+        """Test successful GET request."""
+        mock_session_request.return_value = _stub_response(json_data={"key": "value"})
 
-    @patch("requests.Session.request")
-    def test_connection_error(self, mock_request, api_client):
-        """Test handling of connection errors."""
-        mock_request.side_effect = requests.exceptions.ConnectionError()
+        result = api_client.get("/test")
 
-        with pytest.raises(APIError) as exc_info:
+        assert result == {"key": "value"}
+        mock_session_request.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "response_kwargs,request_error,expected_error,expected_message,expected_status",
+        [
+            ({"ok": False, "status_code": 401}, None, AuthenticationError, "Authentication failed", None),
+            (
+                {"ok": False, "status_code": 429, "headers": {"Retry-After": "60"}},
+                None,
+                APIError,
+                "Rate limit exceeded",
+                429,
+            ),
+            (
+                {"ok": False, "status_code": 400, "json_data": {"error": {"message": "Invalid request"}}},
+                None,
+                APIError,
+                "Invalid request",
+                400,
+            ),
+            (
+                {
+                    "ok": False,
+                    "status_code": 500,
+                    "reason": "Internal Server Error",
+                    "json_side_effect": ValueError("No JSON"),
+                },
+                None,
+                APIError,
+                "HTTP 500: Internal Server Error",
+                500,
+            ),
+            (None, requests.exceptions.Timeout(), APIError, "timed out", None),
+            (None, requests.exceptions.ConnectionError(), APIError, "Failed to connect", None),
+        ],
+        ids=["unauthorized", "rate_limited", "json_error", "non_json_error", "timeout", "connection_error"],
+    )
+    def test_request_errors(
+        self,
+        response_kwargs,
+        request_error,
+        expected_error,
+        expected_message,
+        expected_status,
+        mock_session_request,
+        make_response,
+        api_client,
+    ):
+        """Test handling of HTTP error responses and transport failures."""
+        if request_error is not None:
+            mock_session_request.side_effect = request_error
+        else:
+            mock_session_request.return_value = make_response(**response_kwargs)
+
+        with pytest.raises(expected_error) as exc_info:
             api_client.get("/test")
 
-        assert "Failed to connect" in str(exc_info.value)
+        assert expected_message in str(exc_info.value)
+        if expected_status is not None:
+            assert exc_info.value.status_code == expected_status
 
-    @patch("requests.Session.request")
-    def test_post_request_with_json_data(self, mock_request, api_client):
+    def test_post_request_with_json_data(self, mock_session_request, api_client):
         """Test POST request with JSON data."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"created": True}
-        mock_request.return_value = mock_response
+        mock_session_request.return_value = _stub_response(json_data={"created": True})
 
         result = api_client.post("/test", json_data={"name": "test"})
 
         assert result == {"created": True}
-        args, kwargs = mock_request.call_args
+        args, kwargs = mock_session_request.call_args
         assert kwargs["json"] == {"name": "test"}
 
-    @patch("requests.Session.request")
-    def test_delete_request(self, mock_request, api_client):
+    def test_delete_request(self, mock_session_request, api_client):
         """Test DELETE request."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.content = b""
-        mock_request.return_value = mock_response
+        mock_session_request.return_value = _stub_response()
 
         result = api_client.delete("/test")
 
         assert result is None
-        args, kwargs = mock_request.call_args
+        args, kwargs = mock_session_request.call_args
         assert kwargs["method"] == "DELETE"
 
-    @patch("requests.Session.request")
-    def test_test_authentication_success(self, mock_request, api_client):
+    def test_test_authentication_success(self, mock_session_request, api_client):
         """Test successful authentication test."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"username": "testuser"}
-        mock_request.return_value = mock_response
+        mock_session_request.return_value = _stub_response(json_data={"username": "testuser"})
 
         result = api_client.test_authentication()
 
         assert result == {"username": "testuser"}
-        _, kwargs = mock_request.call_args
+        _, kwargs = mock_session_request.call_args
         assert "/user" in kwargs["url"]
 
 
 class TestBitbucketAPIClientAuthentication:
     """Test cases for authentication functionality."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration."""
-        with patch("bbcli.core.api_client.get_config") as mock:
-            config = mock.return_value
-            config.get.side_effect = lambda key, default=None: {
-                "api.base_url": "https://api.bitbucket.org/2.0",
-                "api.timeout": 30,
-                "api.max_retries": 3,
-            }.get(key, default)
-            yield config
-
     def test_initialization_with_credentials(self):
         """Test API client initialization with provided credentials."""
-        with patch("bbcli.core.api_client.AuthManager"):
+        with patch.object(api_client_module, "AuthManager"):
             client = BitbucketAPIClient(username="testuser", password="testpass")
             assert client._provided_username == "testuser"
             assert client._provided_password == "testpass"
@@ -210,68 +213,55 @@ class TestBitbucketAPIClientAuthentication:
             credentials = client._get_credentials()
             assert credentials == ("testuser", "testpass")
 
-    def test_get_credentials_priority_constructor(self):
-        """Test credential priority: constructor parameters first."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = (
-                "stored_user",
-                "stored_pass",
-            )
-
-            with patch.dict(os.environ, {"BBCLI_USERNAME": "env_user", "BBCLI_PASSWORD": "env_pass"}):
-                client = BitbucketAPIClient(username="param_user", password="param_pass")
-                credentials = client._get_credentials()
-                assert credentials == ("param_user", "param_pass")
-
-    def test_get_credentials_priority_environment(self):
-        """Test credential priority: environment variables second."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = (
-                "stored_user",
-                "stored_pass",
-            )
-
-            with patch.dict(os.environ, {"BBCLI_USERNAME": "env_user", "BBCLI_PASSWORD": "env_pass"}):
-                client = BitbucketAPIClient()
-                credentials = client._get_credentials()
-                assert credentials == ("env_user", "env_pass")
-
-    def test_get_credentials_priority_stored(self):
-        """Test credential priority: stored credentials last."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = (
-                "stored_user",
-                "stored_pass",
-            )
-
-            with patch.dict(os.environ, {}, clear=True):
-                client = BitbucketAPIClient()
-                credentials = client._get_credentials()
-                assert credentials == ("stored_user", "stored_pass")
-
-    def test_get_credentials_none_available(self):
-        """Test when no credentials are available."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            with patch.dict(os.environ, {}, clear=True):
-                client = BitbucketAPIClient()
-                credentials = client._get_credentials()
-                assert credentials is None
+    @pytest.mark.parametrize(
+        "client_kwargs,env,stored,expected",
+        [
+            # Constructor parameters first
+            (
+                {"username": "param_user", "password": "param_pass"},
+                {"BBCLI_USERNAME": "env_user", "BBCLI_PASSWORD": "env_pass"},
+                ("stored_user", "stored_pass"),
+                ("param_user", "param_pass"),
+            ),
+            # Environment variables second
+            (
+                {},
+                {"BBCLI_USERNAME": "env_user", "BBCLI_PASSWORD": "env_pass"},
+                ("stored_user", "stored_pass"),
+                ("env_user", "env_pass"),
+            ),
+            # Stored credentials last
+            ({}, {}, ("stored_user", "stored_pass"), ("stored_user", "stored_pass")),
+            # Nothing available
+            ({}, {}, None, None),
+        ],
+        ids=["constructor", "environment", "stored", "none_available"],
+    )
+    def test_get_credentials_priority(self, client_kwargs, env, stored, expected, monkeypatch):
+        """Test credential priority: constructor, then environment, then stored credentials."""
+        for name in _CREDENTIAL_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
+            mock_auth.return_value.get_credentials.return_value = stored
+
+            client = BitbucketAPIClient(**client_kwargs)
+            assert client._get_credentials() == expected
 
     def test_create_basic_auth_header(self):
         """Test Basic Auth header creation."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = None
             client = BitbucketAPIClient()
             header = client._create_basic_auth_header("testuser", "testpass")
 
-            expected = base64.b64encode(b"testuser:testpass").decode("ascii")
-            assert header == f"Basic {expected}"
+            assert header == _BASIC_TESTUSER_HEADER
 
     def test_has_credentials_true(self):
         """Test has_credentials returns True when credentials exist."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = ("user", "pass")
 
             client = BitbucketAPIClient()
@@ -279,7 +269,7 @@ class TestBitbucketAPIClientAuthentication:
 
     def test_has_credentials_false(self):
         """Test has_credentials returns False when no credentials exist."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = None
 
             client = BitbucketAPIClient()
@@ -287,155 +277,117 @@ class TestBitbucketAPIClientAuthentication:
 
     def test_get_auth_header_with_credentials(self):
         """Test get_auth_header returns header when credentials exist."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = ("user", "pass")
 
             client = BitbucketAPIClient()
             header = client.get_auth_header()
 
-            expected = base64.b64encode(b"user:pass").decode("ascii")
-            assert header == f"Basic {expected}"
+            assert header == _BASIC_HEADER
 
     def test_get_auth_header_without_credentials(self):
         """Test get_auth_header returns None when no credentials exist."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = None
 
             client = BitbucketAPIClient()
             header = client.get_auth_header()
             assert header is None
 
-    @patch("requests.Session.request")
-    def test_validate_credentials_success(self, mock_request):
+    def test_validate_credentials_success(self, mock_session_request):
         """Test validate_credentials returns True for valid credentials."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = ("user", "pass")
 
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"username": "user"}
-            mock_request.return_value = mock_response
+            mock_session_request.return_value = _stub_response(json_data={"username": "user"})
 
             client = BitbucketAPIClient()
             assert client.validate_credentials() is True
 
-    @patch("requests.Session.request")
-    def test_validate_credentials_auth_failure(self, mock_request):
+    def test_validate_credentials_auth_failure(self, mock_session_request, make_response):
         """Test validate_credentials returns False for invalid credentials."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = ("user", "pass")
 
-            mock_response = Mock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
+            mock_session_request.return_value = make_response(ok=False, status_code=401)
 
             client = BitbucketAPIClient()
             assert client.validate_credentials() is False
 
     def test_validate_credentials_no_credentials(self):
         """Test validate_credentials returns False when no credentials exist."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = None
 
             client = BitbucketAPIClient()
             assert client.validate_credentials() is False
 
-    @patch("requests.Session.request")
-    def test_enhanced_auth_error_no_credentials(self, mock_request):
-        """Test enhanced authentication error message when no credentials found."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            mock_response = Mock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
-
-            client = BitbucketAPIClient()
-
-            with pytest.raises(AuthenticationError) as exc_info:
-                client.get("/test")
-
-            assert "No authentication credentials found" in str(exc_info.value)
-            assert "bbcli auth login" in exc_info.value.suggestion
-
-    @patch("requests.Session.request")
-    def test_enhanced_auth_error_provided_credentials(self, mock_request):
-        """Test enhanced authentication error message for provided credentials."""
-        with patch("bbcli.core.api_client.AuthManager"):
-            mock_response = Mock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
-
-            client = BitbucketAPIClient(username="user", password="pass")
+    @pytest.mark.parametrize(
+        "client_kwargs,env,stored,expected_message,expected_suggestion",
+        [
+            ({}, {}, None, "No authentication credentials found", "bbcli auth login"),
+            (
+                {"username": "user", "password": "pass"},
+                {},
+                None,
+                "Authentication failed with provided credentials",
+                "Check your username and password",
+            ),
+            (
+                {},
+                {"BBCLI_USERNAME": "user", "BBCLI_PASSWORD": "pass"},
+                None,
+                "Authentication failed with environment variable credentials",
+                "BBCLI_USERNAME and BBCLI_PASSWORD",
+            ),
+            ({}, {}, ("user", "pass"), "Authentication failed with stored credentials", "bbcli auth login"),
+        ],
+        ids=["no_credentials", "provided_credentials", "environment_credentials", "stored_credentials"],
+    )
+    def test_enhanced_auth_error(
+        self,
+        client_kwargs,
+        env,
+        stored,
+        expected_message,
+        expected_suggestion,
+        mock_401,
+        mock_session_request,
+        monkeypatch,
+    ):
+        """Test enhanced authentication error messages for each credential source."""
+        for name in _CREDENTIAL_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        mock_session_request.return_value = mock_401
+
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
+            mock_auth.return_value.get_credentials.return_value = stored
+
+            client = BitbucketAPIClient(**client_kwargs)
 
             with pytest.raises(AuthenticationError) as exc_info:
                 client.get("/test")
 
-            assert "Authentication failed with provided credentials" in str(exc_info.value)
-            assert "Check your username and password" in exc_info.value.suggestion
-
-    @patch("requests.Session.request")
-    def test_enhanced_auth_error_environment_credentials(self, mock_request):
-        """Test enhanced authentication error message for environment credentials."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            mock_response = Mock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
-
-            with patch.dict(os.environ, {"BBCLI_USERNAME": "user", "BBCLI_PASSWORD": "pass"}):
-                client = BitbucketAPIClient()
-
-                with pytest.raises(AuthenticationError) as exc_info:
-                    client.get("/test")
-
-                assert "Authentication failed with environment variable credentials" in str(exc_info.value)
-                assert "BBCLI_USERNAME and BBCLI_PASSWORD" in exc_info.value.suggestion
+            assert expected_message in str(exc_info.value)
+            assert expected_suggestion in exc_info.value.suggestion
 
-    @patch("requests.Session.request")
-    def test_enhanced_auth_error_stored_credentials(self, mock_request):
-        """Test enhanced authentication error message for stored credentials."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = ("user", "pass")
-
-            mock_response = Mock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
-
-            with patch.dict(os.environ, {}, clear=True):
-                client = BitbucketAPIClient()
-
-                with pytest.raises(AuthenticationError) as exc_info:
-                    client.get("/test")
-
-                assert "Authentication failed with stored credentials" in str(exc_info.value)
-                assert "bbcli auth login" in exc_info.value.suggestion
-
-    @patch("requests.Session.request")
-    def test_authorization_header_added_to_request(self, mock_request):
+    def test_authorization_header_added_to_request(self, mock_session_request):
         """Test that Authorization header is explicitly added to requests."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = (
                 "testuser",
                 "testpass",
             )
 
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"result": "success"}
-            mock_request.return_value = mock_response
+            mock_session_request.return_value = _stub_response(json_data={"result": "success"})
 
             client = BitbucketAPIClient()
             client.get("/test")
 
             # Verify the request was called with Authorization header
-            _, kwargs = mock_request.call_args
+            _, kwargs = mock_session_request.call_args
             headers = kwargs["headers"]
 
             # Check that Authorization header is present
@@ -446,158 +398,73 @@ class TestBitbucketAPIClientAuthentication:
             assert auth_header.startswith("Basic ")
 
             # Verify the encoded credentials are correct
-            expected_credentials = base64.b64encode(b"testuser:testpass").decode("ascii")
-            expected_header = f"Basic {expected_credentials}"
-            assert auth_header == expected_header
+            assert auth_header == _BASIC_TESTUSER_HEADER
 
-    @patch("requests.Session.request")
-    def test_no_authorization_header_without_credentials(self, mock_request):
+    def test_no_authorization_header_without_credentials(self, mock_session_request):
         """Test that no Authorization header is added when no credentials are available."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
             mock_auth.return_value.get_credentials.return_value = None
 
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"result": "success"}
-            mock_request.return_value = mock_response
+            mock_session_request.return_value = _stub_response(json_data={"result": "success"})
 
             client = BitbucketAPIClient()
             client.get("/test")
 
             # Verify the request was called without Authorization header
-            _, kwargs = mock_request.call_args
+            _, kwargs = mock_session_request.call_args
             headers = kwargs["headers"]
 
             # Check that Authorization header is not present
             assert "Authorization" not in headers
 
-    @patch("requests.Session.request")
-    def test_oauth_bearer_token_authentication(self, mock_request):
-        """Test that OAuth Bearer token is used when provided."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"result": "success"}
-            mock_request.return_value = mock_response
-
-            # Create client with OAuth token
-            client = BitbucketAPIClient(oauth_token="test_oauth_token")
-            client.get("/test")
-
-            # Verify the request was called with Bearer token
-            _, kwargs = mock_request.call_args
-            headers = kwargs["headers"]
-
-            assert "Authorization" in headers
-            auth_header = headers["Authorization"]
-            assert auth_header == "Bearer test_oauth_token"
-
-    @patch("requests.Session.request")
-    def test_oauth_preference_over_basic_auth(self, mock_request):
-        """Test that OAuth is preferred over Basic Auth when both are available."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = ("user", "pass")
-
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"result": "success"}
-            mock_request.return_value = mock_response
-
-            # Create client with both OAuth token and Basic Auth credentials
-            client = BitbucketAPIClient(
-                username="user",
-                password="pass",
-                oauth_token="test_oauth_token",
-                prefer_oauth=True,
-            )
-            client.get("/test")
-
-            # Verify OAuth Bearer token is used instead of Basic Auth
-            _, kwargs = mock_request.call_args
-            headers = kwargs["headers"]
-
-            assert "Authorization" in headers
-            auth_header = headers["Authorization"]
-            assert auth_header == "Bearer test_oauth_token"
-            assert not auth_header.startswith("Basic ")
-
-    @patch("requests.Session.request")
-    def test_basic_auth_when_oauth_disabled(self, mock_request):
-        """Test that Basic Auth is used when OAuth is disabled."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = ("user", "pass")
-
-            mock_response = Mock()
-            mock_response.ok = True
-            mock_response.json.return_value = {"result": "success"}
-            mock_request.return_value = mock_response
-
-            # Create client with OAuth disabled
-            client = BitbucketAPIClient(
-                username="user",
-                password="pass",
-                oauth_token="test_oauth_token",
-                prefer_oauth=False,
-            )
-            client.get("/test")
-
-            # Verify Basic Auth is used instead of OAuth
-            _, kwargs = mock_request.call_args
-            headers = kwargs["headers"]
-
-            assert "Authorization" in headers
-            auth_header = headers["Authorization"]
-            assert auth_header.startswith("Basic ")
-            assert not auth_header.startswith("Bearer ")
+    @pytest.mark.parametrize(
+        "basic_creds,oauth_token,prefer_oauth,expected_header,expected_using_oauth",
+        [
+            (None, None, True, None, False),
+            (None, None, False, None, False),
+            (None, "test_oauth_token", True, _BEARER_HEADER, True),
+            (None, "test_oauth_token", False, None, False),
+            (("user", "pass"), None, True, _BASIC_HEADER, False),
+            (("user", "pass"), None, False, _BASIC_HEADER, False),
+            (("user", "pass"), "test_oauth_token", True, _BEARER_HEADER, True),
+            (("user", "pass"), "test_oauth_token", False, _BASIC_HEADER, False),
+        ],
+    )
+    def test_auth_header_matrix(
+        self,
+        basic_creds,
+        oauth_token,
+        prefer_oauth,
+        expected_header,
+        expected_using_oauth,
+        mock_session_request,
+        monkeypatch,
+    ):
+        """Test OAuth vs Basic Auth selection across credential sources and preference."""
+        for name in _CREDENTIAL_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        username, password = basic_creds or (None, None)
+
+        with patch.object(api_client_module, "AuthManager") as mock_auth:
+            with patch.object(api_client_module, "OAuthStorage") as mock_storage:
+                mock_auth.return_value.get_credentials.return_value = None
+                mock_storage.return_value.get_valid_token.return_value = None
+
+                mock_session_request.return_value = _stub_response(json_data={"result": "success"})
+
+                client = BitbucketAPIClient(
+                    username=username,
+                    password=password,
+                    oauth_token=oauth_token,
+                    prefer_oauth=prefer_oauth,
+                )
+
+                assert client.has_oauth_token() is (oauth_token is not None)
+                assert client.is_using_oauth() is expected_using_oauth
+                assert client.has_credentials() is (basic_creds is not None or oauth_token is not None)
+                assert client.get_auth_header() == expected_header
 
-    def test_oauth_helper_methods(self):
-        """Test OAuth-related helper methods."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            # Test with OAuth token
-            client = BitbucketAPIClient(oauth_token="test_token")
-            assert client.has_oauth_token() is True
-            assert client.is_using_oauth() is True
-            assert client.has_credentials() is True
-
-            # Test without OAuth token
-            client = BitbucketAPIClient()
-            assert client.has_oauth_token() is False
-            assert client.is_using_oauth() is False
-
-    def test_get_auth_header_oauth(self):
-        """Test get_auth_header returns OAuth Bearer token when available."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = None
-
-            client = BitbucketAPIClient(oauth_token="test_token")
-            auth_header = client.get_auth_header()
-            assert auth_header == "Bearer test_token"
-
-    def test_get_auth_header_preference(self):
-        """Test get_auth_header respects OAuth preference."""
-        with patch("bbcli.core.api_client.AuthManager") as mock_auth:
-            mock_auth.return_value.get_credentials.return_value = ("user", "pass")
+                client.get("/test")
 
-            # Test OAuth preferred
-            client = BitbucketAPIClient(
-                username="user",
-                password="pass",
-                oauth_token="test_token",
-                prefer_oauth=True,
-            )
-            auth_header = client.get_auth_header()
-            assert auth_header == "Bearer test_token"
-
-            # Test Basic Auth preferred
-            client = BitbucketAPIClient(
-                username="user",
-                password="pass",
-                oauth_token="test_token",
-                prefer_oauth=False,
-            )
-            auth_header = client.get_auth_header()
-            assert auth_header.startswith("Basic ")
+                _, kwargs = mock_session_request.call_args
+                assert kwargs["headers"].get("Authorization") == expected_header
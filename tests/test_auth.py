@@ -2,14 +2,57 @@
 Tests for authentication functionality.
 """
 
+import shutil
 from unittest.mock import patch
 
+import keyring
 import pytest
 
 from bbcli.core.auth_manager import AuthManager
 from bbcli.core.exceptions import AuthenticationError
 
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_keyring():
+    """Replace the keyring module used by AuthManager so no test touches the OS keyring."""
+    with patch("bbcli.core.auth_manager.keyring") as mock:
+        mock.errors = keyring.errors
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def reset_keyring(mock_keyring):
+    """Clear keyring call history and behaviour between tests."""
+    mock_keyring.reset_mock(return_value=True, side_effect=True)
+    mock_keyring.get_password.return_value = "test"
+
+
+@pytest.fixture(scope="module")
+def keyring_auth_manager(mock_keyring, tmp_path_factory):
+    """An AuthManager backed by the mocked keyring, shared by the keyring tests."""
+    config_dir = tmp_path_factory.mktemp("bbcli_keyring")
+    with patch("bbcli.core.auth_manager.get_config") as mock_config:
+        mock_config.return_value.config_dir = config_dir
+        auth_manager = AuthManager()
+    auth_manager._keyring_available = True
+    return auth_manager
+
+
+@pytest.fixture(scope="session")
+def encrypted_credentials_template(tmp_path_factory):
+    """Encrypt test credentials under the master password 'masterpass' once per session."""
+    config_dir = tmp_path_factory.mktemp("bbcli_template")
+    with patch("bbcli.core.auth_manager.get_config") as mock_config:
+        mock_config.return_value.config_dir = config_dir
+        auth_manager = AuthManager()
+    auth_manager._keyring_available = False
+
+    with patch("getpass.getpass", return_value="masterpass"):
+        auth_manager.store_credentials("testuser", "testpass")
+
+    return auth_manager.credentials_file
+
+
 class TestAuthManager:
     """Test cases for AuthManager class."""
 
@@ -30,51 +73,38 @@ class TestAuthManager:
             auth_manager.credentials_file = temp_config_dir / "credentials.enc"
             return auth_manager
 
-    def test_keyring_availability_check(self, auth_manager):
+    def test_keyring_availability_check(self, auth_manager, mock_keyring):
         """Test keyring availability checking."""
-        with (
-            patch("keyring.set_password"),
-            patch("keyring.get_password", return_value="test"),
-            patch("keyring.delete_password"),
-        ):
-            assert auth_manager._check_keyring_availability() is True
-
-        with patch("keyring.set_password", side_effect=Exception("No keyring")):
-            assert auth_manager._check_keyring_availability() is False
-
-    @patch("keyring.set_password")
-    @patch("keyring.get_password")
-    def test_store_credentials_keyring(self, mock_get, mock_set, auth_manager):
-        """Test storing credentials using system keyring."""
-        auth_manager._keyring_available = True
+        assert auth_manager._check_keyring_availability() is True
 
-        auth_manager.store_credentials("testuser", "testpass")
+        mock_keyring.set_password.side_effect = Exception("No keyring")
+        assert auth_manager._check_keyring_availability() is False
+
+    def test_store_credentials_keyring(self, keyring_auth_manager, mock_keyring):
+        """Test storing credentials using system keyring."""
+        keyring_auth_manager.store_credentials("testuser", "testpass")
 
-        assert mock_set.call_count == 2
-        mock_set.assert_any_call(AuthManager.SERVICE_NAME, AuthManager.USERNAME_KEY, "testuser")
-        mock_set.assert_any_call(AuthManager.SERVICE_NAME, AuthManager.APP_SECRET_KEY, "testpass")
+        assert mock_keyring.set_password.call_count == 2
+        mock_keyring.set_password.assert_any_call(AuthManager.SERVICE_NAME, AuthManager.USERNAME_KEY, "testuser")
+        mock_keyring.set_password.assert_any_call(AuthManager.SERVICE_NAME, AuthManager.APP_SECRET_KEY, "testpass")
 
-    @patch("keyring.get_password")
-    def test_get_credentials_keyring(self, mock_get, auth_manager):
+    def test_get_credentials_keyring(self, keyring_auth_manager, mock_keyring):
         """Test retrieving credentials from system keyring."""
-        auth_manager._keyring_available = True
-        mock_get.side_effect = ["testuser", "testpass"]
+        mock_keyring.get_password.side_effect = ["testuser", "testpass"]
 
-        credentials = auth_manager.get_credentials()
+        credentials = keyring_auth_manager.get_credentials()
 
         assert credentials == ("testuser", "testpass")
-        assert mock_get.call_count == 2
+        assert mock_keyring.get_password.call_count == 2
 
-    @patch("keyring.delete_password")
-    def test_delete_credentials_keyring(self, mock_delete, auth_manager):
+    def test_delete_credentials_keyring(self, keyring_auth_manager, mock_keyring):
         """Test deleting credentials from system keyring."""
-        auth_manager._keyring_available = True
-
-        result = auth_manager.delete_credentials()
+        result = keyring_auth_manager.delete_credentials()
 
         assert result is True
-        assert mock_delete.call_count == 2
+        assert mock_keyring.delete_password.call_count == 2
 
+    @pytest.mark.slow
     @patch("getpass.getpass", return_value="masterpass")
     def test_store_credentials_encrypted_file(self, mock_getpass, auth_manager):
         """Test storing credentials in encrypted file."""
@@ -85,29 +115,24 @@ class TestAuthManager:
         assert auth_manager.credentials_file.exists()
         assert auth_manager.credentials_file.stat().st_mode & 0o777 == 0o600
 
+    @pytest.mark.slow
     @patch("getpass.getpass", return_value="masterpass")
-    def test_get_credentials_encrypted_file(self, mock_getpass, auth_manager):
+    def test_get_credentials_encrypted_file(self, mock_getpass, auth_manager, encrypted_credentials_template):
         """Test retrieving credentials from encrypted file."""
         auth_manager._keyring_available = False
+        shutil.copy(encrypted_credentials_template, auth_manager.credentials_file)
 
-        # First store credentials
-        auth_manager.store_credentials("testuser", "testpass")
-
-        # Then retrieve them
         credentials = auth_manager.get_credentials()
 
         assert credentials == ("testuser", "testpass")
 
+    @pytest.mark.slow
     @patch("getpass.getpass", return_value="wrongpass")
-    def test_get_credentials_wrong_password(self, mock_getpass, auth_manager):
+    def test_get_credentials_wrong_password(self, mock_getpass, auth_manager, encrypted_credentials_template):
         """Test retrieving credentials with wrong master password."""
         auth_manager._keyring_available = False
+        shutil.copy(encrypted_credentials_template, auth_manager.credentials_file)
 
-        # Store with one password
-        with patch("getpass.getpass", return_value="correctpass"):
-            auth_manager.store_credentials("testuser", "testpass")
-
-        # Try to retrieve with wrong password
         with pytest.raises(AuthenticationError):
             auth_manager.get_credentials()
 
@@ -2,126 +2,212 @@
 Tests for AuthManager encryption methods used by OAuth storage.
 """
 
-import tempfile
-from pathlib import Path
+import base64
+import hashlib
 from unittest.mock import patch
 
 import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-from bbcli.core.auth_manager import AuthManager
+from bbcli.core.auth_manager import AuthManager, clear_sessions
 from bbcli.core.exceptions import AuthenticationError
+from bbcli.main import cli
+
+
+class PasswordPrompt:
+    """Master password provider that records the prompts it answers."""
+
+    def __init__(self) -> None:
+        self.password = "test_password"  # noqa: S105
+        self.prompts: list[str] = []
+
+    def __call__(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return self.password
 
 
 class TestAuthManagerEncryption:
     """Test cases for AuthManager encryption methods."""
 
     @pytest.fixture
-    def temp_config_dir(self):
+    def temp_config_dir(self, temp_dir):
         """Create a temporary config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return temp_dir
+
+    @pytest.fixture
+    def password_prompt(self):
+        """Provide the master password without patching getpass."""
+        return PasswordPrompt()
 
     @pytest.fixture
-    def auth_manager(self, temp_config_dir):
+    def auth_manager(self, temp_config_dir, password_prompt):
         """Create AuthManager instance with temporary directory."""
         with patch("bbcli.core.auth_manager.get_config") as mock_config:
             mock_config.return_value.config_dir = temp_config_dir
-            manager = AuthManager()
+            manager = AuthManager(password_provider=password_prompt)
             manager.config_dir = temp_config_dir
             manager.credentials_file = temp_config_dir / "credentials.enc"
             yield manager
 
-    def test_encrypt_decrypt_data_roundtrip(self, auth_manager):
+    def test_encrypt_decrypt_data_roundtrip(self, auth_manager, password_prompt):
         """Test that data can be encrypted and then decrypted successfully."""
         test_data = '{"test": "data", "number": 123, "boolean": true}'
 
-        # Mock getpass to provide consistent password
-        with patch("getpass.getpass", side_effect=["test_password", "test_password"]):
-            # Encrypt the data
-            encrypted_data = auth_manager._encrypt_data(test_data)
+        password_prompt.password = "test_password"
+        # Encrypt the data
+        encrypted_data = auth_manager._encrypt_data(test_data)
 
-            # Verify it's actually encrypted (different from original)
-            assert encrypted_data != test_data.encode()
-            assert isinstance(encrypted_data, bytes)
+        # Verify it's actually encrypted (different from original)
+        assert encrypted_data != test_data.encode()
+        assert isinstance(encrypted_data, bytes)
 
-            # Decrypt the data
-            decrypted_data = auth_manager._decrypt_data(encrypted_data)
+        # Decrypt the data
+        decrypted_data = auth_manager._decrypt_data(encrypted_data)
 
-            # Verify it matches the original
-            assert decrypted_data == test_data
+        # Verify it matches the original
+        assert decrypted_data == test_data
 
-    def test_encrypt_data_different_passwords_different_results(self, auth_manager):
+    def test_encrypt_data_different_passwords_different_results(self, auth_manager, password_prompt):
         """Test that different passwords produce different encrypted results."""
         test_data = '{"test": "data"}'
 
         # Encrypt with first password
-        with patch("getpass.getpass", return_value="password1"):
-            encrypted1 = auth_manager._encrypt_data(test_data)
+        password_prompt.password = "password1"
+        encrypted1 = auth_manager._encrypt_data(test_data)
 
         # Encrypt with second password
-        with patch("getpass.getpass", return_value="password2"):
-            encrypted2 = auth_manager._encrypt_data(test_data)
+        auth_manager.clear_session()
+        password_prompt.password = "password2"
+        encrypted2 = auth_manager._encrypt_data(test_data)
 
         # Results should be different
         assert encrypted1 != encrypted2
 
-    def test_decrypt_data_wrong_password(self, auth_manager):
+    def test_decrypt_data_wrong_password(self, auth_manager, password_prompt):
         """Test that decryption fails with wrong password."""
         test_data = '{"test": "data"}'
 
         # Encrypt with one password
-        with patch("getpass.getpass", return_value="correct_password"):
-            encrypted_data = auth_manager._encrypt_data(test_data)
+        password_prompt.password = "correct_password"
+        encrypted_data = auth_manager._encrypt_data(test_data)
 
         # Try to decrypt with wrong password
-        with patch("getpass.getpass", return_value="wrong_password"):
-            with pytest.raises(AuthenticationError) as exc_info:
-                auth_manager._decrypt_data(encrypted_data)
+        password_prompt.password = "wrong_password"
+        with pytest.raises(AuthenticationError) as exc_info:
+            auth_manager._decrypt_data(encrypted_data)
 
-            assert "Failed to decrypt stored data" in str(exc_info.value)
-            # Check that the suggestion is present
-            assert exc_info.value.suggestion == "Check your master password or re-authenticate"
+        assert "Failed to decrypt stored data" in str(exc_info.value)
+        # Check that the suggestion is present
+        assert exc_info.value.suggestion == "Check your master password or re-authenticate"
 
-    def test_decrypt_data_invalid_data(self, auth_manager):
+    def test_decrypt_data_invalid_data(self, auth_manager, password_prompt):
         """Test that decryption fails with invalid encrypted data."""
         invalid_data = b"this is not valid encrypted data"
 
-        with patch("getpass.getpass", return_value="any_password"):
-            with pytest.raises(AuthenticationError) as exc_info:
+        password_prompt.password = "any_password"
+        with pytest.raises(AuthenticationError) as exc_info:
+            auth_manager._decrypt_data(invalid_data)
+
+        assert "Failed to decrypt stored data" in str(exc_info.value)
+
+    def test_decrypt_data_unrecognized_format_skips_prompt(self, auth_manager, password_prompt):
+        """Test that malformed blobs are rejected before prompting for a password."""
+        for invalid_data in (b"this is not valid encrypted data", b"BBC1short"):
+            with pytest.raises(AuthenticationError, match="unrecognized data format"):
                 auth_manager._decrypt_data(invalid_data)
 
-            assert "Failed to decrypt stored data" in str(exc_info.value)
+        assert password_prompt.prompts == []
 
-    def test_encrypt_data_empty_string(self, auth_manager):
+    def test_encrypt_data_empty_string(self, auth_manager, password_prompt):
         """Test encrypting and decrypting empty string."""
         test_data = ""
 
-        with patch("getpass.getpass", side_effect=["test_password", "test_password"]):
-            encrypted_data = auth_manager._encrypt_data(test_data)
-            decrypted_data = auth_manager._decrypt_data(encrypted_data)
+        password_prompt.password = "test_password"
+        encrypted_data = auth_manager._encrypt_data(test_data)
+        decrypted_data = auth_manager._decrypt_data(encrypted_data)
 
-            assert decrypted_data == test_data
+        assert decrypted_data == test_data
 
-    def test_encrypt_data_unicode_content(self, auth_manager):
+    def test_encrypt_data_unicode_content(self, auth_manager, password_prompt):
         """Test encrypting and decrypting unicode content."""
         test_data = '{"message": "Hello 世界! 🌍", "emoji": "🔐"}'
 
-        with patch("getpass.getpass", side_effect=["test_password", "test_password"]):
-            encrypted_data = auth_manager._encrypt_data(test_data)
-            decrypted_data = auth_manager._decrypt_data(encrypted_data)
+        password_prompt.password = "test_password"
+        encrypted_data = auth_manager._encrypt_data(test_data)
+        decrypted_data = auth_manager._decrypt_data(encrypted_data)
 
-            assert decrypted_data == test_data
+        assert decrypted_data == test_data
 
-    def test_encrypt_data_large_content(self, auth_manager):
+    def test_encrypt_data_large_content(self, auth_manager, password_prompt):
         """Test encrypting and decrypting large content."""
         # Create a large JSON string
         large_data = '{"data": "' + "x" * 10000 + '"}'
 
-        with patch("getpass.getpass", side_effect=["test_password", "test_password"]):
-            encrypted_data = auth_manager._encrypt_data(large_data)
-            decrypted_data = auth_manager._decrypt_data(encrypted_data)
+        password_prompt.password = "test_password"
+        encrypted_data = auth_manager._encrypt_data(large_data)
+        decrypted_data = auth_manager._decrypt_data(encrypted_data)
+
+        assert decrypted_data == large_data
+
+    def test_encrypt_data_uses_magic_header(self, auth_manager, password_prompt):
+        """Test that new blobs carry the magic header, the per-install salt and a fresh nonce."""
+        password_prompt.password = "test_password"
+        first = auth_manager._encrypt_data("data")
+        second = auth_manager._encrypt_data("data")
+
+        assert first.startswith(b"BBC1")
+        assert first[4:20] == second[4:20] == (auth_manager.config_dir / "data.salt").read_bytes()
+        assert first[20:32] != second[20:32]
+
+    def test_data_salt_persists_across_managers(self, auth_manager, password_prompt, temp_config_dir):
+        """Test that a later process reuses the stored salt, so writing and reading costs one scrypt run."""
+        password_prompt.password = "test_password"
+        encrypted_app = auth_manager._encrypt_data("app")
+
+        with patch("bbcli.core.auth_manager.get_config") as mock_config:
+            mock_config.return_value.config_dir = temp_config_dir
+            later = AuthManager(password_provider=password_prompt)
+
+        with patch("bbcli.core.auth_manager.hashlib.scrypt", wraps=hashlib.scrypt) as mock_scrypt:
+            encrypted_token = later._encrypt_data("token")
+            assert later._decrypt_data(encrypted_app) == "app"
+            assert later._decrypt_data(encrypted_token) == "token"
+
+        assert mock_scrypt.call_count == 1
+        assert encrypted_token[4:20] == encrypted_app[4:20]
+
+    def test_key_cache_is_bounded(self, auth_manager):
+        """Test that keys derived for many distinct salts do not accumulate without limit."""
+        for index in range(AuthManager._KEY_CACHE_SIZE + 1):
+            auth_manager._derive_key("test_password", index.to_bytes(16, "big"))
+
+        assert len(auth_manager._key_cache) <= AuthManager._KEY_CACHE_SIZE
+
+    def test_key_cache_holds_install_and_credentials_keys(self, auth_manager, password_prompt):
+        """Test that the install-salt and fixed-salt keys for one password are both kept."""
+        password_prompt.password = "test_password"
+        auth_manager._encrypt_data("data")
+        auth_manager._get_fernet("test_password")
+
+        assert len(auth_manager._key_cache) == 2
+
+    def test_decrypt_data_tampered_ciphertext(self, auth_manager, password_prompt):
+        """Test that a modified AES-GCM ciphertext fails authentication."""
+        password_prompt.password = "test_password"
+        encrypted_data = bytearray(auth_manager._encrypt_data("data"))
+        encrypted_data[-1] ^= 0x01
 
-            assert decrypted_data == large_data
+        with pytest.raises(AuthenticationError, match="Failed to decrypt stored data"):
+            auth_manager._decrypt_data(bytes(encrypted_data))
+
+    def test_decrypt_data_legacy_fernet_blob(self, auth_manager, password_prompt):
+        """Test that blobs written with the fixed-salt PBKDF2 key still decrypt."""
+        legacy_blob = Fernet(auth_manager._get_encryption_key("test_password")).encrypt(b"legacy data")
+
+        password_prompt.password = "test_password"
+        assert auth_manager._decrypt_data(legacy_blob) == "legacy data"
 
     def test_encryption_key_generation_consistency(self, auth_manager):
         """Test that the same password generates the same encryption key."""
@@ -142,7 +228,76 @@ class TestAuthManagerEncryption:
         # Should be different
         assert key1 != key2
 
-    def test_oauth_storage_integration(self, auth_manager):
+    def test_encryption_key_is_derived_once_per_password(self, auth_manager):
+        """Test that repeated key requests for the same password reuse the cached key."""
+        with patch("bbcli.core.auth_manager.hashlib.pbkdf2_hmac", wraps=hashlib.pbkdf2_hmac) as mock_kdf:
+            key1 = auth_manager._get_encryption_key("test_password")
+            key2 = auth_manager._get_encryption_key("test_password")
+            auth_manager._get_encryption_key("other_password")
+
+        assert key1 == key2
+        assert mock_kdf.call_count == 2
+
+    def test_encryption_key_matches_cryptography_pbkdf2(self, auth_manager):
+        """Test that the hashlib derivation stays compatible with existing encrypted files."""
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=b"bbcli_salt_v1", iterations=100000)
+        expected = base64.urlsafe_b64encode(kdf.derive(b"test_password"))
+
+        assert auth_manager._get_encryption_key("test_password") == expected
+
+    def test_encrypt_data_prompts_once_per_session(self, auth_manager, password_prompt):
+        """Test that later encryptions reuse the master password entered for the first one."""
+        password_prompt.password = "master_password"
+        encrypted_app = auth_manager._encrypt_data("app")
+        encrypted_token = auth_manager._encrypt_data("token")
+
+        assert len(password_prompt.prompts) == 1
+        password_prompt.password = "master_password"
+        assert auth_manager._decrypt_data(encrypted_app) == "app"
+        assert auth_manager._decrypt_data(encrypted_token) == "token"
+
+    def test_fernet_instance_is_reused_per_password(self, auth_manager):
+        """Test that credential encryption builds one Fernet instance per master password."""
+        assert auth_manager._get_fernet("test_password") is auth_manager._get_fernet("test_password")
+        assert auth_manager._get_fernet("test_password") is not auth_manager._get_fernet("other_password")
+
+    def test_delete_credentials_clears_session(self, auth_manager, password_prompt):
+        """Test that deleting credentials forgets the master password and derived keys."""
+        auth_manager._keyring_available = False
+        password_prompt.password = "test_password"
+        auth_manager._encrypt_data("data")
+
+        auth_manager.delete_credentials()
+
+        assert auth_manager._session_password is None
+        assert auth_manager._key_cache == {}
+        assert auth_manager._fernet_cache == {}
+
+    def test_session_is_kept_until_sessions_are_cleared(self, auth_manager, password_prompt):
+        """Test that one command prompts once for writes and clear_sessions() forgets the password."""
+        password_prompt.password = "test_password"
+        auth_manager._encrypt_data("first")
+        auth_manager._encrypt_data("second")
+        assert len(password_prompt.prompts) == 1
+
+        clear_sessions()
+
+        assert auth_manager._session_password is None
+        assert auth_manager._key_cache == {}
+        assert auth_manager._fernet_cache == {}
+
+    def test_cli_command_clears_sessions_when_it_ends(self, auth_manager, password_prompt, runner):
+        """Test that the top-level command group forgets every session once the command finishes."""
+        password_prompt.password = "test_password"
+        auth_manager._encrypt_data("data")
+
+        result = runner.invoke(cli, ["auth", "--help"])
+
+        assert result.exit_code == 0
+        assert auth_manager._session_password is None
+        assert auth_manager._key_cache == {}
+
+    def test_oauth_storage_integration(self, auth_manager, password_prompt):
         """Test that the encryption methods work with OAuth storage patterns."""
         import json
 
@@ -162,47 +317,62 @@ class TestAuthManagerEncryption:
             "scope": "repository",
         }
 
-        with patch("getpass.getpass", side_effect=["master_password"] * 4):
-            # Encrypt OAuth app data
-            app_json = json.dumps(oauth_app_data)
-            encrypted_app = auth_manager._encrypt_data(app_json)
+        password_prompt.password = "master_password"
+        # Encrypt OAuth app data
+        app_json = json.dumps(oauth_app_data)
+        encrypted_app = auth_manager._encrypt_data(app_json)
+
+        # Encrypt OAuth token data
+        token_json = json.dumps(oauth_token_data)
+        encrypted_token = auth_manager._encrypt_data(token_json)
+
+        # Decrypt OAuth app data
+        decrypted_app_json = auth_manager._decrypt_data(encrypted_app)
+        decrypted_app_data = json.loads(decrypted_app_json)
+
+        # Decrypt OAuth token data
+        decrypted_token_json = auth_manager._decrypt_data(encrypted_token)
+        decrypted_token_data = json.loads(decrypted_token_json)
 
-            # Encrypt OAuth token data
-            token_json = json.dumps(oauth_token_data)
-            encrypted_token = auth_manager._encrypt_data(token_json)
+        # Verify data integrity
+        assert decrypted_app_data == oauth_app_data
+        assert decrypted_token_data == oauth_token_data
 
-            # Decrypt OAuth app data
-            decrypted_app_json = auth_manager._decrypt_data(encrypted_app)
-            decrypted_app_data = json.loads(decrypted_app_json)
+    def test_encrypt_many_shares_one_key_derivation(self, auth_manager, password_prompt):
+        """Test that OAuth app and token payloads can be encrypted with one KDF run."""
+        payloads = ['{"client_id": "test_client_id"}', '{"access_token": "test_access_token"}']
 
-            # Decrypt OAuth token data
-            decrypted_token_json = auth_manager._decrypt_data(encrypted_token)
-            decrypted_token_data = json.loads(decrypted_token_json)
+        with patch("bbcli.core.auth_manager.hashlib.scrypt", wraps=hashlib.scrypt) as mock_scrypt:
+            password_prompt.password = "master_password"
+            encrypted_app, encrypted_token = auth_manager._encrypt_many(payloads)
+            assert mock_scrypt.call_count == 1
 
-            # Verify data integrity
-            assert decrypted_app_data == oauth_app_data
-            assert decrypted_token_data == oauth_token_data
+        assert encrypted_app[4:20] == encrypted_token[4:20]
+        assert encrypted_app[20:32] != encrypted_token[20:32]
+        password_prompt.password = "master_password"
+        assert auth_manager._decrypt_data(encrypted_app) == payloads[0]
+        assert auth_manager._decrypt_data(encrypted_token) == payloads[1]
 
-    def test_backward_compatibility_with_credentials(self, auth_manager):
+    def test_backward_compatibility_with_credentials(self, auth_manager, password_prompt):
         """Test that new encryption methods don't interfere with existing credential methods."""
         # Test that existing credential encryption still works
         username = "test_user"
         password = "test_password"
 
-        with patch("getpass.getpass", side_effect=["master_password"] * 2):
-            # Store credentials using existing method (this writes to file)
-            encrypted_data = auth_manager._encrypt_credentials(username, password)
+        password_prompt.password = "master_password"
+        # Store credentials using existing method (this writes to file)
+        encrypted_data = auth_manager._encrypt_credentials(username, password)
 
-            # Write to file manually since _encrypt_credentials doesn't do it
-            with open(auth_manager.credentials_file, "wb") as f:
-                f.write(encrypted_data)
+        # Write to file manually since _encrypt_credentials doesn't do it
+        with open(auth_manager.credentials_file, "wb") as f:
+            f.write(encrypted_data)
 
-            # Retrieve credentials using existing method
-            retrieved_creds = auth_manager._decrypt_credentials()
+        # Retrieve credentials using existing method
+        retrieved_creds = auth_manager._decrypt_credentials()
 
-            assert retrieved_creds == (username, password)
+        assert retrieved_creds == (username, password)
 
-    def test_encryption_methods_are_independent(self, auth_manager):
+    def test_encryption_methods_are_independent(self, auth_manager, password_prompt):
         """Test that generic encryption and credential encryption are independent."""
         # Store some generic data
         test_data = '{"generic": "data"}'
@@ -211,19 +381,19 @@ class TestAuthManagerEncryption:
         username = "test_user"
         app_password = "test_app_password"
 
-        with patch("getpass.getpass", side_effect=["master_password"] * 4):
-            # Encrypt generic data
-            encrypted_data = auth_manager._encrypt_data(test_data)
+        password_prompt.password = "master_password"
+        # Encrypt generic data
+        encrypted_data = auth_manager._encrypt_data(test_data)
 
-            # Store credentials (encrypt and write to file)
-            encrypted_creds = auth_manager._encrypt_credentials(username, app_password)
-            with open(auth_manager.credentials_file, "wb") as f:
-                f.write(encrypted_creds)
+        # Store credentials (encrypt and write to file)
+        encrypted_creds = auth_manager._encrypt_credentials(username, app_password)
+        with open(auth_manager.credentials_file, "wb") as f:
+            f.write(encrypted_creds)
 
-            # Retrieve both
-            decrypted_data = auth_manager._decrypt_data(encrypted_data)
-            retrieved_creds = auth_manager._decrypt_credentials()
+        # Retrieve both
+        decrypted_data = auth_manager._decrypt_data(encrypted_data)
+        retrieved_creds = auth_manager._decrypt_credentials()
 
-            # Both should work correctly
-            assert decrypted_data == test_data
-            assert retrieved_creds == (username, app_password)
+        # Both should work correctly
+        assert decrypted_data == test_data
+        assert retrieved_creds == (username, app_password)
@@ -2,8 +2,6 @@
 Tests for Config integration with other components.
 """
 
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 from bbcli.core.config import Config, get_config
@@ -20,47 +18,45 @@ class TestConfigIntegration:
         """Clean up after each test."""
         Config.reset_singleton()
 
-    def test_config_with_auth_manager(self):
+    def test_config_with_auth_manager(self, temp_dir):
         """Test that config works with AuthManager."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
+        config_dir = temp_dir / "test_config"
 
-            # Mock get_config to return our test config
-            with patch("bbcli.core.auth_manager.get_config") as mock_get_config:
-                test_config = Config(config_dir)
-                mock_get_config.return_value = test_config
+        # Mock get_config to return our test config
+        with patch("bbcli.core.auth_manager.get_config") as mock_get_config:
+            test_config = Config(config_dir)
+            mock_get_config.return_value = test_config
 
-                # Import and create AuthManager
-                from bbcli.core.auth_manager import AuthManager
+            # Import and create AuthManager
+            from bbcli.core.auth_manager import AuthManager
 
-                auth_manager = AuthManager()
+            auth_manager = AuthManager()
 
-                # Verify it uses the mocked config
-                assert auth_manager.config is test_config
-                assert auth_manager.config_dir == config_dir
+            # Verify it uses the mocked config
+            assert auth_manager.config is test_config
+            assert auth_manager.config_dir == config_dir
 
-    def test_config_with_api_client(self):
+    def test_config_with_api_client(self, temp_dir):
         """Test that config works with API client."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
+        config_dir = temp_dir / "test_config"
 
-            # Create config with custom API settings
-            config = Config(config_dir)
-            config.set("api.timeout", 45)
-            config.set("api.base_url", "https://custom.api.url")
+        # Create config with custom API settings
+        config = Config(config_dir)
+        config.set("api.timeout", 45)
+        config.set("api.base_url", "https://custom.api.url")
 
-            # Mock get_config to return our test config
-            with patch("bbcli.core.api_client.get_config") as mock_get_config:
-                mock_get_config.return_value = config
+        # Mock get_config to return our test config
+        with patch("bbcli.core.api_client.get_config") as mock_get_config:
+            mock_get_config.return_value = config
 
-                # Import and test API client config usage
-                from bbcli.core.api_client import BitbucketAPIClient
+            # Import and test API client config usage
+            from bbcli.core.api_client import BitbucketAPIClient
 
-                # Create API client (this should use our config)
-                api_client = BitbucketAPIClient()
+            # Create API client (this should use our config)
+            api_client = BitbucketAPIClient()
 
-                # Verify it got the config values
-                mock_get_config.assert_called()
+            # Verify it got the config values
+            mock_get_config.assert_called()
 
     def test_config_singleton_across_modules(self):
         """Test that singleton works across different modules."""
@@ -97,44 +93,42 @@ class TestConfigIntegration:
         # Test default output format
         assert config.get("default_output_format") == "text"
 
-    def test_config_modification_persistence(self):
+    def test_config_modification_persistence(self, temp_dir):
         """Test that config modifications persist across component usage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
+        config_dir = temp_dir / "test_config"
 
-            # Create config and modify values
-            config = Config(config_dir)
-            config.set("api.timeout", 60)
-            config.set("ui.color", False)
-            config.set("custom.setting", "test_value")
+        # Create config and modify values
+        config = Config(config_dir)
+        config.set("api.timeout", 60)
+        config.set("ui.color", False)
+        config.set("custom.setting", "test_value")
 
-            # Reset singleton to simulate app restart
-            Config.reset_singleton()
+        # Reset singleton to simulate app restart
+        Config.reset_singleton()
 
-            # Create new config instance
-            new_config = Config(config_dir)
+        # Create new config instance
+        new_config = Config(config_dir)
 
-            # Values should be loaded from file
-            assert new_config.get("api.timeout") == 60
-            assert new_config.get("ui.color") is False
-            assert new_config.get("custom.setting") == "test_value"
+        # Values should be loaded from file
+        assert new_config.get("api.timeout") == 60
+        assert new_config.get("ui.color") is False
+        assert new_config.get("custom.setting") == "test_value"
 
-    def test_config_error_handling(self):
+    def test_config_error_handling(self, temp_dir):
         """Test config error handling."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
-            config = Config(config_dir)
+        config_dir = temp_dir / "test_config"
+        config = Config(config_dir)
 
-            # Test getting non-existent key with default
-            assert config.get("non.existent.key", "default") == "default"
-            assert config.get("non.existent.key") is None
+        # Test getting non-existent key with default
+        assert config.get("non.existent.key", "default") == "default"
+        assert config.get("non.existent.key") is None
 
-            # Test deleting non-existent key
-            assert config.delete("non.existent.key") is False
+        # Test deleting non-existent key
+        assert config.delete("non.existent.key") is False
 
-            # Test setting and getting nested keys
-            config.set("level1.level2.level3", "deep_value")
-            assert config.get("level1.level2.level3") == "deep_value"
+        # Test setting and getting nested keys
+        config.set("level1.level2.level3", "deep_value")
+        assert config.get("level1.level2.level3") == "deep_value"
 
     def test_config_thread_safety_with_components(self):
         """Test that config singleton is thread-safe when used by components."""
@@ -174,11 +168,12 @@ class TestConfigIntegration:
             thread = threading.Thread(target=worker, args=(i,))
             threads.append(thread)
 
-        # Start and wait for threads
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        # Start and wait for threads; their writes land in one batch
+        with get_config().batch():
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
 
         # Check results
         assert len(errors) == 0, f"Errors: {errors}"
@@ -225,3 +220,8 @@ class TestConfigIntegration:
         # Should be a copy (modifying it shouldn't affect config)
         all_values["test_key"] = "test_value"
         assert config.get("test_key") is None
+
+        # Nested sections are copied too
+        timeout = config.get("api.timeout")
+        all_values["api"]["timeout"] = timeout + 1
+        assert config.get("api.timeout") == timeout
@@ -2,12 +2,13 @@
 Tests for Config singleton implementation.
 """
 
-import tempfile
 import threading
 import time
-from pathlib import Path
+
+import pytest
 
 from bbcli.core.config import Config, get_config
+from bbcli.core.exceptions import ConfigurationError
 
 
 class TestConfigSingleton:
@@ -31,22 +32,21 @@ class TestConfigSingleton:
         assert config2 is config3
         assert id(config1) == id(config2) == id(config3)
 
-    def test_singleton_initialization_once(self):
+    def test_singleton_initialization_once(self, temp_dir):
         """Test that initialization only happens once."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
+        config_dir = temp_dir / "test_config"
 
-            # First call should initialize
-            config1 = Config(config_dir)
-            assert config1.config_dir == config_dir
+        # First call should initialize
+        config1 = Config(config_dir)
+        assert config1.config_dir == config_dir
 
-            # Second call should return same instance, ignore new config_dir
-            different_dir = Path(temp_dir) / "different_config"
-            config2 = Config(different_dir)
+        # Second call should return same instance, ignore new config_dir
+        different_dir = temp_dir / "different_config"
+        config2 = Config(different_dir)
 
-            assert config1 is config2
-            assert config2.config_dir == config_dir  # Should still be original
-            assert config2.config_dir != different_dir
+        assert config1 is config2
+        assert config2.config_dir == config_dir  # Should still be original
+        assert config2.config_dir != different_dir
 
     def test_singleton_thread_safety(self):
         """Test that singleton is thread-safe."""
@@ -122,16 +122,15 @@ class TestConfigSingleton:
         assert config1 is config2
         assert config1 is direct_config
 
-    def test_singleton_with_custom_config_dir(self):
+    def test_singleton_with_custom_config_dir(self, temp_dir):
         """Test singleton with custom configuration directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            custom_dir = Path(temp_dir) / "custom_bbcli"
+        custom_dir = temp_dir / "custom_bbcli"
 
-            config = Config(custom_dir)
+        config = Config(custom_dir)
 
-            assert config.config_dir == custom_dir
-            assert config.config_file == custom_dir / "config.yaml"
-            assert custom_dir.exists()
+        assert config.config_dir == custom_dir
+        assert config.config_file == custom_dir / "config.yaml"
+        assert custom_dir.exists()
 
     def test_singleton_preserves_state(self):
         """Test that singleton preserves state across calls."""
@@ -147,25 +146,24 @@ class TestConfigSingleton:
         config3 = get_config()
         assert config3.get("test.key") == "test_value"
 
-    def test_singleton_configuration_persistence(self):
+    def test_singleton_configuration_persistence(self, temp_dir):
         """Test that configuration changes persist across singleton calls."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
+        config_dir = temp_dir / "test_config"
 
-            # Create config and modify it
-            config1 = Config(config_dir)
-            config1.set("api.timeout", 60)
-            config1.set("ui.color", False)
+        # Create config and modify it
+        config1 = Config(config_dir)
+        config1.set("api.timeout", 60)
+        config1.set("ui.color", False)
 
-            # Reset singleton (simulating app restart)
-            Config.reset_singleton()
+        # Reset singleton (simulating app restart)
+        Config.reset_singleton()
 
-            # Create new instance with same config dir
-            config2 = Config(config_dir)
+        # Create new instance with same config dir
+        config2 = Config(config_dir)
 
-            # Values should be loaded from file
-            assert config2.get("api.timeout") == 60
-            assert config2.get("ui.color") is False
+        # Values should be loaded from file
+        assert config2.get("api.timeout") == 60
+        assert config2.get("ui.color") is False
 
     def test_singleton_default_values(self):
         """Test that singleton has correct default values."""
@@ -212,13 +210,12 @@ class TestConfigSingleton:
             thread = threading.Thread(target=worker, args=(i,))
             threads.append(thread)
 
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Start all threads and wait for completion; their writes land in one batch
+        with Config().batch():
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
 
         # Check results
         assert len(errors) == 0, f"Errors: {errors}"
@@ -266,3 +263,76 @@ class TestConfigSingleton:
         assert config2.get("mixed.test") == "shared_value"
         assert config3.get("mixed.test") == "shared_value"
         assert config4.get("mixed.test") == "shared_value"
+
+    def test_dotted_lookup_tracks_nested_changes(self, temp_dir):
+        """Test that dotted-path reads follow section replacement and deletion."""
+        config = Config(temp_dir / "test_config")
+
+        assert config.get("api")["timeout"] == 30
+        assert config.get("api.timeout.seconds", "missing") == "missing"
+
+        config.set("api", {"timeout": 5})
+        assert config.get("api.timeout") == 5
+        assert config.get("api.base_url") is None
+
+        assert config.delete("api") is True
+        assert config.get("api.timeout", "missing") == "missing"
+
+    def test_changes_are_written_through(self, temp_dir):
+        """Test that set(), delete() and reset() write the file without an explicit save()."""
+        config = Config(temp_dir / "test_config")
+
+        config.set("api.timeout", 60)
+        assert "timeout: 60" in config.config_file.read_text(encoding="utf-8")
+        assert config.delete("api.timeout") is True
+        assert "timeout:" not in config.config_file.read_text(encoding="utf-8")
+        config.reset()
+        assert "timeout: 30" in config.config_file.read_text(encoding="utf-8")
+        assert not config.config_file.with_name("config.yaml.tmp").exists()
+
+    def test_changes_are_batched_until_the_batch_ends(self, temp_dir):
+        """Test that batch() defers the write until the outermost batch exits."""
+        config = Config(temp_dir / "test_config")
+        saved = config.config_file.read_text(encoding="utf-8")
+
+        with config.batch():
+            config.set("api.timeout", 60)
+            with config.batch():
+                config.set("ui.color", False)
+            assert config.config_file.read_text(encoding="utf-8") == saved
+
+        written = config.config_file.read_text(encoding="utf-8")
+        assert "timeout: 60" in written
+        assert "color: false" in written
+
+    def test_save_reports_write_failures(self, temp_dir):
+        """Test that a failed write reaches the caller and keeps the changes pending."""
+        config = Config(temp_dir / "test_config")
+        # A directory in the config file's place makes the final swap fail
+        config.config_file.unlink()
+        config.config_file.mkdir()
+
+        with pytest.raises(ConfigurationError, match="Failed to save configuration file"):
+            config.set("api.timeout", 60)
+        assert config.get("api.timeout") == 60
+        with pytest.raises(ConfigurationError):
+            config.save()
+        with pytest.raises(ConfigurationError):
+            Config.reset_singleton()
+        assert Config.is_initialized()
+        assert not config.config_file.with_name("config.yaml.tmp").exists()
+
+        config.config_file.rmdir()
+        config.save()
+        assert "timeout: 60" in config.config_file.read_text(encoding="utf-8")
+
+    def test_reset_does_not_share_default_sections(self, temp_dir):
+        """Test that edits after reset() never leak into the default template."""
+        config = Config(temp_dir / "test_config")
+        config.set("api.timeout", 5)
+        config.reset()
+
+        assert config.get("api.timeout") == 30
+        config.get("api")["timeout"] = 7
+        config.reset()
+        assert config.get("api.timeout") == 30
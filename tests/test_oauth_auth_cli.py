@@ -2,279 +2,249 @@
 Tests for OAuth authentication CLI commands.
 """
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
 import pytest
-from click.testing import CliRunner
-from rich.console import Console
 
 from bbcli.cli.auth import auth
 from bbcli.core.exceptions import AuthenticationError
-from bbcli.core.oauth_manager import OAuthApp, OAuthToken
-from bbcli.utils.output import OutputFormatter
+from bbcli.core.oauth_manager import OAuthToken
+
+# Collaborators of bbcli.cli.auth replaced for every test in the class, most often configured first
+_PATCHED_NAMES = (
+    "OAuthStorage",
+    "AuthManager",
+    "OAuthManager",
+    "OAuthCallbackServer",
+    "BitbucketAPIClient",
+    "get_api_client",
+    "_setup_basic_auth",
+)
+
+
+# User returned by the mocked authentication check
+_TEST_USER = {
+    "username": "testuser",
+    "display_name": "Test User",
+    "account_id": "123456",
+}
+
+
+class _StubCallbackServer:
+    """Plain stand-in for OAuthCallbackServer that receives its callback on the first request."""
+
+    def __init__(self, authorization_code, state, error):
+        self.callback_received = False
+        self.authorization_code = authorization_code
+        self.state = state
+        self.error = error
+
+    def handle_request(self):
+        self.callback_received = True
+
+    def server_close(self):
+        pass
+
+
+def _stub_api_client(using_oauth, authentication):
+    """Build a plain API client stand-in whose authentication check returns or raises ``authentication``."""
+
+    def test_authentication():
+        if isinstance(authentication, Exception):
+            raise authentication
+        return authentication
+
+    return SimpleNamespace(is_using_oauth=lambda: using_oauth, test_authentication=test_authentication)
+
+
+@pytest.fixture(scope="class")
+def patched_auth_module():
+    """Patch the auth command collaborators once for the whole class."""
+    patcher = patch.multiple("bbcli.cli.auth", **dict.fromkeys(_PATCHED_NAMES, DEFAULT))
+    mocks = patcher.start()
+    try:
+        yield SimpleNamespace(**mocks)
+    finally:
+        patcher.stop()
+
+
+@pytest.fixture(scope="session")
+def mock_oauth_token():
+    """Create mock OAuth token, shared read-only across the session."""
+    return OAuthToken(
+        access_token="test_access_token",
+        token_type="bearer",
+        expires_in=3600,
+        refresh_token="test_refresh_token",
+        scope="account repository",
+    )
 
 
 class TestOAuthAuthCLI:
     """Test cases for OAuth authentication CLI commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create mock CLI context."""
-        console = Console()
-        formatter = OutputFormatter("text", console)
-        return {
-            "console": console,
-            "formatter": formatter,
-            "verbose": False,
-            "output_format": "text",
-        }
+    @pytest.fixture(autouse=True)
+    def mocks(self, patched_auth_module):
+        """Hand each test the class-wide mocks with their configuration cleared."""
+        for mock in vars(patched_auth_module).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        return patched_auth_module
 
     @pytest.fixture
-    def mock_oauth_app(self):
-        """Create mock OAuth app."""
-        return OAuthApp(
-            client_id="test_client_id",
-            client_secret="test_client_secret",
-            redirect_uri="http://localhost:8080/callback",
-            scopes="account,repository",
+    def invoke(self, runner, mock_context):
+        """Run an auth subcommand through the shared runner with the test CLI context."""
+
+        def _invoke(*args, input_text=None):
+            return runner.invoke(auth, list(args), input=input_text, obj=mock_context)
+
+        return _invoke
+
+    @pytest.mark.parametrize(
+        "has_oauth_app, callback, exit_code, expected_output",
+        [
+            pytest.param(
+                False,
+                None,
+                0,
+                ["OAuth Setup Required", "falling back to basic authentication"],
+                id="no_oauth_app",
+            ),
+            pytest.param(
+                True,
+                ("test_auth_code", "state", None),
+                0,
+                ["OAuth 2.0 authentication flow", "Authorization URL:", "OAuth 2.0 authentication successful!"],
+                id="oauth_app_configured",
+            ),
+            pytest.param(
+                True,
+                (None, "state", "access_denied"),
+                1,
+                ["OAuth authentication failed: access_denied"],
+                id="oauth_error",
+            ),
+        ],
+    )
+    def test_auth_login(
+        self,
+        invoke,
+        mocks,
+        oauth_app,
+        mock_oauth_token,
+        has_oauth_app,
+        callback,
+        exit_code,
+        expected_output,
+    ):
+        """Test auth login for each OAuth configuration and callback outcome."""
+        mock_storage = mocks.OAuthStorage.return_value
+        mock_storage.get_oauth_app.return_value = oauth_app if has_oauth_app else None
+        mock_storage.store_oauth_token.return_value = True
+        mock_storage.get_storage_info.return_value = {"storage_type": "System keyring"}
+
+        mock_manager = mocks.OAuthManager.return_value
+        mock_manager.build_authorization_url.return_value = (
+            "https://bitbucket.org/oauth/authorize?...",
+            "code_verifier",
+            "state",
         )
+        mock_manager.exchange_code_for_token.return_value = mock_oauth_token
 
-    @pytest.fixture
-    def mock_oauth_token(self):
-        """Create mock OAuth token."""
-        return OAuthToken(
-            access_token="test_access_token",
-            token_type="bearer",
-            expires_in=3600,
-            refresh_token="test_refresh_token",
-            scope="account repository",
-        )
+        # Callback arrives on the first request, carrying either a code or an error
+        if callback is not None:
+            mocks.OAuthCallbackServer.return_value = _StubCallbackServer(*callback)
+
+        mocks.BitbucketAPIClient.return_value.test_authentication.return_value = _TEST_USER
+
+        result = invoke("login", "--no-browser")
+
+        assert result.exit_code == exit_code
+        for expected in expected_output:
+            assert expected in result.output
+        if not has_oauth_app:
+            mocks._setup_basic_auth.assert_called_once()
 
-    def test_auth_login_no_oauth_app_configured(self, runner, mock_context):
-        """Test auth login when no OAuth app is configured."""
-        with patch("bbcli.cli.auth.OAuthStorage") as mock_storage:
-            mock_storage.return_value.get_oauth_app.return_value = None
-
-            # Mock the basic auth setup to avoid interactive prompts
-            with patch("bbcli.cli.auth._setup_basic_auth") as mock_basic_auth:
-                result = runner.invoke(auth, ["login", "--no-browser"], obj=mock_context)
-
-                assert result.exit_code == 0
-                assert "OAuth Setup Required" in result.output
-                assert "falling back to basic authentication" in result.output
-                mock_basic_auth.assert_called_once()
-
-    def test_auth_login_with_oauth_app_configured(self, runner, mock_context, mock_oauth_app, mock_oauth_token):
-        """Test auth login with OAuth app configured."""
-        with (
-            patch("bbcli.cli.auth.OAuthStorage") as mock_storage,
-            patch("bbcli.cli.auth.OAuthManager") as mock_manager,
-            patch("bbcli.cli.auth.OAuthCallbackServer") as mock_server,
-            patch("bbcli.cli.auth.BitbucketAPIClient") as mock_api_client,
-        ):
-            # Setup mocks
-            mock_storage.return_value.get_oauth_app.return_value = mock_oauth_app
-            mock_storage.return_value.store_oauth_token.return_value = True
-            mock_storage.return_value.get_storage_info.return_value = {"storage_type": "System keyring"}
-
-            mock_manager.return_value.build_authorization_url.return_value = (
-                "https://bitbucket.org/oauth/authorize?...",
-                "code_verifier",
-                "state",
-            )
-            mock_manager.return_value.exchange_code_for_token.return_value = mock_oauth_token
-
-            # Mock server behavior
-            mock_server_instance = Mock()
-            mock_server_instance.callback_received = False
-            mock_server_instance.authorization_code = "test_auth_code"
-            mock_server_instance.state = "state"
-            mock_server_instance.error = None
-            mock_server.return_value = mock_server_instance
-
-            # Mock API client
-            mock_api_client.return_value.test_authentication.return_value = {
-                "username": "testuser",
-                "display_name": "Test User",
-            }
-
-            # Simulate server receiving callback
-            def handle_request():
-                mock_server_instance.callback_received = True
-
-            mock_server_instance.handle_request = handle_request
-
-            result = runner.invoke(auth, ["login", "--no-browser"], obj=mock_context)
-
-            assert result.exit_code == 0
-            assert "OAuth 2.0 authentication flow" in result.output
-            assert "Authorization URL:" in result.output
-            assert "OAuth 2.0 authentication successful!" in result.output
-
-    def test_auth_login_oauth_error(self, runner, mock_context, mock_oauth_app):
-        """Test auth login when OAuth returns an error."""
-        with (
-            patch("bbcli.cli.auth.OAuthStorage") as mock_storage,
-            patch("bbcli.cli.auth.OAuthManager") as mock_manager,
-            patch("bbcli.cli.auth.OAuthCallbackServer") as mock_server,
-        ):
-            # Setup mocks
-            mock_storage.return_value.get_oauth_app.return_value = mock_oauth_app
-
-            mock_manager.return_value.build_authorization_url.return_value = (
-                "https://bitbucket.org/oauth/authorize?...",
-                "code_verifier",
-                "state",
-            )
-
-            # Mock server behavior with error
-            mock_server_instance = Mock()
-            mock_server_instance.callback_received = False
-            mock_server_instance.authorization_code = None
-            mock_server_instance.state = "state"
-            mock_server_instance.error = "access_denied"
-            mock_server.return_value = mock_server_instance
-
-            # Simulate server receiving callback with error
-            def handle_request():
-                mock_server_instance.callback_received = True
-
-            mock_server_instance.handle_request = handle_request
-
-            result = runner.invoke(auth, ["login", "--no-browser"], obj=mock_context)
-
-            assert result.exit_code == 1
-            assert "OAuth authentication failed: access_denied" in result.output
-
-    def test_auth_login_basic_command(self, runner, mock_context):
+    def test_auth_login_basic_command(self, invoke, mocks):
         """Test auth login-basic command."""
-        with patch("bbcli.cli.auth._setup_basic_auth") as mock_basic_auth:
-            result = runner.invoke(auth, ["login-basic"], obj=mock_context)
-
-            assert result.exit_code == 0
-            mock_basic_auth.assert_called_once()
-
-    def test_auth_status_no_auth(self, runner, mock_context):
-        """Test auth status when not authenticated."""
-        with (
-            patch("bbcli.cli.auth.AuthManager") as mock_auth_manager,
-            patch("bbcli.cli.auth.OAuthStorage") as mock_oauth_storage,
-        ):
-            mock_auth_manager.return_value.has_credentials.return_value = False
-            mock_oauth_storage.return_value.has_oauth_token.return_value = False
-
-            result = runner.invoke(auth, ["status"], obj=mock_context)
-
-            assert result.exit_code == 0
-            assert "Not authenticated" in result.output
-            assert "Run 'bbcli auth login' to authenticate with OAuth 2.0 (recommended)" in result.output
-
-    def test_auth_status_with_oauth(self, runner, mock_context, mock_oauth_token):
-        """Test auth status when authenticated with OAuth."""
-        with (
-            patch("bbcli.cli.auth.AuthManager") as mock_auth_manager,
-            patch("bbcli.cli.auth.OAuthStorage") as mock_oauth_storage,
-            patch("bbcli.cli.auth.get_api_client") as mock_get_api_client,
-        ):
-            mock_auth_manager.return_value.has_credentials.return_value = False
-            mock_auth_manager.return_value._keyring_available = True
-            mock_oauth_storage.return_value.has_oauth_token.return_value = True
-            mock_oauth_storage.return_value.get_oauth_token.return_value = mock_oauth_token
-
-            mock_api_client = Mock()
-            mock_api_client.is_using_oauth.return_value = True
-            mock_api_client.test_authentication.return_value = {
-                "username": "testuser",
-                "display_name": "Test User",
-                "account_id": "123456",
-            }
-            mock_get_api_client.return_value = mock_api_client
-
-            result = runner.invoke(auth, ["status"], obj=mock_context)
-
-            assert result.exit_code == 0
-            assert "Authenticated (OAuth 2.0)" in result.output
-
-    def test_auth_status_with_basic_auth(self, runner, mock_context):
-        """Test auth status when authenticated with Basic Auth."""
-        with (
-            patch("bbcli.cli.auth.AuthManager") as mock_auth_manager,
-            patch("bbcli.cli.auth.OAuthStorage") as mock_oauth_storage,
-            patch("bbcli.cli.auth.get_api_client") as mock_get_api_client,
-        ):
-            mock_auth_manager.return_value.has_credentials.return_value = True
-            mock_auth_manager.return_value._keyring_available = True
-            mock_oauth_storage.return_value.has_oauth_token.return_value = False
-
-            mock_api_client = Mock()
-            mock_api_client.is_using_oauth.return_value = False
-            mock_api_client.test_authentication.return_value = {
-                "username": "testuser",
-                "display_name": "Test User",
-                "account_id": "123456",
-            }
-            mock_get_api_client.return_value = mock_api_client
-
-            result = runner.invoke(auth, ["status"], obj=mock_context)
-
-            assert result.exit_code == 0
-            assert "Authenticated (Basic Auth (App Password))" in result.output
-
-    def test_auth_status_invalid_credentials(self, runner, mock_context):
-        """Test auth status when credentials are invalid."""
-
-        with (
-            patch("bbcli.cli.auth.AuthManager") as mock_auth_manager,
-            patch("bbcli.cli.auth.OAuthStorage") as mock_oauth_storage,
-            patch("bbcli.cli.auth.get_api_client") as mock_get_api_client,
-        ):
-            mock_auth_manager.return_value.has_credentials.return_value = True
-            mock_oauth_storage.return_value.has_oauth_token.return_value = False
-
-            mock_api_client = Mock()
-            mock_api_client.test_authentication.side_effect = AuthenticationError("Invalid credentials")
-            mock_get_api_client.return_value = mock_api_client
-
-            result = runner.invoke(auth, ["status"], obj=mock_context)
-
-            assert result.exit_code == 0
-            assert "Stored credentials are invalid or expired" in result.output
-            assert "Run 'bbcli auth login' to re-authenticate with OAuth 2.0" in result.output
-
-    def test_auth_logout(self, runner, mock_context):
+        result = invoke("login-basic")
+
+        assert result.exit_code == 0
+        mocks._setup_basic_auth.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "has_credentials, has_oauth_token, using_oauth, authentication, expected_output",
+        [
+            pytest.param(
+                False,
+                False,
+                False,
+                None,
+                ["Not authenticated", "Run 'bbcli auth login' to authenticate with OAuth 2.0 (recommended)"],
+                id="no_auth",
+            ),
+            pytest.param(False, True, True, _TEST_USER, ["Authenticated (OAuth 2.0)"], id="oauth"),
+            pytest.param(True, False, False, _TEST_USER, ["Authenticated (Basic Auth (App Password))"], id="basic_auth"),
+            pytest.param(
+                True,
+                False,
+                False,
+                AuthenticationError("Invalid credentials"),
+                ["Stored credentials are invalid or expired", "Run 'bbcli auth login' to re-authenticate with OAuth 2.0"],
+                id="invalid_credentials",
+            ),
+        ],
+    )
+    def test_auth_status(
+        self,
+        invoke,
+        mocks,
+        mock_oauth_token,
+        has_credentials,
+        has_oauth_token,
+        using_oauth,
+        authentication,
+        expected_output,
+    ):
+        """Test auth status for each authentication state."""
+        mocks.AuthManager.return_value.has_credentials.return_value = has_credentials
+        mocks.AuthManager.return_value._keyring_available = True
+        mocks.OAuthStorage.return_value.has_oauth_token.return_value = has_oauth_token
+        mocks.OAuthStorage.return_value.get_oauth_token.return_value = mock_oauth_token
+        mocks.get_api_client.return_value = _stub_api_client(using_oauth, authentication)
+
+        result = invoke("status")
+
+        assert result.exit_code == 0
+        for expected in expected_output:
+            assert expected in result.output
+
+    def test_auth_logout(self, invoke, mocks):
         """Test auth logout command."""
-        with patch("bbcli.cli.auth.AuthManager") as mock_auth_manager:
-            mock_auth_manager.return_value.has_credentials.return_value = True
-            mock_auth_manager.return_value.delete_credentials.return_value = True
+        mocks.AuthManager.return_value.has_credentials.return_value = True
+        mocks.AuthManager.return_value.delete_credentials.return_value = True
 
-            # Simulate user confirming logout
-            result = runner.invoke(auth, ["logout"], input="y\n", obj=mock_context)
+        # Simulate user confirming logout
+        result = invoke("logout", input_text="y\n")
 
-            assert result.exit_code == 0
-            assert "Credentials removed successfully" in result.output
+        assert result.exit_code == 0
+        assert "Credentials removed successfully" in result.output
 
-    def test_auth_logout_no_credentials(self, runner, mock_context):
+    def test_auth_logout_no_credentials(self, invoke, mocks):
         """Test auth logout when no credentials exist."""
-        with patch("bbcli.cli.auth.AuthManager") as mock_auth_manager:
-            mock_auth_manager.return_value.has_credentials.return_value = False
+        mocks.AuthManager.return_value.has_credentials.return_value = False
 
-            result = runner.invoke(auth, ["logout"], obj=mock_context)
+        result = invoke("logout")
 
-            assert result.exit_code == 0
-            assert "No stored credentials found" in result.output
+        assert result.exit_code == 0
+        assert "No stored credentials found" in result.output
 
-    def test_auth_logout_cancelled(self, runner, mock_context):
+    def test_auth_logout_cancelled(self, invoke, mocks):
         """Test auth logout when user cancels."""
-        with patch("bbcli.cli.auth.AuthManager") as mock_auth_manager:
-            mock_auth_manager.return_value.has_credentials.return_value = True
+        mocks.AuthManager.return_value.has_credentials.return_value = True
 
-            # Simulate user cancelling logout
-            result = runner.invoke(auth, ["logout"], input="n\n", obj=mock_context)
+        # Simulate user cancelling logout
+        result = invoke("logout", input_text="n\n")
 
-            assert result.exit_code == 0
-            assert "Logout cancelled" in result.output
+        assert result.exit_code == 0
+        assert "Logout cancelled" in result.output
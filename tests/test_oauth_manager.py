@@ -3,39 +3,117 @@ Tests for OAuth 2.0 manager functionality.
 """
 
 import base64
-import hashlib
-import time
-from unittest.mock import Mock, patch
+import json
+import re
+from types import SimpleNamespace
+from urllib.parse import parse_qsl
 
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 
+from bbcli.core import oauth_manager as oauth_manager_module
 from bbcli.core.oauth_manager import OAuthApp, OAuthManager, OAuthToken
 
+# Every parameter a PKCE authorization URL must carry, checked in one match
+_AUTH_URL_RE = re.compile(
+    "^"
+    + re.escape(OAuthManager.AUTHORIZE_URL)
+    + r"\?"
+    + r"(?=.*\bclient_id=test_client_id\b)"
+    + r"(?=.*\bresponse_type=code\b)"
+    + r"(?=.*\bredirect_uri=http%3A%2F%2Flocalhost%3A8080%2Fcallback\b)"
+    + r"(?=.*\bscope=repository\+account\b)"
+    + r"(?=.*\bcode_challenge=[\w-]+)"
+    + r"(?=.*\bcode_challenge_method=S256\b)"
+    + r"(?=.*\bstate=)"
+)
+
+# Serialized form of the fully populated token in the round-trip test
+_EXPECTED_TOKEN_DICT = {
+    "access_token": "test_token",
+    "token_type": "bearer",
+    "expires_in": 3600,
+    "refresh_token": "refresh_token",
+    "scope": "repository",
+    "created_at": 1234567890.0,
+}
+
+# PKCE example from RFC 7636 Appendix B: verifier entropy and the verifier/challenge it must produce
+_RFC7636_VERIFIER_BYTES = bytes.fromhex("7418dfb49799e0254ffa607dd8adbbba16d4254d69d6bff05b58055853848d79")
+_RFC7636_VERIFIER = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+_RFC7636_CHALLENGE = "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
+
+class TokenEndpointAdapter(BaseAdapter):
+    """Transport adapter that answers every request with canned JSON and records it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.json_body: dict = {}
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        """Record the request and return the configured JSON body."""
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(self.json_body).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        """Nothing to release."""
+
+    @property
+    def last_form(self) -> dict[str, str]:
+        """Form fields of the most recent request."""
+        return dict(parse_qsl(self.requests[-1].body))
+
+
+@pytest.fixture(scope="session")
+def token_adapter():
+    """Create the canned token endpoint shared by the session."""
+    return TokenEndpointAdapter()
+
+
+@pytest.fixture(scope="session")
+def oauth_manager(token_adapter):
+    """Create one OAuth manager for the session, with Bitbucket requests served by the token adapter."""
+    manager = OAuthManager()
+    manager.session.mount("https://bitbucket.org/", token_adapter)
+    yield manager
+    manager.session.close()
+
+
+@pytest.fixture
+def token_endpoint(token_adapter):
+    """Provide the token adapter with requests from earlier tests cleared."""
+    token_adapter.requests.clear()
+    token_adapter.json_body = {}
+    return token_adapter
+
+
+@pytest.fixture
+def fixed_pkce_pair(monkeypatch, oauth_manager):
+    """Pin the manager's PKCE pair for tests that only check the URL's shape."""
+    pair = ("v" * 43, "c" * 43)
+    monkeypatch.setattr(oauth_manager, "generate_pkce_pair", lambda: pair)
+    return pair
+
 
 class TestOAuthToken:
     """Test cases for OAuthToken class."""
 
-    def test_oauth_token_creation(self):
-        """Test OAuth token creation."""
-        token = OAuthToken(
-            access_token="test_token",
-            token_type="bearer",
-            expires_in=3600,
-            refresh_token="refresh_token",
-            scope="repository",
-        )
-
-        assert token.access_token == "test_token"
-        assert token.token_type == "bearer"
-        assert token.expires_in == 3600
-        assert token.refresh_token == "refresh_token"
-        assert token.scope == "repository"
-        assert token.created_at is not None
-
-    def test_oauth_token_expiration(self):
+    def test_oauth_token_expiration(self, monkeypatch):
         """Test OAuth token expiration logic."""
+        now = 1_000_000.0
+        monkeypatch.setattr(oauth_manager_module, "time", SimpleNamespace(time=lambda: now))
+
         # Create token that expires in 1 hour
-        token = OAuthToken(access_token="test_token", expires_in=3600, created_at=time.time())
+        token = OAuthToken(access_token="test_token", expires_in=3600, created_at=now)
 
         assert not token.is_expired
 
@@ -43,11 +121,26 @@ class TestOAuthToken:
         expired_token = OAuthToken(
             access_token="test_token",
             expires_in=3600,
-            created_at=time.time() - 3700,  # Created over an hour ago
+            created_at=now - 3700,  # Created over an hour ago
         )
 
         assert expired_token.is_expired
 
+    def test_oauth_token_issued_in_process_uses_monotonic_clock(self, monkeypatch):
+        """Test that a token created in this process expires by the monotonic clock, not wall time."""
+        token = OAuthToken(access_token="test_token", expires_in=3600)
+        issued_ns = token._created_monotonic_ns
+        # Wall clock jumped ten days ahead, but barely any monotonic time has passed
+        clock = SimpleNamespace(
+            time=lambda: token.created_at + 10 * 86400,
+            monotonic_ns=lambda: issued_ns + 1_000_000_000,
+        )
+        monkeypatch.setattr(oauth_manager_module, "time", clock)
+        assert not token.is_expired
+
+        clock.monotonic_ns = lambda: issued_ns + 3600 * 1_000_000_000
+        assert token.is_expired
+
     def test_oauth_token_no_expiration(self):
         """Test OAuth token without expiration."""
         token = OAuthToken(access_token="test_token", expires_in=None)
@@ -55,8 +148,8 @@ class TestOAuthToken:
         assert not token.is_expired
         assert token.expires_at is None
 
-    def test_oauth_token_serialization(self):
-        """Test OAuth token serialization."""
+    def test_oauth_token_creation_and_serialization(self):
+        """Test OAuth token creation and serialization round-trip."""
         token = OAuthToken(
             access_token="test_token",
             token_type="bearer",
@@ -66,29 +159,22 @@ class TestOAuthToken:
             created_at=1234567890.0,
         )
 
-        token_dict = token.to_dict()
-        assert token_dict["access_token"] == "test_token"
-        assert token_dict["token_type"] == "bearer"
-        assert token_dict["expires_in"] == 3600
-        assert token_dict["refresh_token"] == "refresh_token"
-        assert token_dict["scope"] == "repository"
-        assert token_dict["created_at"] == 1234567890.0
+        assert token.access_token == "test_token"
+        assert token.token_type == "bearer"
+        assert token.expires_in == 3600
+        assert token.refresh_token == "refresh_token"
+        assert token.scope == "repository"
+        assert OAuthToken(access_token="test_token").created_at is not None
 
-        # Test deserialization
-        new_token = OAuthToken.from_dict(token_dict)
-        assert new_token.access_token == token.access_token
-        assert new_token.token_type == token.token_type
-        assert new_token.expires_in == token.expires_in
-        assert new_token.refresh_token == token.refresh_token
-        assert new_token.scope == token.scope
-        assert new_token.created_at == token.created_at
+        assert token.to_dict() == _EXPECTED_TOKEN_DICT
+        assert OAuthToken.from_dict(_EXPECTED_TOKEN_DICT) == token
 
 
 class TestOAuthApp:
     """Test cases for OAuthApp class."""
 
-    def test_oauth_app_creation(self):
-        """Test OAuth app creation."""
+    def test_oauth_app_creation_and_serialization(self):
+        """Test OAuth app creation and serialization round-trip."""
         app = OAuthApp(
             client_id="test_client_id",
             client_secret="test_client_secret",
@@ -101,15 +187,6 @@ class TestOAuthApp:
         assert app.redirect_uri == "http://localhost:8080/callback"
         assert app.scopes == "repository account"
 
-    def test_oauth_app_serialization(self):
-        """Test OAuth app serialization."""
-        app = OAuthApp(
-            client_id="test_client_id",
-            client_secret="test_client_secret",
-            redirect_uri="http://localhost:8080/callback",
-            scopes="repository account",
-        )
-
         app_dict = app.to_dict()
         assert app_dict["client_id"] == "test_client_id"
         assert app_dict["client_secret"] == "test_client_secret"
@@ -127,51 +204,25 @@ class TestOAuthApp:
 class TestOAuthManager:
     """Test cases for OAuthManager class."""
 
-    @pytest.fixture
-    def oauth_manager(self):
-        """Create OAuth manager instance."""
-        return OAuthManager()
-
-    @pytest.fixture
-    def oauth_app(self):
-        """Create OAuth app instance."""
-        return OAuthApp(
-            client_id="test_client_id",
-            client_secret="test_client_secret",
-            redirect_uri="http://localhost:8080/callback",
-            scopes="repository account",
-        )
-
-    def test_generate_pkce_pair(self, oauth_manager):
+    def test_generate_pkce_pair(self, oauth_manager, monkeypatch):
         """Test PKCE code verifier and challenge generation."""
-        code_verifier, code_challenge = oauth_manager.generate_pkce_pair()
-
-        # Verify code verifier format
-        assert len(code_verifier) >= 43
-        assert len(code_verifier) <= 128
+        monkeypatch.setattr(oauth_manager_module.secrets, "token_bytes", lambda _: _RFC7636_VERIFIER_BYTES)
 
-        # Verify code challenge is correct SHA256 hash
-        expected_challenge = (
-            base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode("utf-8")).digest()).decode("utf-8").rstrip("=")
-        )
+        code_verifier, code_challenge = oauth_manager.generate_pkce_pair()
 
-        assert code_challenge == expected_challenge
+        # Verifier and S256 challenge must match the RFC's worked example
+        assert code_verifier == _RFC7636_VERIFIER
+        assert code_challenge == _RFC7636_CHALLENGE
 
-    def test_build_authorization_url(self, oauth_manager, oauth_app):
+    def test_build_authorization_url(self, oauth_manager, oauth_app, fixed_pkce_pair):
         """Test authorization URL building."""
-        auth_url, code_verifier, state = oauth_manager.build_authorization_url(oauth_app)
+        auth_url, code_verifier, state = oauth_manager.build_authorization_url(oauth_app, state="test_state")
 
-        assert auth_url.startswith(oauth_manager.AUTHORIZE_URL)
-        assert "client_id=test_client_id" in auth_url
-        assert "response_type=code" in auth_url
-        assert "redirect_uri=http%3A%2F%2Flocalhost%3A8080%2Fcallback" in auth_url
-        assert "scope=repository+account" in auth_url
-        assert "code_challenge=" in auth_url
-        assert "code_challenge_method=S256" in auth_url
-        assert "state=" in auth_url
-
-        assert code_verifier is not None
-        assert state is not None
+        assert _AUTH_URL_RE.match(auth_url), auth_url
+        assert f"code_challenge={fixed_pkce_pair[1]}" in auth_url
+
+        assert code_verifier == fixed_pkce_pair[0]
+        assert state == "test_state"
 
     def test_build_authorization_url_no_pkce(self, oauth_manager, oauth_app):
         """Test authorization URL building without PKCE."""
@@ -182,20 +233,15 @@ class TestOAuthManager:
         assert code_verifier is None
         assert state is not None
 
-    @patch("requests.Session.post")
-    def test_exchange_code_for_token_success(self, mock_post, oauth_manager, oauth_app):
+    def test_exchange_code_for_token_success(self, token_endpoint, oauth_manager, oauth_app):
         """Test successful authorization code exchange."""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        token_endpoint.json_body = {
             "access_token": "test_access_token",
             "token_type": "bearer",
             "expires_in": 3600,
             "refresh_token": "test_refresh_token",
             "scope": "repository account",
         }
-        mock_post.return_value = mock_response
 
         token = oauth_manager.exchange_code_for_token(oauth_app, "test_auth_code", "test_code_verifier")
 
@@ -206,27 +252,23 @@ class TestOAuthManager:
         assert token.scope == "repository account"
 
         # Verify request was made correctly
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == oauth_manager.ACCESS_TOKEN_URL
-        assert kwargs["auth"] == (oauth_app.client_id, oauth_app.client_secret)
-        assert kwargs["data"]["grant_type"] == "authorization_code"
-        assert kwargs["data"]["code"] == "test_auth_code"
-        assert kwargs["data"]["code_verifier"] == "test_code_verifier"
-
-    @patch("requests.Session.post")
-    def test_refresh_access_token_success(self, mock_post, oauth_manager, oauth_app):
+        assert len(token_endpoint.requests) == 1
+        request = token_endpoint.requests[0]
+        credentials = base64.b64encode(f"{oauth_app.client_id}:{oauth_app.client_secret}".encode()).decode()
+        assert request.url == oauth_manager.ACCESS_TOKEN_URL
+        assert request.headers["Authorization"] == f"Basic {credentials}"
+        assert token_endpoint.last_form["grant_type"] == "authorization_code"
+        assert token_endpoint.last_form["code"] == "test_auth_code"
+        assert token_endpoint.last_form["code_verifier"] == "test_code_verifier"
+
+    def test_refresh_access_token_success(self, token_endpoint, oauth_manager, oauth_app):
         """Test successful token refresh."""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        token_endpoint.json_body = {
             "access_token": "new_access_token",
             "token_type": "bearer",
             "expires_in": 3600,
             "refresh_token": "new_refresh_token",
         }
-        mock_post.return_value = mock_response
 
         token = oauth_manager.refresh_access_token(oauth_app, "old_refresh_token")
 
@@ -234,24 +276,18 @@ class TestOAuthManager:
         assert token.refresh_token == "new_refresh_token"
 
         # Verify request was made correctly
-        mock_post.assert_called_once()
-        _, kwargs = mock_post.call_args
-        assert kwargs["data"]["grant_type"] == "refresh_token"
-        assert kwargs["data"]["refresh_token"] == "old_refresh_token"
+        assert len(token_endpoint.requests) == 1
+        assert token_endpoint.last_form["grant_type"] == "refresh_token"
+        assert token_endpoint.last_form["refresh_token"] == "old_refresh_token"
 
-    @patch("requests.Session.post")
-    def test_client_credentials_flow_success(self, mock_post, oauth_manager, oauth_app):
+    def test_client_credentials_flow_success(self, token_endpoint, oauth_manager, oauth_app):
         """Test successful client credentials flow."""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        token_endpoint.json_body = {
             "access_token": "client_access_token",
             "token_type": "bearer",
             "expires_in": 3600,
             "scope": "repository",
         }
-        mock_post.return_value = mock_response
 
         token = oauth_manager.client_credentials_flow(oauth_app)
 
@@ -261,6 +297,5 @@ class TestOAuthManager:
         assert token.scope == "repository"
 
         # Verify request was made correctly
-        mock_post.assert_called_once()
-        _, kwargs = mock_post.call_args
-        assert kwargs["data"]["grant_type"] == "client_credentials"
+        assert len(token_endpoint.requests) == 1
+        assert token_endpoint.last_form["grant_type"] == "client_credentials"
@@ -3,6 +3,7 @@ Tests for OAuth storage functionality.
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -13,6 +14,26 @@ from bbcli.core.oauth_manager import OAuthApp, OAuthToken
 from bbcli.core.oauth_storage import OAuthStorage
 
 
+class _FakeAuthManager:
+    """Plain AuthManager stand-in that returns canned blobs and records what it encrypts and decrypts."""
+
+    def __init__(self, config_dir: Path) -> None:
+        self.config_dir = config_dir
+        self._keyring_available = False
+        self.encrypted = b"encrypted_data"
+        self.decrypted: str | None = None
+        self.encrypt_calls: list[str] = []
+        self.decrypt_calls: list[bytes] = []
+
+    def _encrypt_data(self, data: str) -> bytes:
+        self.encrypt_calls.append(data)
+        return self.encrypted
+
+    def _decrypt_data(self, encrypted_data: bytes) -> str | None:
+        self.decrypt_calls.append(encrypted_data)
+        return self.decrypted
+
+
 class TestOAuthStorage:
     """Test cases for OAuth storage functionality."""
 
@@ -24,15 +45,8 @@ class TestOAuthStorage:
 
     @pytest.fixture
     def oauth_storage(self, temp_config_dir):
-        """Create OAuth storage instance with temporary directory."""
-        with patch("bbcli.core.oauth_storage.AuthManager") as mock_auth_manager:
-            mock_auth_manager.return_value.config_dir = temp_config_dir
-            mock_auth_manager.return_value._keyring_available = False
-            storage = OAuthStorage()
-            storage.config_dir = temp_config_dir
-            storage.oauth_app_file = temp_config_dir / "oauth_app.enc"
-            storage.oauth_token_file = temp_config_dir / "oauth_token.enc"
-            yield storage
+        """Create OAuth storage instance with temporary directory and a fake auth manager."""
+        return OAuthStorage(_FakeAuthManager(temp_config_dir))
 
     @pytest.fixture
     def sample_oauth_app(self):
@@ -65,6 +79,17 @@ class TestOAuthStorage:
             assert storage.oauth_app_file == temp_config_dir / "oauth_app.enc"
             assert storage.oauth_token_file == temp_config_dir / "oauth_token.enc"
 
+    def test_oauth_storage_uses_injected_auth_manager(self, temp_config_dir):
+        """Test that a passed-in auth manager is used as is, without building (and probing) another one."""
+        auth_manager = _FakeAuthManager(temp_config_dir)
+
+        with patch("bbcli.core.oauth_storage.AuthManager") as mock_auth_manager:
+            storage = OAuthStorage(auth_manager)
+
+        assert storage.auth_manager is auth_manager
+        assert storage.config_dir == temp_config_dir
+        mock_auth_manager.assert_not_called()
+
     def test_store_oauth_app_with_keyring(self, oauth_storage, sample_oauth_app):
         """Test storing OAuth app with keyring."""
         oauth_storage.auth_manager._keyring_available = True
@@ -87,15 +112,37 @@ class TestOAuthStorage:
     def test_store_oauth_app_with_file_encryption(self, oauth_storage, sample_oauth_app):
         """Test storing OAuth app with file encryption."""
         oauth_storage.auth_manager._keyring_available = False
-        oauth_storage.auth_manager._encrypt_data = Mock(return_value=b"encrypted_data")
+        oauth_storage.auth_manager.encrypted = b"encrypted_data"
 
         result = oauth_storage.store_oauth_app(sample_oauth_app)
 
         assert result is True
-        oauth_storage.auth_manager._encrypt_data.assert_called_once()
+        assert len(oauth_storage.auth_manager.encrypt_calls) == 1
         assert oauth_storage.oauth_app_file.exists()
         assert oauth_storage.oauth_app_file.read_bytes() == b"encrypted_data"
 
+    def test_store_oauth_token_file_is_atomic_and_private(self, oauth_storage, sample_oauth_token):
+        """Test that encrypted files are written via a temp file with owner-only permissions."""
+        oauth_storage.auth_manager._keyring_available = False
+        oauth_storage.auth_manager.encrypted = b"x" * 10000
+
+        assert oauth_storage.store_oauth_token(sample_oauth_token) is True
+
+        assert oauth_storage.oauth_token_file.read_bytes() == b"x" * 10000
+        assert oauth_storage.oauth_token_file.stat().st_mode & 0o777 == 0o600
+        assert not oauth_storage.oauth_token_file.with_suffix(".enc.tmp").exists()
+
+    def test_failed_atomic_write_removes_temp_file(self, oauth_storage, sample_oauth_app):
+        """Test that a failed rename leaves neither the target nor the temp file behind."""
+        oauth_storage.auth_manager._keyring_available = False
+        # A directory in the target's place makes os.replace fail after the temp file is written
+        oauth_storage.oauth_app_file.mkdir()
+
+        assert oauth_storage.store_oauth_app(sample_oauth_app) is False
+
+        assert oauth_storage.oauth_app_file.is_dir()
+        assert not oauth_storage.oauth_app_file.with_suffix(".enc.tmp").exists()
+
     def test_get_oauth_app_with_keyring(self, oauth_storage, sample_oauth_app):
         """Test retrieving OAuth app from keyring."""
         oauth_storage.auth_manager._keyring_available = True
@@ -113,7 +160,7 @@ class TestOAuthStorage:
         """Test retrieving OAuth app from encrypted file."""
         oauth_storage.auth_manager._keyring_available = False
         app_json = json.dumps(sample_oauth_app.to_dict())
-        oauth_storage.auth_manager._decrypt_data = Mock(return_value=app_json)
+        oauth_storage.auth_manager.decrypted = app_json
 
         # Create encrypted file
         oauth_storage.oauth_app_file.write_bytes(b"encrypted_data")
@@ -122,7 +169,61 @@ class TestOAuthStorage:
 
         assert retrieved_app is not None
         assert retrieved_app.client_id == sample_oauth_app.client_id
-        oauth_storage.auth_manager._decrypt_data.assert_called_once_with(b"encrypted_data")
+        assert oauth_storage.auth_manager.decrypt_calls == [b"encrypted_data"]
+
+    def test_get_oauth_token_reuses_parsed_file(self, oauth_storage, sample_oauth_token):
+        """Test that an unchanged token file is decrypted only once."""
+        oauth_storage.auth_manager._keyring_available = False
+        oauth_storage.auth_manager.decrypted = json.dumps(sample_oauth_token.to_dict())
+        oauth_storage.oauth_token_file.write_bytes(b"encrypted_token_data")
+
+        first = oauth_storage.get_oauth_token()
+        assert oauth_storage.has_oauth_token() is True
+        assert oauth_storage.get_valid_token() is first
+
+        assert len(oauth_storage.auth_manager.decrypt_calls) == 1
+
+    def test_replaced_token_file_is_decrypted_again(self, oauth_storage, sample_oauth_token):
+        """Test that a token file swapped in with the same size and mtime is not served from the cache."""
+        oauth_storage.auth_manager._keyring_available = False
+        oauth_storage.auth_manager.decrypted = json.dumps(sample_oauth_token.to_dict())
+        oauth_storage.oauth_token_file.write_bytes(b"encrypted_token_a")
+        oauth_storage.get_oauth_token()
+
+        stat = oauth_storage.oauth_token_file.stat()
+        replacement = oauth_storage.oauth_token_file.with_suffix(".enc.new")
+        replacement.write_bytes(b"encrypted_token_b")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, oauth_storage.oauth_token_file)
+        oauth_storage.get_oauth_token()
+
+        assert oauth_storage.auth_manager.decrypt_calls == [b"encrypted_token_a", b"encrypted_token_b"]
+
+    def test_store_oauth_token_invalidates_parsed_file(self, oauth_storage, sample_oauth_token):
+        """Test that storing a token forces the next lookup to decrypt again."""
+        oauth_storage.auth_manager._keyring_available = False
+        oauth_storage.auth_manager.encrypted = b"encrypted_token_data"
+        oauth_storage.auth_manager.decrypted = json.dumps(sample_oauth_token.to_dict())
+        oauth_storage.oauth_token_file.write_bytes(b"encrypted_token_data")
+
+        oauth_storage.get_oauth_token()
+        oauth_storage.store_oauth_token(sample_oauth_token)
+        oauth_storage.get_oauth_token()
+
+        assert len(oauth_storage.auth_manager.decrypt_calls) == 2
+
+    def test_keyring_oauth_app_is_read_on_every_lookup(self, oauth_storage, sample_oauth_app):
+        """Test that keyring values are not cached, so changes made by another process are seen."""
+        oauth_storage.auth_manager._keyring_available = True
+        app_json = json.dumps(sample_oauth_app.to_dict())
+        updated_app = OAuthApp(client_id="rotated_client_id", client_secret="rotated_client_secret")
+
+        with patch("keyring.get_password", return_value=app_json) as mock_get_password:
+            assert oauth_storage.get_oauth_app() == sample_oauth_app
+
+            mock_get_password.return_value = json.dumps(updated_app.to_dict())
+            assert oauth_storage.get_oauth_app() == updated_app
+            assert mock_get_password.call_count == 2
 
     def test_get_oauth_app_not_found(self, oauth_storage):
         """Test retrieving OAuth app when none exists."""
@@ -154,12 +255,12 @@ class TestOAuthStorage:
     def test_store_oauth_token_with_file_encryption(self, oauth_storage, sample_oauth_token):
         """Test storing OAuth token with file encryption."""
         oauth_storage.auth_manager._keyring_available = False
-        oauth_storage.auth_manager._encrypt_data = Mock(return_value=b"encrypted_token_data")
+        oauth_storage.auth_manager.encrypted = b"encrypted_token_data"
 
         result = oauth_storage.store_oauth_token(sample_oauth_token)
 
         assert result is True
-        oauth_storage.auth_manager._encrypt_data.assert_called_once()
+        assert len(oauth_storage.auth_manager.encrypt_calls) == 1
         assert oauth_storage.oauth_token_file.exists()
         assert oauth_storage.oauth_token_file.read_bytes() == b"encrypted_token_data"
 
@@ -167,7 +268,7 @@ class TestOAuthStorage:
         """Test retrieving OAuth token from encrypted file."""
         oauth_storage.auth_manager._keyring_available = False
         token_json = json.dumps(sample_oauth_token.to_dict())
-        oauth_storage.auth_manager._decrypt_data = Mock(return_value=token_json)
+        oauth_storage.auth_manager.decrypted = token_json
 
         # Create encrypted file
         oauth_storage.oauth_token_file.write_bytes(b"encrypted_token_data")
@@ -176,7 +277,7 @@ class TestOAuthStorage:
 
         assert retrieved_token is not None
         assert retrieved_token.access_token == sample_oauth_token.access_token
-        oauth_storage.auth_manager._decrypt_data.assert_called_once_with(b"encrypted_token_data")
+        assert oauth_storage.auth_manager.decrypt_calls == [b"encrypted_token_data"]
 
     def test_has_oauth_app_true(self, oauth_storage, sample_oauth_app):
         """Test has_oauth_app returns True when app exists."""
@@ -236,6 +337,15 @@ class TestOAuthStorage:
 
         assert result is None
 
+    def test_store_oauth_token_keeps_expiry_out_of_plaintext(self, oauth_storage, sample_oauth_token):
+        """Test that the expiry is only stored inside the encrypted token file."""
+        oauth_storage.auth_manager._keyring_available = False
+
+        assert oauth_storage.store_oauth_token(sample_oauth_token) is True
+
+        assert [path.name for path in oauth_storage.config_dir.iterdir()] == ["oauth_token.enc"]
+        assert json.loads(oauth_storage.auth_manager.encrypt_calls[0])["expires_in"] == 3600
+
     def test_delete_oauth_app_with_keyring(self, oauth_storage):
         """Test deleting OAuth app from keyring."""
         oauth_storage.auth_manager._keyring_available = True
@@ -270,14 +380,29 @@ class TestOAuthStorage:
         oauth_storage.delete_oauth_app.assert_called_once()
         oauth_storage.delete_oauth_token.assert_called_once()
 
-    def test_get_storage_info(self, oauth_storage):
+    def test_clear_all_oauth_data_with_keyring(self, oauth_storage):
+        """Test clearing keyring OAuth data reports a failure from either deletion."""
+        oauth_storage.auth_manager._keyring_available = True
+        oauth_storage.delete_oauth_app = Mock(return_value=True)
+        oauth_storage.delete_oauth_token = Mock(return_value=False)
+
+        result = oauth_storage.clear_all_oauth_data()
+
+        assert result is False
+        oauth_storage.delete_oauth_app.assert_called_once()
+        oauth_storage.delete_oauth_token.assert_called_once()
+
+    def test_get_storage_info(self, oauth_storage, sample_oauth_app):
         """Test getting storage information."""
         oauth_storage.auth_manager._keyring_available = False
-        oauth_storage.has_oauth_app = Mock(return_value=True)
-        oauth_storage.has_oauth_token = Mock(return_value=False)
+        oauth_storage.get_oauth_app = Mock(return_value=sample_oauth_app)
+        oauth_storage.get_oauth_token = Mock(return_value=None)
 
         info = oauth_storage.get_storage_info()
 
+        oauth_storage.get_oauth_app.assert_called_once()
+        oauth_storage.get_oauth_token.assert_called_once()
+
         assert info["storage_type"] == "Encrypted local file"
         assert info["has_oauth_app"] is True
         assert info["has_oauth_token"] is False
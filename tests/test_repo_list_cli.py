@@ -2,36 +2,37 @@
 Tests for repository list CLI command.
 """
 
-from unittest.mock import Mock, patch
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
-from click.testing import CliRunner
-from rich.console import Console
 
+import bbcli.cli.repo as repo_module
 from bbcli.cli.repo import repo
-from bbcli.core.exceptions import BBCLIError
+from bbcli.core import api_client as api_client_module
+from bbcli.core import auth_manager as auth_manager_module
+from bbcli.core.api_client import BitbucketAPIClient
+from bbcli.core.auth_manager import AuthManager
+from bbcli.core.exceptions import AuthenticationError, BBCLIError
 from bbcli.utils.output import OutputFormatter
 
+# Authorization header the mock client resolves: Basic Auth for "testuser:testpass"
+_AUTH_HEADER = "Basic dGVzdHVzZXI6dGVzdHBhc3M="
+_AUTH_HEADERS = {"Authorization": _AUTH_HEADER}
+
 
 class TestRepoListCLI:
     """Test cases for repository list CLI command."""
 
     @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create mock CLI context."""
-        console = Console()
-        formatter = OutputFormatter("text", console)
-        return {
-            "console": console,
-            "formatter": formatter,
-            "verbose": False,
-            "output_format": "text",
-        }
+    def mock_client(self, monkeypatch):
+        """Swap the command's API client factory for one returning a mock client."""
+        client = Mock()
+        client.get_auth_header.return_value = _AUTH_HEADER
+        monkeypatch.setattr(repo_module, "get_api_client", lambda: client)
+        return client
 
     @pytest.fixture
     def sample_repositories(self):
@@ -80,24 +81,23 @@ class TestRepoListCLI:
             "next": None,
         }
 
-    def test_repo_list_basic(self, runner, mock_context, sample_repositories):
+    def test_repo_list_basic(self, runner, mock_context, mock_client, sample_repositories):
         """Test basic repository listing."""
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = sample_repositories
-            mock_get_client.return_value = mock_client
+        mock_client.get.return_value = sample_repositories
 
-            result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
 
-            assert result.exit_code == 0
-            assert "my-web-app" in result.output
-            assert "api-service" in result.output
-            assert "Found 2 repositories" in result.output
+        assert result.exit_code == 0
+        assert "my-web-app" in result.output
+        assert "api-service" in result.output
+        assert "Found 2 repositories" in result.output
 
-            # Verify API call
-            mock_client.get.assert_called_once_with("/repositories/myworkspace", params={"sort": "-updated_on"})
+        # Verify API call
+        mock_client.get.assert_called_once_with(
+            "/repositories/myworkspace", params={"sort": "-updated_on"}, headers=_AUTH_HEADERS
+        )
 
-    def test_repo_list_with_project_filter(self, runner, mock_context, sample_repositories):
+    def test_repo_list_with_project_filter(self, runner, mock_context, mock_client, sample_repositories):
         """Test repository listing with project filter."""
         # Filter to only return WEBAPP project repos
         filtered_repos = {
@@ -105,28 +105,26 @@ class TestRepoListCLI:
             "next": None,
         }
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = filtered_repos
-            mock_get_client.return_value = mock_client
+        mock_client.get.return_value = filtered_repos
 
-            result = runner.invoke(
-                repo,
-                ["list", "--workspace", "myworkspace", "--project", "WEBAPP"],
-                obj=mock_context,
-            )
+        result = runner.invoke(
+            repo,
+            ["list", "--workspace", "myworkspace", "--project", "WEBAPP"],
+            obj=mock_context,
+        )
 
-            assert result.exit_code == 0
-            assert "my-web-app" in result.output
-            assert "api-service" not in result.output
+        assert result.exit_code == 0
+        assert "my-web-app" in result.output
+        assert "api-service" not in result.output
 
-            # Verify API call with project filter
-            mock_client.get.assert_called_once_with(
-                "/repositories/myworkspace",
-                params={"q": 'project.key="WEBAPP"', "sort": "-updated_on"},
-            )
+        # Verify API call with project filter
+        mock_client.get.assert_called_once_with(
+            "/repositories/myworkspace",
+            params={"q": 'project.key="WEBAPP"', "sort": "-updated_on"},
+            headers=_AUTH_HEADERS,
+        )
 
-    def test_repo_list_with_query_filter(self, runner, mock_context, sample_repositories):
+    def test_repo_list_with_query_filter(self, runner, mock_context, mock_client, sample_repositories):
         """Test repository listing with name query filter."""
         # Filter to only return repos matching "web"
         filtered_repos = {
@@ -134,61 +132,57 @@ class TestRepoListCLI:
             "next": None,
         }
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = filtered_repos
-            mock_get_client.return_value = mock_client
+        mock_client.get.return_value = filtered_repos
 
-            result = runner.invoke(
-                repo,
-                ["list", "--workspace", "myworkspace", "--query", "web"],
-                obj=mock_context,
-            )
+        result = runner.invoke(
+            repo,
+            ["list", "--workspace", "myworkspace", "--query", "web"],
+            obj=mock_context,
+        )
 
-            assert result.exit_code == 0
-            assert "my-web-app" in result.output
+        assert result.exit_code == 0
+        assert "my-web-app" in result.output
 
-            # Verify API call with query filter
-            mock_client.get.assert_called_once_with(
-                "/repositories/myworkspace",
-                params={"q": 'name~"web"', "sort": "-updated_on"},
-            )
+        # Verify API call with query filter
+        mock_client.get.assert_called_once_with(
+            "/repositories/myworkspace",
+            params={"q": 'name~"web"', "sort": "-updated_on"},
+            headers=_AUTH_HEADERS,
+        )
 
-    def test_repo_list_with_both_filters(self, runner, mock_context, sample_repositories):
+    def test_repo_list_with_both_filters(self, runner, mock_context, mock_client, sample_repositories):
         """Test repository listing with both project and query filters."""
         filtered_repos = {"values": [sample_repositories["values"][0]], "next": None}
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = filtered_repos
-            mock_get_client.return_value = mock_client
-
-            result = runner.invoke(
-                repo,
-                [
-                    "list",
-                    "--workspace",
-                    "myworkspace",
-                    "--project",
-                    "WEBAPP",
-                    "--query",
-                    "web",
-                ],
-                obj=mock_context,
-            )
-
-            assert result.exit_code == 0
-
-            # Verify API call with combined filters
-            mock_client.get.assert_called_once_with(
-                "/repositories/myworkspace",
-                params={
-                    "q": 'project.key="WEBAPP" AND name~"web"',
-                    "sort": "-updated_on",
-                },
-            )
-
-    def test_repo_list_pagination(self, runner, mock_context):
+        mock_client.get.return_value = filtered_repos
+
+        result = runner.invoke(
+            repo,
+            [
+                "list",
+                "--workspace",
+                "myworkspace",
+                "--project",
+                "WEBAPP",
+                "--query",
+                "web",
+            ],
+            obj=mock_context,
+        )
+
+        assert result.exit_code == 0
+
+        # Verify API call with combined filters
+        mock_client.get.assert_called_once_with(
+            "/repositories/myworkspace",
+            params={
+                "q": 'project.key="WEBAPP" AND name~"web"',
+                "sort": "-updated_on",
+            },
+            headers=_AUTH_HEADERS,
+        )
+
+    def test_repo_list_pagination(self, runner, mock_context, mock_client):
         """Test repository listing with pagination."""
         # First page
         page1 = {
@@ -242,40 +236,84 @@ class TestRepoListCLI:
             "next": None,
         }
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.side_effect = [page1, page2]
-            mock_get_client.return_value = mock_client
+        mock_client.get.side_effect = [page1, page2]
+
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "repo1" in result.output
+        assert "repo2" in result.output
+        assert "Found 2 repositories" in result.output
+
+        # Verify both API calls
+        assert mock_client.get.call_count == 2
+        mock_client.get.assert_any_call("/repositories/myworkspace", params={"sort": "-updated_on"}, headers=_AUTH_HEADERS)
+        mock_client.get.assert_any_call("/2.0/repositories/myworkspace?page=2", params=None, headers=_AUTH_HEADERS)
+
+    def test_repo_list_fetches_numbered_pages_concurrently(self, runner, mock_context, mock_client):
+        """Test that pages are requested by number when the first page reports the total size."""
+
+        def get_page(url, params, headers, session=None):
+            page = params.get("page", 1)
+            return {
+                "values": [{"name": f"repo{page}"}],
+                "page": page,
+                "pagelen": 1,
+                "size": 3,
+                "next": f"https://api.bitbucket.org/2.0/repositories/myworkspace?page={page + 1}" if page < 3 else None,
+            }
+
+        mock_client.get.side_effect = get_page
 
-            result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "Found 3 repositories" in result.output
+        assert result.output.index("repo1") < result.output.index("repo2") < result.output.index("repo3")
+
+        assert mock_client.get.call_count == 3
+        for page in (2, 3):
+            mock_client.get.assert_any_call(
+                "/repositories/myworkspace",
+                params={"sort": "-updated_on", "page": page},
+                headers=_AUTH_HEADERS,
+                session=mock_client.create_session.return_value,
+            )
+        mock_client.get_auth_header.assert_called_once_with()
+
+    def test_repo_list_follows_cursor_when_size_fits_one_page(self, runner, mock_context, mock_client):
+        """Test that a next link is followed even when the approximate size fits on the first page."""
+        page1 = {
+            "values": [{"name": "repo1"}],
+            "page": 1,
+            "pagelen": 10,
+            "size": 1,
+            "next": "https://api.bitbucket.org/2.0/repositories/myworkspace?page=2",
+        }
+        page2 = {"values": [{"name": "repo2"}], "page": 2, "pagelen": 10, "size": 2}
+        mock_client.get.side_effect = [page1, page2]
 
-            assert result.exit_code == 0
-            assert "repo1" in result.output
-            assert "repo2" in result.output
-            assert "Found 2 repositories" in result.output
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
 
-            # Verify both API calls
-            assert mock_client.get.call_count == 2
-            mock_client.get.assert_any_call("/repositories/myworkspace", params={"sort": "-updated_on"})
-            mock_client.get.assert_any_call("/2.0/repositories/myworkspace?page=2", params=None)
+        assert result.exit_code == 0
+        assert "Found 2 repositories" in result.output
+        mock_client.get.assert_called_with("/2.0/repositories/myworkspace?page=2", params=None, headers=_AUTH_HEADERS)
+        mock_client.create_session.assert_not_called()
 
-    def test_repo_list_no_repositories(self, runner, mock_context):
+    def test_repo_list_no_repositories(self, runner, mock_context, mock_client):
         """Test repository listing when no repositories found."""
         empty_response = {"values": [], "next": None}
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = empty_response
-            mock_get_client.return_value = mock_client
+        mock_client.get.return_value = empty_response
 
-            result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
 
-            assert result.exit_code == 0
-            assert "No repositories found in workspace 'myworkspace'" in result.output
+        assert result.exit_code == 0
+        assert "No repositories found in workspace 'myworkspace'" in result.output
 
-    def test_repo_list_json_output(self, runner, sample_repositories):
+    def test_repo_list_json_output(self, runner, cli_context_template, mock_client, sample_repositories):
         """Test repository listing with JSON output."""
-        console = Console()
+        console = cli_context_template["console"]
         formatter = OutputFormatter("json", console)
         mock_context = {
             "console": console,
@@ -284,18 +322,28 @@ class TestRepoListCLI:
             "output_format": "json",
         }
 
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.return_value = sample_repositories
-            mock_get_client.return_value = mock_client
-
-            result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
-
-            assert result.exit_code == 0
-            # Should contain JSON structure
-            assert '"workspace": "myworkspace"' in result.output
-            assert '"total_count": 2' in result.output
-            assert '"repositories":' in result.output
+        # Bracketed text would be read as Rich markup if the JSON went through console.print
+        description = "Shared [bold] layout helpers " + "x" * 60
+        sample_repositories["values"][0]["description"] = description
+        mock_client.get.return_value = sample_repositories
+
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+
+        assert result.exit_code == 0
+        # Should contain JSON structure
+        assert '"workspace": "myworkspace"' in result.output
+        assert '"total_count": 2' in result.output
+        assert '"repositories":' in result.output
+
+        # Output is a stream of JSON documents (status messages, then the listing) that must parse intact
+        decoder = json.JSONDecoder()
+        documents, position = [], 0
+        while position < len(result.output):
+            document, position = decoder.raw_decode(result.output, position)
+            documents.append(document)
+            position = len(result.output) - len(result.output[position:].lstrip())
+        assert [r["name"] for r in documents[-1]["repositories"]] == ["my-web-app", "api-service"]
+        assert documents[-1]["repositories"][0]["description"] == description
 
     def test_repo_list_missing_workspace(self, runner, mock_context):
         """Test repository listing without required workspace parameter."""
@@ -304,20 +352,90 @@ class TestRepoListCLI:
         assert result.exit_code != 0
         assert "Missing option" in result.output or "required" in result.output
 
-    def test_repo_list_api_error(self, runner, mock_context):
+    def test_repo_list_api_error(self, runner, mock_context, mock_client):
         """Test repository listing when API returns an error."""
-        with patch("bbcli.cli.repo.get_api_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.get.side_effect = BBCLIError("Workspace not found")
-            mock_get_client.return_value = mock_client
-
-            # Test that BBCLIError is properly raised
-            with pytest.raises(BBCLIError) as exc_info:
-                runner.invoke(
-                    repo,
-                    ["list", "--workspace", "invalid-workspace"],
-                    obj=mock_context,
-                    catch_exceptions=False,
-                )
-
-            assert "Workspace not found" in str(exc_info.value)
+        mock_client.get.side_effect = BBCLIError("Workspace not found")
+
+        # Test that BBCLIError is properly raised
+        with pytest.raises(BBCLIError) as exc_info:
+            runner.invoke(
+                repo,
+                ["list", "--workspace", "invalid-workspace"],
+                obj=mock_context,
+                catch_exceptions=False,
+            )
+
+        assert "Workspace not found" in str(exc_info.value)
+
+
+class TestRepoListStoredCredentials:
+    """Test repository listing through the real client with file-stored credentials."""
+
+    @pytest.fixture
+    def prompts(self):
+        """Master-password prompts answered during a test."""
+        return []
+
+    @pytest.fixture
+    def file_client(self, monkeypatch, temp_dir, prompts):
+        """A real API client whose credentials live in the encrypted file fallback."""
+        for name in ("BBCLI_USERNAME", "BBCLI_PASSWORD", "BBCLI_OAUTH_TOKEN"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(auth_manager_module, "get_config", lambda: SimpleNamespace(config_dir=temp_dir))
+        monkeypatch.setattr(AuthManager, "_check_keyring_availability", lambda _self: False)
+
+        def password_provider(prompt):
+            prompts.append(prompt)
+            return "master"
+
+        auth_manager = AuthManager(password_provider=password_provider)
+        credentials = json.dumps({"username": "testuser", "app_password": "testpass"}).encode()
+        auth_manager.credentials_file.write_bytes(auth_manager._get_fernet("master").encrypt(credentials))
+
+        monkeypatch.setattr(api_client_module, "get_config", lambda: SimpleNamespace(get={}.get))
+        monkeypatch.setattr(api_client_module, "AuthManager", lambda: auth_manager)
+        monkeypatch.setattr(api_client_module, "OAuthStorage", lambda _manager: SimpleNamespace(get_valid_token=lambda: None))
+        client = BitbucketAPIClient()
+        monkeypatch.setattr(repo_module, "get_api_client", lambda: client)
+        return client
+
+    def test_repo_list_prompts_for_master_password_once(self, runner, mock_context, monkeypatch, file_client, prompts):
+        """Test that concurrent page fetches reuse one resolved header and never share a session."""
+        sent = []
+        lock = threading.Lock()
+
+        def request(session, method, url, params=None, headers=None, **kwargs):
+            page = (params or {}).get("page", 1)
+            with lock:
+                sent.append((session, headers["Authorization"]))
+            body = {
+                "values": [{"name": f"repo{page}"}],
+                "page": page,
+                "pagelen": 1,
+                "size": 3,
+                "next": f"https://api.bitbucket.org/2.0/repositories/myworkspace?page={page + 1}" if page < 3 else None,
+            }
+            return SimpleNamespace(ok=True, status_code=200, headers={}, json=lambda: body)
+
+        monkeypatch.setattr("requests.sessions.Session.request", request)
+
+        result = runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "Found 3 repositories" in result.output
+        assert prompts == ["Enter your master password: "]
+        assert [header for _, header in sent] == [_AUTH_HEADER] * 3
+        page_sessions = [session for session, _ in sent[1:]]
+        assert file_client.session not in page_sessions
+
+    def test_repo_list_rejected_stored_credentials(self, runner, mock_context, monkeypatch, file_client, prompts):
+        """Test that a 401 names the stored credentials without asking for the master password again."""
+        response = SimpleNamespace(ok=False, status_code=401, headers={}, reason="Unauthorized")
+        monkeypatch.setattr("requests.sessions.Session.request", Mock(return_value=response))
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            runner.invoke(repo, ["list", "--workspace", "myworkspace"], obj=mock_context, catch_exceptions=False)
+
+        assert "Authentication failed with stored credentials" in str(exc_info.value)
+        assert exc_info.value.suggestion == "Run 'bbcli auth login' to re-authenticate"
+        assert prompts == ["Enter your master password: "]
@@ -12,7 +12,9 @@ from bbcli.utils.validation import (
     validate_permission_level,
     validate_project_key,
     validate_repository_slug,
+    validate_repository_slugs,
     validate_user_identifier,
+    validate_user_identifiers,
     validate_workspace_slug,
 )
 
@@ -20,206 +22,253 @@ from bbcli.utils.validation import (
 class TestValidation:
     """Test cases for validation functions."""
 
-    def test_validate_project_key_valid(self):
+    @pytest.mark.parametrize(
+        "project_key, expected",
+        [
+            pytest.param("PROJ", "PROJ", id="uppercase"),
+            pytest.param("proj", "PROJ", id="converted_to_uppercase"),
+            pytest.param("MYAPP123", "MYAPP123", id="alphanumeric"),
+            pytest.param("AB", "AB", id="minimum_length"),
+            pytest.param("ABCDEFGHIJ", "ABCDEFGHIJ", id="maximum_length"),
+        ],
+    )
+    def test_validate_project_key_valid(self, project_key, expected):
         """Test valid project keys."""
-        assert validate_project_key("PROJ") == "PROJ"
-        assert validate_project_key("proj") == "PROJ"  # Should convert to uppercase
-        assert validate_project_key("MYAPP123") == "MYAPP123"
-        assert validate_project_key("AB") == "AB"  # Minimum length
-        assert validate_project_key("ABCDEFGHIJ") == "ABCDEFGHIJ"  # Maximum length
-
-    def test_validate_project_key_invalid(self):
+        assert validate_project_key(project_key) == expected
+
+    @pytest.mark.parametrize(
+        "project_key",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("A", id="too_short"),
+            pytest.param("ABCDEFGHIJK", id="too_long"),
+            pytest.param("PROJ-1", id="hyphen"),
+            pytest.param("PROJ_1", id="underscore"),
+            pytest.param("PROJ 1", id="space"),
+            pytest.param("PRÖJ", id="non_ascii_letter"),
+        ],
+    )
+    def test_validate_project_key_invalid(self, project_key):
         """Test invalid project keys."""
         with pytest.raises(ValidationError):
-            validate_project_key("")  # Empty
-
-        with pytest.raises(ValidationError):
-            validate_project_key("A")  # Too short
-
-        with pytest.raises(ValidationError):
-            validate_project_key("ABCDEFGHIJK")  # Too long
-
-        with pytest.raises(ValidationError):
-            validate_project_key("PROJ-1")  # Contains hyphen
-
-        with pytest.raises(ValidationError):
-            validate_project_key("PROJ_1")  # Contains underscore
-
-        with pytest.raises(ValidationError):
-            validate_project_key("PROJ 1")  # Contains space
-
-    def test_validate_repository_slug_valid(self):
+            validate_project_key(project_key)
+
+    @pytest.mark.parametrize(
+        "repo_slug, expected",
+        [
+            pytest.param("my-repo", "my-repo", id="hyphen"),
+            pytest.param("MY-REPO", "my-repo", id="converted_to_lowercase"),
+            pytest.param("repo123", "repo123", id="alphanumeric"),
+            pytest.param("my_repo", "my_repo", id="underscore"),
+            pytest.param("my.repo", "my.repo", id="dot"),
+            pytest.param("repo-with-many-hyphens", "repo-with-many-hyphens", id="many_hyphens"),
+        ],
+    )
+    def test_validate_repository_slug_valid(self, repo_slug, expected):
         """Test valid repository slugs."""
-        assert validate_repository_slug("my-repo") == "my-repo"
-        assert validate_repository_slug("MY-REPO") == "my-repo"  # Should convert to lowercase
-        assert validate_repository_slug("repo123") == "repo123"
-        assert validate_repository_slug("my_repo") == "my_repo"
-        assert validate_repository_slug("my.repo") == "my.repo"
-        assert validate_repository_slug("repo-with-many-hyphens") == "repo-with-many-hyphens"
-
-    def test_validate_repository_slug_invalid(self):
+        assert validate_repository_slug(repo_slug) == expected
+
+    @pytest.mark.parametrize(
+        "repo_slug",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("a" * 63, id="too_long"),
+            pytest.param(".repo", id="starts_with_dot"),
+            pytest.param("repo.", id="ends_with_dot"),
+            pytest.param("-repo", id="starts_with_hyphen"),
+            pytest.param("repo-", id="ends_with_hyphen"),
+            pytest.param("repo with spaces", id="spaces"),
+        ],
+    )
+    def test_validate_repository_slug_invalid(self, repo_slug):
         """Test invalid repository slugs."""
         with pytest.raises(ValidationError):
-            validate_repository_slug("")  # Empty
-
-        with pytest.raises(ValidationError):
-            validate_repository_slug("a" * 63)  # Too long
-
-        with pytest.raises(ValidationError):
-            validate_repository_slug(".repo")  # Starts with dot
-
-        with pytest.raises(ValidationError):
-            validate_repository_slug("repo.")  # Ends with dot
-
-        with pytest.raises(ValidationError):
-            validate_repository_slug("-repo")  # Starts with hyphen
+            validate_repository_slug(repo_slug)
 
-        with pytest.raises(ValidationError):
-            validate_repository_slug("repo-")  # Ends with hyphen
+    def test_validate_repository_slugs(self):
+        """Test batch validation of repository slugs."""
+        assert validate_repository_slugs(["My-Repo", "repo_2"]) == ["my-repo", "repo_2"]
+        assert validate_repository_slugs([]) == []
 
         with pytest.raises(ValidationError):
-            validate_repository_slug("repo with spaces")  # Contains spaces
+            validate_repository_slugs(["good-repo", "-bad-repo"])
 
-    def test_validate_workspace_slug_valid(self):
+    @pytest.mark.parametrize(
+        "workspace, expected",
+        [
+            pytest.param("myworkspace", "myworkspace", id="lowercase"),
+            pytest.param("MYWORKSPACE", "myworkspace", id="converted_to_lowercase"),
+            pytest.param("my-workspace", "my-workspace", id="hyphen"),
+            pytest.param("my_workspace", "my_workspace", id="underscore"),
+            pytest.param("my.workspace", "my.workspace", id="dot"),
+        ],
+    )
+    def test_validate_workspace_slug_valid(self, workspace, expected):
         """Test valid workspace slugs."""
-        assert validate_workspace_slug("myworkspace") == "myworkspace"
-        assert validate_workspace_slug("MYWORKSPACE") == "myworkspace"  # Should convert to lowercase
-        assert validate_workspace_slug("my-workspace") == "my-workspace"
-        assert validate_workspace_slug("my_workspace") == "my_workspace"
-        assert validate_workspace_slug("my.workspace") == "my.workspace"
-
-    def test_validate_workspace_uuid_valid(self):
+        assert validate_workspace_slug(workspace) == expected
+
+    @pytest.mark.parametrize(
+        "uuid",
+        [
+            pytest.param("123e4567-e89b-12d3-a456-426614174000", id="lowercase"),
+            pytest.param("123E4567-E89B-12D3-A456-426614174000", id="uppercase"),
+            pytest.param("{123e4567-e89b-12d3-a456-426614174000}", id="braces"),
+        ],
+    )
+    def test_validate_workspace_uuid_valid(self, uuid):
         """Test valid workspace UUIDs."""
-        uuid = "123e4567-e89b-12d3-a456-426614174000"
         assert validate_workspace_slug(uuid) == uuid.lower()
 
-        uuid_upper = "123E4567-E89B-12D3-A456-426614174000"
-        assert validate_workspace_slug(uuid_upper) == uuid_upper.lower()
-
-        uuid_braces = "{123e4567-e89b-12d3-a456-426614174000}"
-        assert validate_workspace_slug(uuid_braces) == uuid_braces.lower()
-
-    def test_validate_email_valid(self):
+    @pytest.mark.parametrize(
+        "email, expected",
+        [
+            pytest.param("user@example.com", "user@example.com", id="simple"),
+            pytest.param("USER@EXAMPLE.COM", "user@example.com", id="converted_to_lowercase"),
+            pytest.param("user.name@example.com", "user.name@example.com", id="dot_in_user"),
+            pytest.param("user+tag@example.com", "user+tag@example.com", id="plus_tag"),
+            pytest.param("user123@example-domain.co.uk", "user123@example-domain.co.uk", id="multi_part_domain"),
+        ],
+    )
+    def test_validate_email_valid(self, email, expected):
         """Test valid email addresses."""
-        assert validate_email("user@example.com") == "user@example.com"
-        assert validate_email("USER@EXAMPLE.COM") == "user@example.com"  # Should convert to lowercase
-        assert validate_email("user.name@example.com") == "user.name@example.com"
-        assert validate_email("user+tag@example.com") == "user+tag@example.com"
-        assert validate_email("user123@example-domain.co.uk") == "user123@example-domain.co.uk"
-
-    def test_validate_email_invalid(self):
+        assert validate_email(email) == expected
+
+    @pytest.mark.parametrize(
+        "email",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("user", id="no_at_symbol"),
+            pytest.param("user@", id="no_domain"),
+            pytest.param("@example.com", id="no_user"),
+            pytest.param("user@example", id="no_tld"),
+            pytest.param("user space@example.com", id="space_in_user"),
+        ],
+    )
+    def test_validate_email_invalid(self, email):
         """Test invalid email addresses."""
         with pytest.raises(ValidationError):
-            validate_email("")  # Empty
-
-        with pytest.raises(ValidationError):
-            validate_email("user")  # No @ symbol
-
-        with pytest.raises(ValidationError):
-            validate_email("user@")  # No domain
-
-        with pytest.raises(ValidationError):
-            validate_email("@example.com")  # No user
-
-        with pytest.raises(ValidationError):
-            validate_email("user@example")  # No TLD
-
-        with pytest.raises(ValidationError):
-            validate_email("user space@example.com")  # Space in user part
+            validate_email(email)
 
     def test_validate_user_identifier_email(self):
         """Test user identifier validation with email."""
         assert validate_user_identifier("user@example.com") == "user@example.com"
 
-    def test_validate_user_identifier_uuid(self):
+    @pytest.mark.parametrize(
+        "uuid",
+        [
+            pytest.param("123e4567-e89b-12d3-a456-426614174000", id="bare"),
+            pytest.param("{123e4567-e89b-12d3-a456-426614174000}", id="braces"),
+        ],
+    )
+    def test_validate_user_identifier_uuid(self, uuid):
         """Test user identifier validation with UUID."""
-        uuid = "123e4567-e89b-12d3-a456-426614174000"
         assert validate_user_identifier(uuid) == uuid.lower()
 
-        uuid_braces = "{123e4567-e89b-12d3-a456-426614174000}"
-        assert validate_user_identifier(uuid_braces) == uuid_braces.lower()
-
-    def test_validate_permission_level_valid(self):
+    def test_validate_user_identifiers(self):
+        """Test batch validation of user identifiers."""
+        uuid = "{123E4567-E89B-12D3-A456-426614174000}"
+        assert validate_user_identifiers(["User@Example.com", uuid]) == ["user@example.com", uuid.lower()]
+        assert validate_user_identifiers([]) == []
+
+        with pytest.raises(ValidationError):
+            validate_user_identifiers(["user@example.com", "not-an-email"])
+
+    @pytest.mark.parametrize(
+        "permission, expected",
+        [
+            pytest.param("read", "read", id="read"),
+            pytest.param("READ", "read", id="converted_to_lowercase"),
+            pytest.param("write", "write", id="write"),
+            pytest.param("admin", "admin", id="admin"),
+        ],
+    )
+    def test_validate_permission_level_valid(self, permission, expected):
         """Test valid permission levels."""
-        assert validate_permission_level("read") == "read"
-        assert validate_permission_level("READ") == "read"  # Should convert to lowercase
-        assert validate_permission_level("write") == "write"
-        assert validate_permission_level("admin") == "admin"
-
-    def test_validate_permission_level_invalid(self):
+        assert validate_permission_level(permission) == expected
+
+    @pytest.mark.parametrize(
+        "permission",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("invalid", id="unknown"),
+            pytest.param("owner", id="not_allowed"),
+        ],
+    )
+    def test_validate_permission_level_invalid(self, permission):
         """Test invalid permission levels."""
         with pytest.raises(ValidationError):
-            validate_permission_level("")  # Empty
-
-        with pytest.raises(ValidationError):
-            validate_permission_level("invalid")  # Not in allowed list
-
-        with pytest.raises(ValidationError):
-            validate_permission_level("owner")  # Not in allowed list
-
-    def test_validate_branch_name_valid(self):
+            validate_permission_level(permission)
+
+    @pytest.mark.parametrize(
+        "branch_name",
+        [
+            pytest.param("main", id="simple"),
+            pytest.param("feature/new-feature", id="slash"),
+            pytest.param("hotfix-123", id="hyphen"),
+            pytest.param("release/v1.0.0", id="dots_after_slash"),
+        ],
+    )
+    def test_validate_branch_name_valid(self, branch_name):
         """Test valid branch names."""
-        assert validate_branch_name("main") == "main"
-        assert validate_branch_name("feature/new-feature") == "feature/new-feature"
-        assert validate_branch_name("hotfix-123") == "hotfix-123"
-        assert validate_branch_name("release/v1.0.0") == "release/v1.0.0"
-
-    def test_validate_branch_name_invalid(self):
+        assert validate_branch_name(branch_name) == branch_name
+
+    @pytest.mark.parametrize(
+        "branch_name",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("feature..fix", id="double_dot"),
+            pytest.param("feature@{fix}", id="at_brace"),
+            pytest.param("feature\\fix", id="backslash"),
+            pytest.param("feature fix", id="space"),
+            pytest.param("feature~fix", id="tilde"),
+            pytest.param("feature^fix", id="caret"),
+            pytest.param("feature:fix", id="colon"),
+            pytest.param("feature?fix", id="question_mark"),
+            pytest.param("feature*fix", id="asterisk"),
+            pytest.param("feature[fix]", id="bracket"),
+            pytest.param("feature.lock", id="lock_suffix"),
+            pytest.param(".feature", id="leading_dot"),
+            pytest.param("feature/", id="trailing_slash"),
+            pytest.param("feature/.fix", id="slash_dot"),
+        ],
+    )
+    def test_validate_branch_name_invalid(self, branch_name):
         """Test invalid branch names."""
         with pytest.raises(ValidationError):
-            validate_branch_name("")  # Empty
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature..fix")  # Contains ..
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature@{fix}")  # Contains @{
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature\\fix")  # Contains backslash
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature fix")  # Contains space
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature~fix")  # Contains ~
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature^fix")  # Contains ^
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature:fix")  # Contains :
+            validate_branch_name(branch_name)
 
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature?fix")  # Contains ?
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature*fix")  # Contains *
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature[fix]")  # Contains [
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature.lock")  # Ends with .lock
-
-        with pytest.raises(ValidationError):
-            validate_branch_name(".feature")  # Starts with .
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature/")  # Ends with /
-
-        with pytest.raises(ValidationError):
-            validate_branch_name("feature/.fix")  # Contains /.
-
-    def test_validate_non_empty_string_valid(self):
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param("test", "test", id="plain"),
+            pytest.param("  test  ", "test", id="stripped"),
+        ],
+    )
+    def test_validate_non_empty_string_valid(self, value, expected):
         """Test valid non-empty strings."""
-        assert validate_non_empty_string("test", "field") == "test"
-        assert validate_non_empty_string("  test  ", "field") == "test"  # Should strip whitespace
-
-    def test_validate_non_empty_string_invalid(self):
+        assert validate_non_empty_string(value, "field") == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("   ", id="whitespace_only"),
+        ],
+    )
+    def test_validate_non_empty_string_invalid(self, value):
         """Test invalid non-empty strings."""
         with pytest.raises(ValidationError):
-            validate_non_empty_string("", "field")  # Empty
+            validate_non_empty_string(value, "field")
 
-        with pytest.raises(ValidationError):
-            validate_non_empty_string("   ", "field")  # Only whitespace
+    def test_validators_cache_successes_but_not_failures(self):
+        """Test that repeated valid inputs are served from the cache and invalid ones keep raising."""
+        validate_project_key.cache_clear()
+
+        assert validate_project_key("proj") == "PROJ"
+        assert validate_project_key("proj") == "PROJ"
+        assert validate_project_key.cache_info().hits == 1
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_project_key("PROJ-1")
+        assert validate_project_key.cache_info().currsize == 1